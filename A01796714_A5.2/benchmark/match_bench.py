@@ -0,0 +1,91 @@
+"""
+Benchmark del índice de trigramas de FuzzyCatalogue.
+
+Genera un catálogo sintético de nombres de varias palabras y consultas
+con una letra cambiada, y mide la construcción del índice, el tiempo por
+búsqueda sin caché y el de una comparación lineal contra todo el
+catálogo, verificando que ambas encuentren el mismo producto.
+
+Uso:
+    python benchmark/match_bench.py [--products N] [--queries N]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BASE_DIR)
+
+# pylint: disable=wrong-import-position
+from fuzzy_catalogue import FuzzyCatalogue, normalize_name, trigrams
+
+
+def synthetic_catalogue(products, seed=1):
+    """Retorna un catálogo {nombre: precio} con nombres aleatorios."""
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+             for _ in range(5000)]
+    catalogue = {}
+    while len(catalogue) < products:
+        name = ' '.join(rng.sample(words, rng.randint(2, 4))).capitalize()
+        catalogue[name] = round(rng.uniform(1, 100), 2)
+    return catalogue
+
+
+def typo(name, rng):
+    """Cambia una letra de name."""
+    position = rng.randrange(len(name))
+    return name[:position] + rng.choice(string.ascii_lowercase) + \
+        name[position + 1:]
+
+
+def linear_lookup(names, grams, name):
+    """Busca el nombre más parecido comparando contra todo el catálogo."""
+    query = trigrams(normalize_name(name))
+    scores = [2 * len(query & grams[code]) / (len(query) + len(grams[code]))
+              for code in range(len(names))]
+    best = max(range(len(names)), key=lambda code: (scores[code], -code))
+    return names[best]
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--products', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    prices = synthetic_catalogue(args.products)
+    names = list(prices)
+    queries = [typo(name, rng) for name in rng.sample(names, args.queries)]
+
+    start = time.perf_counter()
+    catalogue = FuzzyCatalogue(prices)
+    print(f"Productos: {len(names)}   índice: "
+          f"{time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    found = [catalogue.resolve(query)[0] for query in queries]
+    elapsed = time.perf_counter() - start
+    resolved = sum(match is not None for match in found)
+    print(f"índice   {elapsed * 1e6 / len(queries):10.1f} µs/búsqueda   "
+          f"resueltas {resolved}/{len(queries)}")
+
+    grams = [trigrams(normalize_name(name)) for name in names]
+    sample = queries[:max(1, len(queries) // 100)]
+    start = time.perf_counter()
+    linear = [linear_lookup(names, grams, query) for query in sample]
+    elapsed = time.perf_counter() - start
+    same = all(match is None or match == expected
+               for match, expected in zip(found, linear))
+    print(f"lineal   {elapsed * 1e6 / len(sample):10.1f} µs/búsqueda   "
+          f"mismo producto: {'sí' if same else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
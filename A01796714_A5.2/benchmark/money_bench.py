@@ -0,0 +1,84 @@
+"""
+Benchmark de la aritmética de dinero: float, Decimal y punto fijo.
+
+Genera ventas sintéticas en memoria (sin incluir la lectura del JSON) y
+mide el ciclo escalar con float (compute_sales_function), un ciclo
+equivalente con decimal.Decimal y el motor de centavos enteros
+(compute_sales_fixed), con y sin líneas de detalle. Para cada uno
+muestra el mejor tiempo de --repeat corridas y la diferencia de su
+total contra el total exacto.
+
+Uso:
+    python benchmark/money_bench.py [--rows N]
+        [--catalogue TCList/TC1.ProductList.json] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BASE_DIR)
+
+# pylint: disable=wrong-import-position
+from numpy_bench import synthetic_sales
+from compute_sales import (build_price_catalogue, compute_sales_fixed,
+                           compute_sales_function, iter_json_array)
+
+
+def compute_sales_decimal(catalogue, sales_data, lines=True):
+    """Ciclo de compute_sales_function con precios y total en Decimal."""
+    prices = {name: Decimal(repr(price)) for name, price in catalogue.items()}
+    total = Decimal(0)
+    results = []
+    for sale in sales_data:
+        product = sale.get('Product')
+        quantity = sale.get('Quantity')
+        if product is None or quantity is None or product not in prices:
+            continue
+        quantity = int(quantity)
+        subtotal = prices[product] * quantity
+        total += subtotal
+        if lines:
+            results.append((product, quantity, prices[product], subtotal))
+    return total, results
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--catalogue', default=os.path.join(
+        BASE_DIR, 'TCList', 'TC1.ProductList.json'))
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="repeticiones; se toma el mejor tiempo")
+    args = parser.parse_args()
+
+    catalogue = build_price_catalogue(iter_json_array(args.catalogue))
+    sales = synthetic_sales(catalogue, args.rows)
+    engines = (('float', compute_sales_function),
+               ('decimal', compute_sales_decimal),
+               ('fixed', compute_sales_fixed))
+    for lines in (True, False):
+        print("Con líneas de detalle:" if lines else "Sólo el total:")
+        timings = {}
+        exact = None
+        for name, engine in engines:
+            timings[name] = float('inf')
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                total = engine(catalogue, sales, lines=lines)[0]
+                timings[name] = min(timings[name],
+                                    time.perf_counter() - start)
+            if exact is None:
+                exact = compute_sales_decimal(catalogue, sales, False)[0]
+            error = Decimal(total) - exact
+            print(f"  {name:<8} {timings[name]:8.3f} s   "
+                  f"{timings['float'] / timings[name]:5.2f}x   "
+                  f"total={total}   error={error:.3E}")
+
+
+if __name__ == '__main__':
+    main()
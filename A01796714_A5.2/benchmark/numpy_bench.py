@@ -0,0 +1,68 @@
+"""
+Benchmark del motor NumPy contra el ciclo escalar de compute_sales.
+
+Genera ventas sintéticas en memoria (sin incluir la lectura del JSON),
+mide compute_sales_function y compute_sales_numpy sin líneas de detalle
+(--aggregate-only), sólo el total y con totales por producto, y
+verifica que los resultados sean idénticos.
+
+Uso:
+    python benchmark/numpy_bench.py [--rows N]
+        [--catalogue TCList/TC1.ProductList.json]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BASE_DIR)
+
+# pylint: disable=wrong-import-position
+from compute_sales import (build_price_catalogue, compute_sales_function,
+                           compute_sales_numpy, iter_json_array, np)
+
+
+def synthetic_sales(catalogue, rows, seed=1):
+    """Retorna una lista de rows ventas con productos del catálogo."""
+    rng = random.Random(seed)
+    products = sorted(catalogue)
+    return [{"SALE_ID": i // 3 + 1, "SALE_Date": "01/12/23",
+             "Product": rng.choice(products), "Quantity": rng.randint(1, 5)}
+            for i in range(rows)]
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--catalogue', default=os.path.join(
+        BASE_DIR, 'TCList', 'TC1.ProductList.json'))
+    args = parser.parse_args()
+    if np is None:
+        print("NumPy no está instalado.")
+        sys.exit(1)
+
+    catalogue = build_price_catalogue(iter_json_array(args.catalogue))
+    sales = synthetic_sales(catalogue, args.rows)
+    for fields in ((), ('Product',)):
+        print("Totales por producto:" if fields else "Sólo el total:")
+        timings = {}
+        outputs = {}
+        for name, engine in (('python', compute_sales_function),
+                             ('numpy', compute_sales_numpy)):
+            groups = {field: {} for field in fields}
+            start = time.perf_counter()
+            outputs[name] = engine(catalogue, sales, False, groups), groups
+            timings[name] = time.perf_counter() - start
+            print(f"  {name:<7} {timings[name]:8.3f} s   "
+                  f"total={outputs[name][0][0]:.2f}")
+        same = outputs['python'] == outputs['numpy']
+        print(f"  Aceleración: {timings['python'] / timings['numpy']:.2f}x"
+              f"   resultados idénticos: {'sí' if same else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
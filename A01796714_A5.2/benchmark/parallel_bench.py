@@ -0,0 +1,75 @@
+"""
+Benchmark de escalamiento del cálculo de ventas con varios procesos.
+
+Genera un archivo de ventas sintético con productos del catálogo y mide
+compute_sales_parallel con distinto número de procesos, verificando que
+el total coincida con el de un solo proceso.
+
+Uso:
+    python benchmark/parallel_bench.py [--rows N] [--workers 1,2,4,8]
+        [--catalogue TCList/TC1.ProductList.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BASE_DIR)
+
+# pylint: disable=wrong-import-position
+from compute_sales import (build_price_catalogue, compute_sales_parallel,
+                           iter_json_array)
+
+
+def write_sales(path, catalogue, rows, seed=1):
+    """Escribe un arreglo JSON de rows ventas con sangría de 2."""
+    rng = random.Random(seed)
+    products = sorted(catalogue)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('[\n')
+        for i in range(rows):
+            sale = {"SALE_ID": i // 3 + 1, "SALE_Date": "01/12/23",
+                    "Product": rng.choice(products),
+                    "Quantity": rng.randint(1, 5)}
+            separator = ',\n' if i < rows - 1 else '\n'
+            file.write(json.dumps(sale, indent=2) + separator)
+        file.write(']\n')
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--workers', default='1,2,4,8')
+    parser.add_argument('--catalogue', default=os.path.join(
+        BASE_DIR, 'TCList', 'TC1.ProductList.json'))
+    args = parser.parse_args()
+
+    catalogue = build_price_catalogue(iter_json_array(args.catalogue))
+    with tempfile.TemporaryDirectory() as folder:
+        sales_file = os.path.join(folder, 'sales.json')
+        write_sales(sales_file, catalogue, args.rows)
+        size = os.path.getsize(sales_file) / 2 ** 20
+        print(f"Ventas: {args.rows} ({size:.1f} MiB)")
+        baseline = None
+        for workers in (int(w) for w in args.workers.split(',')):
+            start = time.perf_counter()
+            total, results = compute_sales_parallel(catalogue, sales_file,
+                                                    workers)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = (elapsed, total)
+            status = "ok" if round(total, 2) == round(baseline[1], 2) \
+                else "DIFERENTE"
+            print(f"procesos={workers:<3} {elapsed:8.3f} s   "
+                  f"aceleración {baseline[0] / elapsed:5.2f}x   "
+                  f"líneas={len(results)} total={total:.2f} {status}")
+
+
+if __name__ == '__main__':
+    main()
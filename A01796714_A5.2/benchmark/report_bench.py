@@ -0,0 +1,83 @@
+"""
+Benchmark del reporte armado en memoria contra ReportWriter.
+
+Genera ventas sintéticas en memoria y mide, con tracemalloc, el tiempo y
+el pico de memoria de escribir el reporte de dos formas: calcular las
+líneas, armar el texto con format_output y escribirlo, o escribir cada
+línea con ReportWriter conforme se calcula (en texto, CSV y JSON Lines).
+No se incluye la salida a consola.
+
+Uso:
+    python benchmark/report_bench.py [--rows N]
+        [--catalogue TCList/TC1.ProductList.json]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BASE_DIR)
+
+# pylint: disable=wrong-import-position
+from numpy_bench import synthetic_sales
+from compute_sales import (build_price_catalogue, compute_sales_function,
+                           iter_json_array)
+from sales_report import REPORT_FORMATS, ReportWriter, format_output
+
+
+def in_memory(catalogue, sales, path):
+    """Calcula las líneas, arma el reporte completo y lo escribe."""
+    total, results = compute_sales_function(catalogue, sales)
+    output = format_output(total, 0.0, results)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(output)
+
+
+def streaming(catalogue, sales, path, fmt):
+    """Escribe las líneas con ReportWriter conforme se calculan."""
+    writer = ReportWriter(path, fmt)
+    total, _ = compute_sales_function(catalogue, sales, results=writer)
+    writer.close(total, 0.0)
+
+
+def measure(function, *args):
+    """Retorna el tiempo en segundos y el pico de memoria en MiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--catalogue', default=os.path.join(
+        BASE_DIR, 'TCList', 'TC1.ProductList.json'))
+    args = parser.parse_args()
+
+    catalogue = build_price_catalogue(iter_json_array(args.catalogue))
+    sales = synthetic_sales(catalogue, args.rows)
+    print(f"Ventas: {args.rows}")
+    with tempfile.TemporaryDirectory() as folder:
+        cases = [('memoria', in_memory, 'text')] + [
+            (f'writer-{fmt}', streaming, fmt) for fmt in REPORT_FORMATS]
+        for name, function, fmt in cases:
+            path = os.path.join(folder, name + REPORT_FORMATS[fmt])
+            extra = () if function is in_memory else (fmt,)
+            elapsed, peak = measure(function, catalogue, sales, path,
+                                    *extra)
+            size = os.path.getsize(path) / 2 ** 20
+            print(f"{name:<14} {elapsed:8.3f} s   pico {peak:8.1f} MiB   "
+                  f"archivo {size:7.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
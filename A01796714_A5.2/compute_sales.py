@@ -5,20 +5,217 @@ JSON de de ventas.
 
 Uso:
     python compute_sales.py <catalogue_file.json> <sales_file.json>
+                            [--workers N] [--engine python|numpy|fixed]
+                            [--group-by product,date,sale]
+                            [--aggregate-only] [--format text|csv|jsonl]
+                            [--console full|summary|quiet]
+                            [--fuzzy] [--fuzzy-threshold 0.6]
+                            [--match-cache archivo.json]
+                            [--incremental] [--checkpoint archivo.json]
+    python compute_sales.py <catalogue_file.json> <ventas o directorios>...
+                            [--workers N] [--output-dir Resultados]
+
+Con varios archivos de ventas o un directorio se ejecuta en modo lote:
+el catálogo se construye una vez, los archivos se procesan en paralelo
+y se escribe un <nombre>-SalesResults.txt por archivo (con el
+directorio antepuesto si dos archivos se llaman igual) más un
+SalesSummary.txt con el resumen combinado; un archivo que no se puede
+leer se reporta en el resumen sin detener el lote.
+
+--group-by agrega al reporte los totales por producto, fecha o ID de
+venta, calculados en la misma pasada; con --aggregate-only el reporte
+sólo contiene los totales, sin una línea por venta. --engine numpy
+calcula esos totales con arreglos de NumPy y sólo se admite con
+--aggregate-only.
+
+El reporte se escribe al archivo conforme se calcula, en texto, CSV o
+JSON Lines (--format); --console summary muestra sólo el total y
+--console quiet no muestra el reporte.
+
+Con --fuzzy los productos que no están en el catálogo se resuelven al
+nombre más parecido (ver fuzzy_catalogue); las resoluciones se guardan
+entre ejecuciones en --match-cache y cada coincidencia usada se lista
+en SalesMatches.txt.
+
+Con --incremental se guarda un punto de control (posición en bytes del
+final del arreglo y totales acumulados) y las ejecuciones siguientes
+sólo procesan las ventas agregadas al final del archivo; el reporte
+lista esas ventas y el total acumulado. Se invalida si cambia el
+catálogo.
 """
 
 
+import argparse
 import json
+import multiprocessing
+import os
+import re
 import sys
 import time
+from collections import Counter
+from collections.abc import Hashable
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import islice, repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional; sólo lo usa el motor 'numpy'.
+    np = None
+
+from fuzzy_catalogue import FUZZY_THRESHOLD, FuzzyCatalogue
+from sales_checkpoint import (array_end, file_hash, load_checkpoint,
+                              save_checkpoint)
+from sales_report import (GROUP_FIELDS, REPORT_FORMATS, ReportWriter,
+                          format_matches, format_summary, print_report)
+
+
+CHUNK_SIZE = 1 << 16
+SEGMENT_BYTES = 8 << 20
+BOUNDARY_WINDOW = 1 << 16
+CHUNK_ROWS = 1 << 16
+CENTS = 100
+BOUNDARY = re.compile(rb',[ \t\n\r]*\{')
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DECODER = json.JSONDecoder()
+RESULTS_DIR = './Resultados'
+MATCH_CACHE = 'catalogue-matches.json'
+CHECKPOINT_FILE = 'SalesCheckpoint.json'
+
+
+def iter_json_array(filename, chunk_size=CHUNK_SIZE):
+    """
+    Abre un archivo con un arreglo JSON y retorna un iterador que produce
+    sus elementos uno por uno, leyendo el archivo por bloques.
+    La memoria usada depende del tamaño de cada elemento y no del
+    tamaño del archivo.
+    """
+    # pylint: disable=consider-using-with
+    file = open(filename, 'r', encoding='utf-8')
+    return _iter_array(file, chunk_size)
+
+
+def _iter_array(file, chunk_size):
+    """
+    Generador que interpreta el arreglo JSON de file de forma incremental.
+    """
+    with file:
+        buffer = ''
+        pos = 0
+        eof = False
+        state = 'start'
+
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if eof:
+                    raise json.JSONDecodeError(
+                        "Arreglo JSON incompleto", buffer, pos)
+                buffer = file.read(chunk_size)
+                pos = 0
+                eof = not buffer
+                continue
+
+            char = buffer[pos]
+            if state == 'start':
+                if char != '[':
+                    raise json.JSONDecodeError(
+                        "Se esperaba un arreglo JSON", buffer, pos)
+                state = 'first'
+                pos += 1
+                continue
+            if char == ']' and state in ('first', 'separator'):
+                _expect_end(file, buffer[pos + 1:], chunk_size)
+                return
+            if state == 'separator':
+                if char != ',':
+                    raise json.JSONDecodeError(
+                        "Se esperaba ',' o ']'", buffer, pos)
+                state = 'item'
+                pos += 1
+                continue
+
+            try:
+                item, end = DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            if end is None or (end == len(buffer) and not eof):
+                chunk = file.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield item
+            pos = end
+            state = 'separator'
 
 
-def load_file_json(filename):
+def _expect_end(file, text, chunk_size):
+    """
+    Lanza JSONDecodeError si después del ']' final (text y el resto de
+    file) hay algo más que espacios.
+    """
+    while True:
+        pos = WHITESPACE.match(text).end()
+        if pos < len(text):
+            raise json.JSONDecodeError(
+                "Datos extra después del arreglo", text, pos)
+        text = file.read(chunk_size)
+        if not text:
+            return
+
+
+def iter_segment(text, first=False):
+    """
+    Produce los elementos de un fragmento de arreglo JSON que empieza en
+    el inicio de un elemento (o en '[' si es el primero) y termina en la
+    coma que lo separa del siguiente fragmento (o en ']' si es el último).
+    """
+    pos = WHITESPACE.match(text).end()
+    if first:
+        if not text.startswith('[', pos):
+            raise json.JSONDecodeError("Se esperaba un arreglo JSON",
+                                       text, pos)
+        pos += 1
+    while True:
+        pos = WHITESPACE.match(text, pos).end()
+        if pos == len(text):
+            return
+        if text[pos] == ']':
+            end = WHITESPACE.match(text, pos + 1).end()
+            if end != len(text):
+                raise json.JSONDecodeError(
+                    "Datos extra después del arreglo", text, end)
+            return
+        item, pos = DECODER.raw_decode(text, pos)
+        yield item
+        pos = WHITESPACE.match(text, pos).end()
+        if pos < len(text) and text[pos] == ',':
+            pos += 1
+        elif pos < len(text) and text[pos] != ']':
+            raise json.JSONDecodeError("Se esperaba ',' o ']'", text, pos)
+
+
+def split_json_array(filename, parts):
     """
-    Carga un JSON y retorna su contenido como un objeto de Python.
+    Divide un archivo con un arreglo JSON en hasta parts rangos de bytes
+    (inicio, fin) que empiezan en un elemento. fin es None en el último.
+
+    Cada corte se coloca en una llave '{' precedida por una coma. Si la
+    llave resulta estar dentro de un elemento, ese elemento queda
+    truncado en el rango anterior y su lectura lanza JSONDecodeError.
     """
-    with open(filename, 'r', encoding='utf-8') as file:
-        return json.load(file)
+    size = os.path.getsize(filename)
+    starts = [0]
+    with open(filename, 'rb') as file:
+        for part in range(1, parts):
+            target = max(size * part // parts, starts[-1] + 1)
+            file.seek(target)
+            match = BOUNDARY.search(file.read(BOUNDARY_WINDOW))
+            if match:
+                starts.append(target + match.end() - 1)
+    return list(zip(starts, starts[1:] + [None]))
 
 
 def build_price_catalogue(data):
@@ -38,14 +235,74 @@ def build_price_catalogue(data):
     return prices
 
 
-def compute_sales_function(catalogue, sales_data):
+def _export_matches(catalogue):
+    """
+    Retorna el estado de export_matches, o None si el catálogo no
+    resuelve nombres aproximados.
+    """
+    if isinstance(catalogue, FuzzyCatalogue):
+        return catalogue.export_matches()
+    return None
+
+
+def _merge_matches(catalogue, state):
+    """
+    Combina en el catálogo el estado de _export_matches de otro proceso.
+    """
+    if state is not None:
+        catalogue.merge_matches(state)
+
+
+def accumulate_groups(groups, sales, quantities, subtotals):
+    """
+    Suma líneas, cantidades y subtotales de las ventas a los
+    acumuladores {campo: {valor: [líneas, cantidad, subtotal]}}.
+    """
+    for field, table in groups.items():
+        for sale, quantity, subtotal in zip(sales, quantities, subtotals):
+            key = sale.get(field)
+            if not isinstance(key, Hashable):
+                key = repr(key)
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = [0, 0, 0]
+            entry[0] += 1
+            entry[1] += quantity
+            entry[2] += subtotal
+
+
+def merge_groups(groups, partial):
+    """
+    Combina en groups los acumuladores parciales de otro proceso.
+    """
+    for field, table in partial.items():
+        target = groups.setdefault(field, {})
+        for key, (lines, quantity, subtotal) in table.items():
+            entry = target.get(key)
+            if entry is None:
+                target[key] = [lines, quantity, subtotal]
+            else:
+                entry[0] += lines
+                entry[1] += quantity
+                entry[2] += subtotal
+
+
+def compute_sales_function(catalogue, sales_data, lines=True, groups=None,
+                           results=None):
     """
     Esta función calcula el costo total de ventas, partiendo de:
     Catálogo de precios.
-    JSON de ventas.
+    JSON de ventas (lista o iterador, p. ej. iter_json_array).
+    Con lines=False sólo se calcula el total y no se guardan las líneas.
+    groups: acumuladores por campo (ver accumulate_groups) que se
+    actualizan en la misma pasada.
+    results: destino de las líneas con append/extend (una lista nueva
+    por omisión, o un ReportWriter para escribirlas conforme se
+    calculan).
     """
     total = 0.0
-    results = []
+    if results is None:
+        results = []
 
     for sale in sales_data:
         try:
@@ -65,7 +322,10 @@ def compute_sales_function(catalogue, sales_data):
             price = catalogue[product]
             subtotal = price * quantity
             total += subtotal
-            results.append((product, quantity, price, subtotal))
+            if lines:
+                results.append((product, quantity, price, subtotal))
+            if groups:
+                accumulate_groups(groups, (sale,), (quantity,), (subtotal,))
 
         except (ValueError, TypeError) as e:
             print(f"Error al procesar: {sale} - {e}")
@@ -73,72 +333,662 @@ def compute_sales_function(catalogue, sales_data):
     return total, results
 
 
-def format_output(total, elapsed_time, results):
+def _numpy_quantities(values):
     """
-    Función para formatear la salida de los resultados, partiendo de:
-    Costo total de ventas.
-    Tiempo de ejecución.
-    Resultados detallados.
+    Convierte las cantidades de un bloque a un arreglo de enteros.
+    Retorna el arreglo, un diccionario {fila: error} con las filas que
+    int() no puede convertir (None se reporta como faltante) y otro
+    {fila: cantidad} con las que no caben en 64 bits.
     """
-    output = []
-    output.append("-" * 90)
-    output.append("COSTO TOTAL DE VENTAS")
-    output.append("-" * 90)
-    output.append(f"Tiempo: {elapsed_time:.4f} segundos")
-    output.append("=" * 90)
-    output.append("")
+    try:
+        quantities = np.array(values, dtype=np.int64)
+        if quantities.shape == (len(values),):
+            return quantities, {}, {}
+    except (TypeError, ValueError, OverflowError):
+        pass
+    quantities = np.zeros(len(values), dtype=np.int64)
+    errors = {}
+    large = {}
+    for row, value in enumerate(values):
+        if value is None:
+            errors[row] = None
+            continue
+        try:
+            quantity = int(value)
+        except (TypeError, ValueError) as e:
+            errors[row] = e
+            continue
+        try:
+            quantities[row] = quantity
+        except OverflowError:
+            large[row] = quantity
+    return quantities, errors, large
 
-    for product, qty, price, subtotal in results:
-        line = (f"{product:<30} {qty:>5}     x     "
-                f"${price:>10.2f}     =     ${subtotal:>12.2f}")
-        output.append(line)
 
-    output.append("")
-    output.append("=" * 90)
-    output.append(f"TOTAL: ${total:.2f}")
-    output.append("-" * 90)
-    output.append(f"Tiempo: {elapsed_time:.4f} segundos")
-    output.append("=" * 90)
-    output.append("-" * 90)
+def _numpy_codes(codes, products, errors):
+    """
+    Codifica los productos de un bloque cuando alguno no es hashable;
+    esos se marcan en errors con el TypeError que daría el ciclo
+    escalar, salvo que la fila ya tenga un error de cantidad.
+    """
+    code = np.full(len(products), -1, dtype=np.int64)
+    for row, product in enumerate(products):
+        if isinstance(product, Hashable):
+            code[row] = codes.get(product, -1)
+        elif row not in errors:
+            errors[row] = TypeError(
+                f"unhashable type: '{type(product).__name__}'")
+    return code
 
-    return '\n'.join(output)
+
+def _numpy_matches(catalogue, codes, products, code, errors):
+    """
+    Resuelve con el FuzzyCatalogue los productos de un bloque que no
+    están en el catálogo (code -1), salvo las filas con error.
+    """
+    for row in np.flatnonzero(code < 0).tolist():
+        if row not in errors:
+            match = catalogue.match(products[row])
+            if match is not None:
+                code[row] = codes[match]
+
+
+def compute_sales_numpy(catalogue, sales_data, lines=True, groups=None,
+                        results=None, chunk_rows=CHUNK_ROWS):
+    """
+    Versión columnar de compute_sales_function con NumPy, para calcular
+    sólo el total y los acumuladores por grupo (lines=False).
+
+    Procesa las ventas en bloques: los productos se codifican como
+    índices del catálogo, las cantidades y precios viven en arreglos y
+    los subtotales se calculan en conjunto. Las filas inválidas se
+    reportan a partir de máscaras, en el mismo orden y con los mismos
+    mensajes que la versión escalar. El total se acumula con cumsum, que
+    suma en el mismo orden que el ciclo escalar, por lo que el resultado
+    es idéntico. Con un FuzzyCatalogue los productos fuera del catálogo
+    se resuelven antes de calcular.
+
+    Con lines=True se delega en compute_sales_function: construir una
+    tupla de Python por línea cuesta más que lo que ahorran los arreglos.
+    """
+    # pylint: disable=too-many-locals, too-many-branches
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    if lines:
+        return compute_sales_function(catalogue, sales_data, lines, groups,
+                                      results)
+    names = list(catalogue)
+    codes = {name: code for code, name in enumerate(names)}
+    prices = np.array([catalogue[name] for name in names], dtype=np.float64)
+    total = 0.0
+    if results is None:
+        results = []
+    sales = iter(sales_data)
+    fuzzy = isinstance(catalogue, FuzzyCatalogue)
+
+    while True:
+        chunk = list(islice(sales, chunk_rows))
+        if not chunk:
+            break
+        products = [sale.get('Product') for sale in chunk]
+        quantities, errors, large = _numpy_quantities(
+            [sale.get('Quantity') for sale in chunk])
+        try:
+            code = np.fromiter(map(codes.get, products, repeat(-1)),
+                               dtype=np.int64, count=len(chunk))
+        except TypeError:
+            code = _numpy_codes(codes, products, errors)
+        if fuzzy:
+            _numpy_matches(catalogue, codes, products, code, errors)
+        valid = code >= 0
+        if errors:
+            valid[list(errors)] = False
+
+        for row in np.flatnonzero(~valid).tolist():
+            sale = chunk[row]
+            if products[row] is None or sale.get('Quantity') is None:
+                print(f"Error, valores faltantes. {sale}")
+            elif errors.get(row) is not None:
+                print(f"Error al procesar: {sale} - {errors[row]}")
+            else:
+                print("Producto no encontrado en el catálogo: "
+                      f"'{products[row]}' ")
+
+        code = code[valid]
+        line_prices = prices[code]
+        line_quantities = quantities[valid]
+        subtotals = line_prices * line_quantities
+        if groups:
+            line_quantities = line_quantities.tolist()
+        valid_rows = np.flatnonzero(valid)
+        for row, quantity in large.items():
+            if valid[row]:
+                position = int(np.searchsorted(valid_rows, row))
+                subtotals[position] = float(line_prices[position]) * quantity
+                if groups:
+                    line_quantities[position] = quantity
+        if subtotals.size:
+            total = float(np.cumsum(np.concatenate(([total], subtotals)))[-1])
+        if groups:
+            accumulate_groups(groups, [chunk[row] for row in valid_rows],
+                              line_quantities, subtotals.tolist())
+
+    return total, results
+
+
+def price_cents(price):
+    """
+    Convierte un precio a centavos enteros a partir de su representación
+    decimal (29.45 -> 2945). Los precios con más de dos decimales se
+    redondean al centavo, con las mitades hacia arriba.
+    Como en la versión de float, un bool vale 0 o 1; un precio que no
+    es número lanza TypeError y uno no finito ValueError.
+    """
+    if not isinstance(price, (int, float)):
+        raise TypeError(f"precio no numérico: {price!r}")
+    try:
+        cents = Decimal(repr(float(price))).scaleb(2)
+    except OverflowError as e:
+        raise ValueError(f"precio fuera de rango: {price!r}") from e
+    if not cents.is_finite():
+        raise ValueError(f"precio no finito: {price!r}")
+    return int(cents.to_integral_value(ROUND_HALF_UP))
+
+
+def _price_table(catalogue):
+    """
+    Retorna {producto: (precio, centavos)}; centavos es None si el
+    precio no se puede convertir (ver price_cents).
+    """
+    table = {}
+    for name, price in catalogue.items():
+        try:
+            table[name] = (price, price_cents(price))
+        except (TypeError, ValueError):
+            table[name] = (price, None)
+    return table
+
+
+def compute_sales_fixed(catalogue, sales_data, lines=True, groups=None,
+                        results=None):
+    """
+    Versión de punto fijo de compute_sales_function.
+
+    Los precios se convierten una vez a centavos enteros y los
+    subtotales, el total y los acumuladores por grupo se suman en
+    enteros, por lo que no se acumula error de redondeo. El total y los
+    subtotales por grupo se retornan como Decimal exactos; los precios y
+    subtotales de las líneas se dejan en float (el subtotal es el float
+    más cercano al valor exacto), que se formatean igual.
+    """
+    table = _price_table(catalogue)
+    total = 0
+    if results is None:
+        results = []
+    partial = {field: {} for field in groups or ()}
+
+    for sale in sales_data:
+        try:
+            product = sale.get('Product')
+            quantity = sale.get('Quantity')
+
+            if product is None or quantity is None:
+                print(f"Error, valores faltantes. {sale}")
+                continue
+
+            quantity = int(quantity)
+
+            try:
+                price, cents = table[product]
+            except KeyError:
+                if product not in catalogue:
+                    print("Producto no encontrado en el catálogo: "
+                          f"'{product}' ")
+                    continue
+                price = catalogue[product]
+                cents = price_cents(price)
+
+            if cents is None:
+                print(f"Error al procesar: {sale} - precio no válido: "
+                      f"{price!r}")
+                continue
+
+            subtotal = cents * quantity
+            total += subtotal
+            if lines:
+                results.append((product, quantity, price, subtotal / CENTS))
+            if partial:
+                accumulate_groups(partial, (sale,), (quantity,),
+                                  (subtotal,))
+
+        except (ValueError, TypeError) as e:
+            print(f"Error al procesar: {sale} - {e}")
+
+    merge_groups(groups, {
+        field: {key: [count, units, Decimal(cents).scaleb(-2)]
+                for key, (count, units, cents) in accumulators.items()}
+        for field, accumulators in partial.items()})
+    return Decimal(total).scaleb(-2), results
+
+
+ENGINES = {
+    'python': compute_sales_function,
+    'numpy': compute_sales_numpy,
+    'fixed': compute_sales_fixed,
+}
+
+_WORKER = {}
+
+
+def _init_worker(catalogue, engine):
+    """
+    Guarda el catálogo de precios y el motor en cada proceso del pool.
+    """
+    _WORKER['catalogue'] = catalogue
+    _WORKER['engine'] = ENGINES[engine]
+
+
+def _compute_range(job):
+    """
+    Calcula el total parcial, las líneas y los acumuladores de un rango
+    de bytes.
+    """
+    filename, start, end, lines, fields = job
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        data = file.read(-1 if end is None else end - start)
+    items = iter_segment(data.decode('utf-8'), first=start == 0)
+    groups = {field: {} for field in fields}
+    total, results = _WORKER['engine'](_WORKER['catalogue'], items, lines,
+                                       groups)
+    return total, results, groups, _export_matches(_WORKER['catalogue'])
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def compute_sales_parallel(catalogue, sales_file, workers, engine='python',
+                           lines=True, groups=None, results=None,
+                           segment_bytes=SEGMENT_BYTES):
+    """
+    Calcula el costo total de ventas repartiendo el archivo de ventas en
+    rangos que procesa un pool de workers procesos. Los resultados se
+    combinan en el orden original del archivo.
+
+    engine: nombre del motor en ENGINES.
+    lines, groups, results: como en compute_sales_function.
+
+    Si el archivo no se puede dividir en elementos completos (por
+    ejemplo, con objetos anidados), se calcula en un solo proceso.
+    """
+    # pylint: disable=too-many-locals
+    compute = ENGINES[engine]
+    if groups is None:
+        groups = {}
+    if workers <= 1:
+        return compute(catalogue, iter_json_array(sales_file), lines, groups,
+                       results)
+
+    parts = max(workers, os.path.getsize(sales_file) // segment_bytes)
+    jobs = [(sales_file, start, end, lines, list(groups))
+            for start, end in split_json_array(sales_file, parts)]
+    total = 0
+    if results is None:
+        results = []
+    partials = []
+    try:
+        with multiprocessing.Pool(workers, _init_worker,
+                                  (catalogue, engine)) as pool:
+            for part_total, part_results, *partial in pool.imap(
+                    _compute_range, jobs):
+                total += part_total
+                results.extend(part_results)
+                partials.append(partial)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        print("Aviso: no se pudo dividir el archivo de ventas; "
+              "se procesa en un solo proceso.")
+        results.clear()
+        return compute(catalogue, iter_json_array(sales_file), lines, groups,
+                       results)
+    for part_groups, matches in partials:
+        merge_groups(groups, part_groups)
+        _merge_matches(catalogue, matches)
+    return total, results
+
+
+def iter_appended(filename, start, end):
+    """
+    Produce los elementos agregados al arreglo JSON de filename después
+    de un punto de control: start y end son el final del contenido del
+    arreglo (ver array_end) en el punto de control y ahora.
+    """
+    with open(filename, 'rb') as file:
+        file.seek(start - 1)
+        first = file.read(1) == b'['
+        text = file.read(end - start).decode('utf-8')
+    pos = WHITESPACE.match(text).end()
+    if pos == len(text):
+        return
+    if not first:
+        if text[pos] != ',':
+            raise json.JSONDecodeError(
+                "Se esperaba ',' después del punto de control", text, pos)
+        pos += 1
+    yield from iter_segment(text[pos:])
+
+
+def compute_sales_incremental(catalogue, sales_file, checkpoint_path,
+                              catalogue_hash, engine='python', lines=True,
+                              groups=None, results=None, options=None):
+    """
+    Calcula el costo total de ventas a partir del punto de control de
+    checkpoint_path (ver sales_checkpoint). Si sigue siendo válido sólo
+    se procesan los elementos agregados al final del arreglo desde
+    entonces y se suman al total y a los grupos guardados; si no, se
+    procesa el archivo completo. Al terminar se guarda el nuevo punto de
+    control.
+
+    catalogue_hash: hash del archivo de catálogo; al cambiar invalida el
+    punto de control, igual que options (p. ej. el modo aproximado) o
+    los campos de groups.
+    Las líneas (results) son sólo las de las ventas procesadas en esta
+    ejecución; el total y groups son los acumulados.
+    """
+    compute = ENGINES[engine]
+    if groups is None:
+        groups = {}
+    options = dict(options or {}, fields=list(groups),
+                   exact=engine == 'fixed')
+    end = array_end(sales_file)
+    checkpoint = load_checkpoint(checkpoint_path, sales_file,
+                                 catalogue_hash, options)
+    if checkpoint is None:
+        print("Punto de control inexistente o inválido; se procesa el "
+              "archivo completo.")
+        total, results = compute(catalogue, iter_json_array(sales_file),
+                                 lines, groups, results)
+    else:
+        offset = checkpoint['offset']
+        print(f"Punto de control: se procesan {end - offset} bytes nuevos "
+              f"desde el byte {offset}.")
+        total, results = compute(catalogue,
+                                 iter_appended(sales_file, offset, end),
+                                 lines, groups, results)
+        saved = checkpoint['groups']
+        merge_groups(saved, groups)
+        groups.update(saved)
+        total += checkpoint['total']
+    save_checkpoint(checkpoint_path, sales_file, catalogue_hash, options,
+                    end, total, groups)
+    return total, results
+
+
+def collect_sales_files(paths, exclude=()):
+    """
+    Expande los directorios de paths a sus archivos .json, en orden, y
+    omite los archivos de exclude (p. ej. el catálogo).
+    """
+    excluded = {os.path.abspath(path) for path in exclude}
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.lower().endswith('.json'))
+        else:
+            candidates = [path]
+        files.extend(candidate for candidate in candidates
+                     if os.path.abspath(candidate) not in excluded)
+    return files
+
+
+def report_name(sales_file):
+    """
+    Retorna el nombre base del reporte de un archivo de ventas, p. ej.
+    TC1.Sales.json -> TC1.
+    """
+    name = os.path.basename(sales_file)
+    for suffix in ('.json', '.Sales'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return name
+
+
+def report_paths(output_dir, sales_files, extension='.txt'):
+    """
+    Retorna la ruta del reporte de cada archivo de ventas, p. ej.
+    TC1.Sales.json -> <output_dir>/TC1-SalesResults.txt. Si varios
+    archivos darían el mismo nombre (d1/Sales.json y d2/Sales.json) se
+    les antepone su directorio (d1-Sales), y un número si aún se repite.
+    """
+    names = [report_name(sales_file) for sales_file in sales_files]
+    repeated = Counter(name.lower() for name in names)
+    paths = []
+    used = set()
+    for sales_file, name in zip(sales_files, names):
+        if repeated[name.lower()] > 1:
+            parent = os.path.basename(
+                os.path.dirname(os.path.abspath(sales_file)))
+            name = f"{parent}-{name}" if parent else name
+        unique = name
+        number = 2
+        while unique.lower() in used:
+            unique = f"{name}-{number}"
+            number += 1
+        used.add(unique.lower())
+        paths.append(os.path.join(output_dir,
+                                  f"{unique}-SalesResults{extension}"))
+    return paths
+
+
+def _process_file(job):
+    """
+    Calcula y escribe el reporte de un archivo de ventas del lote.
+    Retorna la entrada (archivo, total, líneas, tiempo, error) y las
+    coincidencias aproximadas (ver _export_matches). Un archivo que no
+    se puede leer o interpretar se reporta sin detener el lote.
+    """
+    sales_file, path, lines, fields, fmt = job
+    start_time = time.time()
+    groups = {field: {} for field in fields}
+    writer = ReportWriter(path, fmt)
+    try:
+        total, _ = _WORKER['engine'](_WORKER['catalogue'],
+                                     iter_json_array(sales_file),
+                                     lines, groups, writer)
+    except (OSError, ValueError, AttributeError) as e:
+        writer.discard()
+        entry = (sales_file, 0.0, 0, time.time() - start_time, str(e))
+        return entry, _export_matches(_WORKER['catalogue'])
+    elapsed_time = time.time() - start_time
+    writer.close(total, elapsed_time, groups)
+    count = len(writer) if lines else None
+    entry = (sales_file, total, count, elapsed_time, None)
+    return entry, _export_matches(_WORKER['catalogue'])
+
+
+def compute_sales_batch(catalogue, sales_files, output_dir, workers=1,
+                        engine='python', lines=True, fields=(), fmt='text'):
+    """
+    Procesa varios archivos de ventas con el mismo catálogo, hasta
+    workers a la vez, y escribe un reporte por archivo en output_dir.
+    lines, fields (campos a agrupar) y fmt (formato del reporte, ver
+    ReportWriter) se aplican a cada archivo.
+    Retorna una entrada (archivo, total, líneas, tiempo, error) por
+    archivo, en el orden recibido.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = report_paths(output_dir, sales_files, REPORT_FORMATS[fmt])
+    jobs = [(sales_file, path, lines, list(fields), fmt)
+            for sales_file, path in zip(sales_files, paths)]
+    if workers <= 1 or len(jobs) <= 1:
+        _init_worker(catalogue, engine)
+        outcomes = [_process_file(job) for job in jobs]
+    else:
+        with multiprocessing.Pool(min(workers, len(jobs)), _init_worker,
+                                  (catalogue, engine)) as pool:
+            outcomes = pool.map(_process_file, jobs)
+    for _, matches in outcomes:
+        _merge_matches(catalogue, matches)
+    return [entry for entry, _ in outcomes]
+
+
+def save_matches(catalogue, output_dir, cache_path, console='full'):
+    """
+    Guarda las resoluciones del catálogo aproximado en cache_path y el
+    registro de coincidencias en <output_dir>/SalesMatches.txt, y lo
+    muestra en consola según console (ver print_report).
+    """
+    catalogue.save_cache(cache_path)
+    path = os.path.join(output_dir, 'SalesMatches.txt')
+    output = format_matches(catalogue.audit)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(output)
+    if console == 'full':
+        print(output)
+    elif console == 'summary':
+        sales = sum(entry[2] for entry in catalogue.audit.values())
+        print(f"Coincidencias aproximadas: {len(catalogue.audit)} nombres, "
+              f"{sales} ventas ({path})")
+
+
+def build_parser():
+    """
+    Construye el analizador de argumentos de la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(
+        description="Calcula el costo total de ventas.")
+    parser.add_argument('catalogue_file')
+    parser.add_argument('sales_files', nargs='+',
+                        help="archivos de ventas o directorios")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="procesos para calcular las ventas")
+    parser.add_argument('--engine', choices=sorted(ENGINES),
+                        default='python',
+                        help="motor de cálculo; 'numpy' requiere NumPy "
+                             "y --aggregate-only")
+    parser.add_argument('--output-dir', default=RESULTS_DIR,
+                        help="directorio de los reportes")
+    parser.add_argument('--group-by', default='',
+                        help="campos separados por coma: "
+                             f"{', '.join(GROUP_FIELDS)}")
+    parser.add_argument('--aggregate-only', action='store_true',
+                        help="omite las líneas de detalle del reporte")
+    parser.add_argument('--format', choices=sorted(REPORT_FORMATS),
+                        default='text', help="formato de los reportes")
+    parser.add_argument('--console', choices=('full', 'summary', 'quiet'),
+                        default='full',
+                        help="qué se muestra en consola: el reporte "
+                             "completo, sólo el total o nada")
+    parser.add_argument('--fuzzy', action='store_true',
+                        help="resuelve productos fuera del catálogo al "
+                             "nombre más parecido")
+    parser.add_argument('--fuzzy-threshold', type=float,
+                        default=FUZZY_THRESHOLD,
+                        help="puntaje mínimo (0 a 1) de una coincidencia")
+    parser.add_argument('--match-cache',
+                        help="archivo de resoluciones entre ejecuciones "
+                             f"(por omisión <output-dir>/{MATCH_CACHE})")
+    parser.add_argument('--incremental', action='store_true',
+                        help="procesa sólo las ventas agregadas desde el "
+                             "último punto de control")
+    parser.add_argument('--checkpoint',
+                        help="archivo del punto de control (por omisión "
+                             f"<output-dir>/{CHECKPOINT_FILE})")
+    return parser
+
+
+def run_batch(args, catalogue, lines, fields, start_time):
+    """
+    Ejecuta el modo lote con los argumentos de main y escribe el resumen
+    combinado en <output-dir>/SalesSummary.txt.
+    """
+    sales_files = collect_sales_files(args.sales_files,
+                                      [args.catalogue_file])
+    entries = compute_sales_batch(catalogue, sales_files, args.output_dir,
+                                  args.workers, args.engine, lines, fields,
+                                  args.format)
+    output = format_summary(entries, time.time() - start_time)
+    if args.console != 'quiet':
+        print(output)
+    with open(os.path.join(args.output_dir, 'SalesSummary.txt'), 'w',
+              encoding='utf-8') as file:
+        file.write(output)
 
 
 def main():
     """
     Función principal (main).
     """
-    if len(sys.argv) != 3:
-        sys.exit(1)
-
-    catalogue_file = sys.argv[1]
-    sales_file = sys.argv[2]
+    # pylint: disable=too-many-locals
+    parser = build_parser()
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.group_by.split(',') if name]
+    unknown = [name for name in names if name not in GROUP_FIELDS]
+    if unknown:
+        parser.error(f"--group-by desconocido: {', '.join(unknown)}")
+    fields = [GROUP_FIELDS[name][0] for name in names]
+    lines = not args.aggregate_only
+    if args.engine == 'numpy' and lines:
+        parser.error("--engine numpy sólo calcula totales; úselo con "
+                     "--aggregate-only")
+
+    if args.engine == 'numpy' and np is None:
+        print("NumPy no está instalado; se usa el motor 'python'.")
+        args.engine = 'python'
+
+    catalogue_file = args.catalogue_file
+    batch = len(args.sales_files) > 1 or os.path.isdir(args.sales_files[0])
+    if batch and args.incremental:
+        parser.error("--incremental requiere un solo archivo de ventas")
 
     start_time = time.time()
 
     try:
-        catalogue_data = load_file_json(catalogue_file)
+        catalogue = build_price_catalogue(iter_json_array(catalogue_file))
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Error al cargar el JSON de catálogo: {e}")
         sys.exit(1)
 
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache_path = args.match_cache or os.path.join(args.output_dir,
+                                                  MATCH_CACHE)
+    if args.fuzzy:
+        catalogue = FuzzyCatalogue(catalogue, args.fuzzy_threshold)
+        catalogue.load_cache(cache_path)
+
+    if batch:
+        run_batch(args, catalogue, lines, fields, start_time)
+        if args.fuzzy:
+            save_matches(catalogue, args.output_dir, cache_path,
+                         args.console)
+        return
+
+    groups = {field: {} for field in fields}
+    path = os.path.join(args.output_dir,
+                        'SalesResults' + REPORT_FORMATS[args.format])
+    writer = ReportWriter(path, args.format)
     try:
-        sales_data = load_file_json(sales_file)
+        if args.incremental:
+            total, _ = compute_sales_incremental(
+                catalogue, args.sales_files[0],
+                args.checkpoint or os.path.join(args.output_dir,
+                                                CHECKPOINT_FILE),
+                file_hash(catalogue_file), args.engine, lines, groups,
+                writer, {'fuzzy': args.fuzzy_threshold if args.fuzzy
+                         else None})
+        else:
+            total, _ = compute_sales_parallel(
+                catalogue, args.sales_files[0], args.workers, args.engine,
+                lines, groups, writer)
     except (FileNotFoundError, json.JSONDecodeError) as e:
+        writer.discard()
         print(f"Error al procesar el JSON de ventas: {e}")
         sys.exit(1)
 
-    catalogue = build_price_catalogue(catalogue_data)
-    total, results = compute_sales_function(catalogue, sales_data)
-
     elapsed_time = time.time() - start_time
-
-    output = format_output(total, elapsed_time, results)
-
-    print(output)
-
-    with open('./Resultados/SalesResults.txt', 'w', encoding='utf-8') as file:
-        file.write(output)
+    writer.close(total, elapsed_time, groups)
+    print_report(path, total, elapsed_time, args.console)
+    if args.fuzzy:
+        save_matches(catalogue, args.output_dir, cache_path, args.console)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,193 @@
+"""
+Índice de coincidencias aproximadas para el catálogo de precios.
+
+FuzzyCatalogue resuelve nombres de producto de las ventas que no están
+en el catálogo (p. ej. con otra capitalización, sin acentos o con una
+palabra de más o de menos) al producto más parecido, mediante un índice
+invertido de trigramas sobre los nombres normalizados.
+"""
+
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+
+
+NON_WORD = re.compile(r'[\W_]+')
+FUZZY_THRESHOLD = 0.6
+
+
+def normalize_name(name):
+    """
+    Normaliza un nombre de producto para compararlo: sin acentos, en
+    minúsculas y con un solo espacio entre palabras.
+    """
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return ' '.join(NON_WORD.sub(' ', name.casefold()).split())
+
+
+def trigrams(key):
+    """
+    Retorna el conjunto de trigramas de un nombre normalizado.
+    """
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyCatalogue(dict):
+    """
+    Catálogo de precios que resuelve nombres de producto parecidos.
+
+    Se construye una vez un índice invertido {trigrama: [productos]}
+    sobre los nombres normalizados; un nombre que no está en el
+    catálogo se resuelve al producto con mayor coeficiente de Dice
+    entre trigramas, si alcanza threshold. Las resoluciones (también
+    las fallidas) se guardan en cache, que puede persistirse entre
+    ejecuciones con load_cache/save_cache, y cada venta resuelta se
+    registra en audit {nombre: [producto, puntaje, ventas]}.
+
+    Para los motores es un diccionario más: ``nombre in catalogo`` y
+    ``catalogo[nombre]`` consideran las coincidencias aproximadas.
+    """
+
+    def __init__(self, prices, threshold=FUZZY_THRESHOLD):
+        super().__init__(prices)
+        self.threshold = threshold
+        self.cache = {}
+        self.audit = {}
+        self._names = list(prices)
+        self._exact = {}
+        self._sizes = []
+        self._postings = {}
+        for code, name in enumerate(self._names):
+            key = normalize_name(name)
+            self._exact.setdefault(key, name)
+            grams = trigrams(key)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(code)
+
+    @property
+    def fingerprint(self):
+        """
+        Huella de los nombres del catálogo y del umbral; invalida las
+        resoluciones guardadas por save_cache.
+        """
+        identity = json.dumps([self._names, self.threshold],
+                              ensure_ascii=False)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def __contains__(self, name):
+        return (super().__contains__(name)
+                or self.resolve(name)[0] is not None)
+
+    def __missing__(self, name):
+        match = self.match(name)
+        if match is None:
+            raise KeyError(name)
+        return self[match]
+
+    def _lookup(self, name):
+        """
+        Busca el producto más parecido a name en el índice.
+        """
+        key = normalize_name(name)
+        if key in self._exact:
+            return self._exact[key], 1.0
+        grams = trigrams(key)
+        size = len(grams)
+        # Con un coeficiente de Dice de al menos threshold, un producto
+        # comparte al menos threshold * size / (2 - threshold) trigramas;
+        # el resto de los candidatos se descarta sin calcular su puntaje.
+        needed = max(1, math.ceil(
+            self.threshold * size / (2 - self.threshold) - 1e-9))
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        best, best_score = None, 0.0
+        for code, count in shared.items():
+            if count >= needed:
+                score = 2 * count / (size + self._sizes[code])
+                if score > best_score or (score == best_score
+                                          and code < best):
+                    best, best_score = code, score
+        if best is None or best_score < self.threshold:
+            return None, round(best_score, 4)
+        return self._names[best], round(best_score, 4)
+
+    def resolve(self, name):
+        """
+        Retorna (producto, puntaje) para un nombre fuera del catálogo;
+        producto es None si no hay coincidencia o name no es texto.
+        """
+        if not isinstance(name, str):
+            return None, 0.0
+        resolution = self.cache.get(name)
+        if resolution is None:
+            resolution = self.cache[name] = self._lookup(name)
+        return resolution
+
+    def match(self, name):
+        """
+        Resuelve name como resolve y registra la venta en audit.
+        Retorna el producto del catálogo o None.
+        """
+        match, score = self.resolve(name)
+        if match is not None:
+            entry = self.audit.get(name)
+            if entry is None:
+                entry = self.audit[name] = [match, score, 0]
+            entry[2] += 1
+        return match
+
+    def export_matches(self):
+        """
+        Retorna y reinicia el registro de ventas resueltas, junto con
+        las resoluciones, para combinarlos desde otro proceso.
+        """
+        audit, self.audit = self.audit, {}
+        return audit, dict(self.cache)
+
+    def merge_matches(self, state):
+        """
+        Combina el resultado de export_matches de otro proceso.
+        """
+        audit, cache = state
+        self.cache.update(cache)
+        for name, (match, score, sales) in audit.items():
+            entry = self.audit.get(name)
+            if entry is None:
+                self.audit[name] = [match, score, sales]
+            else:
+                entry[2] += sales
+
+    def load_cache(self, path):
+        """
+        Carga las resoluciones guardadas en path si corresponden a este
+        catálogo y umbral. Retorna cuántas se cargaron.
+        """
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(data, dict) or \
+                data.get('fingerprint') != self.fingerprint:
+            return 0
+        matches = data.get('matches', {})
+        for name, (match, score) in matches.items():
+            self.cache[name] = (match, score)
+        return len(matches)
+
+    def save_cache(self, path):
+        """
+        Guarda las resoluciones en path como JSON.
+        """
+        data = {'fingerprint': self.fingerprint,
+                'matches': {name: list(resolution)
+                            for name, resolution in self.cache.items()}}
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
@@ -0,0 +1,149 @@
+"""
+Puntos de control para recalcular las ventas de forma incremental.
+
+Un punto de control guarda, para un archivo de ventas con un arreglo
+JSON, la posición en bytes donde terminaba su último elemento, una
+huella de los bytes anteriores a esa posición y los totales acumulados
+hasta ahí. Si después el archivo sólo creció con elementos agregados al
+final del arreglo, basta con procesar los bytes nuevos y sumarlos a los
+totales.
+
+El punto de control deja de ser válido si cambia el hash del catálogo,
+las opciones del cálculo (p. ej. los campos agrupados) o los bytes ya
+procesados.
+"""
+
+import hashlib
+import json
+import os
+from decimal import Decimal
+
+
+CHECKPOINT_VERSION = 1
+READ_SIZE = 1 << 16
+TAIL_BYTES = 1 << 12
+WHITESPACE_BYTES = b' \t\n\r'
+
+
+def file_hash(path):
+    """
+    Retorna el hash SHA-256 del contenido de path.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(READ_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def array_end(path):
+    """
+    Retorna la posición en bytes donde termina el contenido del arreglo
+    JSON de path: justo después de su último elemento (o del '[' si está
+    vacío), sin el ']' final ni los espacios que lo preceden. Sólo se
+    lee el final del archivo.
+    """
+    closed = False
+    with open(path, 'rb') as file:
+        end = file.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - READ_SIZE)
+            file.seek(start)
+            block = file.read(end - start).rstrip(WHITESPACE_BYTES)
+            if block and not closed:
+                if not block.endswith(b']'):
+                    break
+                closed = True
+                block = block[:-1].rstrip(WHITESPACE_BYTES)
+            if block:
+                return start + len(block)
+            end = start
+    raise json.JSONDecodeError("Se esperaba ']' al final del arreglo",
+                               path, 0)
+
+
+def tail_hash(path, offset):
+    """
+    Retorna el hash SHA-256 de los TAIL_BYTES bytes anteriores a offset.
+    """
+    start = max(0, offset - TAIL_BYTES)
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return hashlib.sha256(file.read(offset - start)).hexdigest()
+
+
+def dump_groups(groups):
+    """
+    Convierte los acumuladores por grupo a listas [valor, líneas,
+    cantidad, subtotal], que conservan el tipo de cada valor en JSON.
+    """
+    return {field: [[key, *entry] for key, entry in table.items()]
+            for field, table in groups.items()}
+
+
+def load_amount(value):
+    """
+    Retorna un monto guardado; los Decimal se guardan como texto para no
+    perder exactitud.
+    """
+    return Decimal(value) if isinstance(value, str) else value
+
+
+def load_groups(data):
+    """
+    Reconstruye los acumuladores por grupo guardados con dump_groups.
+    """
+    return {field: {key: [lines, quantity, load_amount(subtotal)]
+                    for key, lines, quantity, subtotal in rows}
+            for field, rows in data.items()}
+
+
+def load_checkpoint(path, sales_file, catalogue_hash, options):
+    """
+    Carga el punto de control de path. Retorna None si no existe o si ya
+    no corresponde a sales_file, catalogue_hash y options.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return None
+    expected = {'version': CHECKPOINT_VERSION,
+                'sales_file': os.path.abspath(sales_file),
+                'catalogue_hash': catalogue_hash,
+                'options': options}
+    if not isinstance(data, dict) or any(
+            data.get(key) != value for key, value in expected.items()):
+        return None
+    try:
+        offset = data['offset']
+        if not 0 < offset < os.path.getsize(sales_file) or \
+                tail_hash(sales_file, offset) != data['tail_hash']:
+            return None
+        data['total'] = load_amount(data['total'])
+        data['groups'] = load_groups(data['groups'])
+    except (OSError, KeyError, TypeError, ValueError, ArithmeticError):
+        return None
+    return data
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def save_checkpoint(path, sales_file, catalogue_hash, options, offset,
+                    total, groups):
+    """
+    Guarda el punto de control de sales_file hasta offset (ver
+    array_end) con el total y los acumuladores por grupo. El archivo se
+    reemplaza de forma atómica.
+    """
+    data = {'version': CHECKPOINT_VERSION,
+            'sales_file': os.path.abspath(sales_file),
+            'catalogue_hash': catalogue_hash,
+            'options': options,
+            'offset': offset,
+            'tail_hash': tail_hash(sales_file, offset),
+            'total': total,
+            'groups': dump_groups(groups)}
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, default=str)
+    os.replace(temporary, path)
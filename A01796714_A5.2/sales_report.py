@@ -0,0 +1,270 @@
+"""
+Formato y escritura de los reportes de compute_sales.
+
+ReportWriter escribe el reporte de un archivo de ventas conforme se
+calculan las líneas, en texto, CSV o JSON Lines; las funciones format_*
+arman el texto de los reportes y resúmenes.
+"""
+
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+
+ENCODER = json.JSONEncoder(ensure_ascii=False, default=float)
+WRITE_BUFFER = 1 << 20
+REPORT_FORMATS = {'text': '.txt', 'csv': '.csv', 'jsonl': '.jsonl'}
+REPORT_FIELDS = ('type', 'product', 'field', 'key', 'lines', 'quantity',
+                 'price', 'subtotal', 'total', 'seconds')
+GROUP_FIELDS = {
+    'product': ('Product', 'PRODUCTO'),
+    'date': ('SALE_Date', 'FECHA'),
+    'sale': ('SALE_ID', 'ID DE VENTA'),
+}
+
+
+def format_groups(groups):
+    """
+    Formatea los totales por grupo, una sección por campo.
+    """
+    titles = dict(GROUP_FIELDS.values())
+    output = []
+    for field, table in groups.items():
+        output.append("=" * 90)
+        output.append(f"TOTALES POR {titles.get(field, field)}")
+        output.append("-" * 90)
+        for key, (lines, quantity, subtotal) in table.items():
+            output.append(f"{str(key):<30} {lines:>7} líneas  "
+                          f"{quantity:>9} unidades     ${subtotal:>14.2f}")
+        output.append("")
+    return output
+
+
+def format_line(product, qty, price, subtotal):
+    """
+    Formatea una línea de detalle del reporte de texto.
+    """
+    return (f"{product:<30} {qty:>5}     x     "
+            f"${price:>10.2f}     =     ${subtotal:>12.2f}")
+
+
+def format_output(total, elapsed_time, results, groups=None):
+    """
+    Función para formatear la salida de los resultados, partiendo de:
+    Costo total de ventas.
+    Tiempo de ejecución.
+    Resultados detallados.
+    Totales por grupo (opcional).
+    """
+    output = []
+    output.append("-" * 90)
+    output.append("COSTO TOTAL DE VENTAS")
+    output.append("-" * 90)
+    output.append(f"Tiempo: {elapsed_time:.4f} segundos")
+    output.append("=" * 90)
+    output.append("")
+
+    for line in results:
+        output.append(format_line(*line))
+
+    output.append("")
+    if groups:
+        output.extend(format_groups(groups))
+    output.append("=" * 90)
+    output.append(f"TOTAL: ${total:.2f}")
+    output.append("-" * 90)
+    output.append(f"Tiempo: {elapsed_time:.4f} segundos")
+    output.append("=" * 90)
+    output.append("-" * 90)
+
+    return '\n'.join(output)
+
+
+class ReportWriter:
+    """
+    Escribe el reporte de ventas en un archivo, a través de un búfer,
+    conforme se calculan las líneas, sin armarlo completo en memoria.
+
+    Los motores reciben el escritor como destino de las líneas
+    (append/extend) y close() agrega los totales por grupo y el total.
+    Formatos:
+    'text': el mismo reporte de format_output. Como el encabezado lleva
+    el tiempo, las líneas se escriben en un archivo temporal junto al
+    reporte y al cerrar se copian después del encabezado.
+    'csv' y 'jsonl': un registro por línea ('line'), por grupo
+    ('group') y uno final con el total ('total'), con las columnas de
+    REPORT_FIELDS.
+    """
+
+    def __init__(self, path, fmt='text', buffer_size=WRITE_BUFFER):
+        self.path = path
+        self.fmt = fmt
+        self.count = 0
+        # pylint: disable=consider-using-with
+        self.file = open(path, 'w', encoding='utf-8', buffering=buffer_size,
+                         newline='' if fmt == 'csv' else None)
+        self._csv = None
+        self._lines = self.file
+        if fmt == 'text':
+            self._lines = tempfile.TemporaryFile(
+                'w+', encoding='utf-8', buffering=buffer_size,
+                dir=os.path.dirname(os.path.abspath(path)))
+        elif fmt == 'csv':
+            self._csv = csv.DictWriter(self.file, REPORT_FIELDS)
+            self._csv.writeheader()
+        self._body = self._lines.tell()
+
+    def __len__(self):
+        return self.count
+
+    def _write_record(self, record):
+        """
+        Escribe un registro en formato CSV o JSON Lines.
+        """
+        if self._csv is not None:
+            self._csv.writerow(record)
+        else:
+            self.file.write(ENCODER.encode(record) + '\n')
+
+    def append(self, line):
+        """
+        Escribe una línea (producto, cantidad, precio, subtotal).
+        """
+        self.extend((line,))
+
+    def extend(self, lines):
+        """
+        Escribe varias líneas (producto, cantidad, precio, subtotal).
+        """
+        count = self.count
+        if self.fmt == 'text':
+            write = self._lines.write
+            for line in lines:
+                write(format_line(*line) + '\n')
+                count += 1
+        else:
+            for product, qty, price, subtotal in lines:
+                self._write_record({'type': 'line', 'product': product,
+                                    'quantity': qty, 'price': price,
+                                    'subtotal': subtotal})
+                count += 1
+        self.count = count
+
+    def clear(self):
+        """
+        Descarta las líneas escritas, p. ej. antes de repetir el cálculo.
+        """
+        self._lines.seek(self._body)
+        self._lines.truncate()
+        self.count = 0
+
+    def close(self, total, elapsed_time, groups=None):
+        """
+        Escribe los totales por grupo y el total, y cierra el archivo.
+        """
+        if self.fmt != 'text':
+            for field, table in (groups or {}).items():
+                for key, (lines, quantity, subtotal) in table.items():
+                    self._write_record({'type': 'group', 'field': field,
+                                        'key': key, 'lines': lines,
+                                        'quantity': quantity,
+                                        'subtotal': subtotal})
+            self._write_record({'type': 'total', 'lines': self.count,
+                                'total': total,
+                                'seconds': round(elapsed_time, 4)})
+            self.file.close()
+            return
+        self.file.write('\n'.join(
+            ["-" * 90, "COSTO TOTAL DE VENTAS", "-" * 90,
+             f"Tiempo: {elapsed_time:.4f} segundos", "=" * 90, "", ""]))
+        self._lines.seek(0)
+        shutil.copyfileobj(self._lines, self.file)
+        self._lines.close()
+        footer = [""]
+        if groups:
+            footer.extend(format_groups(groups))
+        footer.extend(["=" * 90, f"TOTAL: ${total:.2f}", "-" * 90,
+                       f"Tiempo: {elapsed_time:.4f} segundos", "=" * 90,
+                       "-" * 90])
+        self.file.write('\n'.join(footer))
+        self.file.close()
+
+    def discard(self):
+        """
+        Cierra el archivo sin terminarlo y lo elimina.
+        """
+        self._lines.close()
+        self.file.close()
+        os.remove(self.path)
+
+
+def print_report(path, total, elapsed_time, console='full'):
+    """
+    Muestra en consola el reporte escrito en path: completo ('full'),
+    sólo el total ('summary') o nada ('quiet').
+    """
+    if console == 'full':
+        with open(path, encoding='utf-8') as file:
+            shutil.copyfileobj(file, sys.stdout)
+        print()
+    elif console == 'summary':
+        print(f"TOTAL: ${total:.2f}")
+        print(f"Tiempo: {elapsed_time:.4f} segundos")
+        print(f"Reporte: {path}")
+
+
+def format_summary(entries, elapsed_time):
+    """
+    Formatea el resumen combinado de un lote, partiendo de:
+    Entradas (archivo, total, líneas, tiempo, error) de cada archivo.
+    Tiempo de ejecución total.
+    """
+    output = []
+    output.append("-" * 90)
+    output.append("RESUMEN DE VENTAS POR ARCHIVO")
+    output.append("-" * 90)
+    output.append(f"Tiempo: {elapsed_time:.4f} segundos")
+    output.append("=" * 90)
+    output.append("")
+
+    grand_total = 0
+    for sales_file, total, lines, seconds, error in entries:
+        name = os.path.basename(sales_file)
+        if error:
+            output.append(f"{name:<40} ERROR: {error}")
+            continue
+        grand_total += total
+        lines = '-' if lines is None else lines
+        output.append(f"{name:<40} {lines:>9} líneas     "
+                      f"${total:>14.2f}     {seconds:8.4f} s")
+
+    output.append("")
+    output.append("=" * 90)
+    output.append(f"TOTAL GENERAL: ${grand_total:.2f}")
+    output.append("-" * 90)
+    output.append(f"Tiempo: {elapsed_time:.4f} segundos")
+    output.append("=" * 90)
+    output.append("-" * 90)
+
+    return '\n'.join(output)
+
+
+def format_matches(audit):
+    """
+    Formatea el registro de coincidencias aproximadas, partiendo de:
+    Registro {nombre: [producto, puntaje, ventas]} de FuzzyCatalogue.
+    """
+    output = []
+    output.append("-" * 90)
+    output.append("COINCIDENCIAS APROXIMADAS CON EL CATÁLOGO")
+    output.append("-" * 90)
+    for name, (match, score, sales) in sorted(audit.items()):
+        output.append(f"{name:<30} -> {match:<30} {score:>6.2f}  "
+                      f"{sales:>7} ventas")
+    output.append("=" * 90)
+    output.append(f"Nombres resueltos: {len(audit)}")
+    output.append("-" * 90)
+    return '\n'.join(output)
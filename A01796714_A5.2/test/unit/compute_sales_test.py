@@ -0,0 +1,472 @@
+"""Tests unitarios para compute_sales."""
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from decimal import Decimal
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# pylint: disable=wrong-import-position
+import unittest
+
+from compute_sales import (build_price_catalogue, compute_sales_batch,
+                           compute_sales_fixed, compute_sales_function,
+                           compute_sales_numpy, compute_sales_parallel,
+                           iter_appended, iter_json_array, iter_segment,
+                           main, price_cents, report_paths,
+                           split_json_array)
+from sales_checkpoint import array_end
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..', '..')
+CATALOGUE_FILE = os.path.join(BASE_DIR, 'TCList', 'TC1.ProductList.json')
+SALES_FILES = [os.path.join(BASE_DIR, f'TC{n}', f'TC{n}.Sales.json')
+               for n in (1, 2, 3)]
+SALES = [{"SALE_ID": i, "Product": f"Producto {i}", "Quantity": i % 7}
+         for i in range(1, 200)]
+
+
+class JsonFileTestCase(unittest.TestCase):
+    """Base con un directorio temporal para los archivos de prueba."""
+
+    def setUp(self):
+        """Crea el directorio temporal."""
+        # pylint: disable=consider-using-with
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'ventas.json')
+
+    def tearDown(self):
+        """Elimina el directorio temporal."""
+        self.folder.cleanup()
+
+    def write(self, text):
+        """Escribe text en el archivo de prueba."""
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+
+class TestIterJsonArray(JsonFileTestCase):
+    """Pruebas unitarias para iter_json_array."""
+
+    def test_bloques_pequenos(self):
+        """Verifica que los cortes de bloque a mitad de un elemento no
+        cambian el resultado."""
+        self.write(json.dumps(SALES, indent=2))
+        for chunk_size in (1, 3, 7, 64, 1 << 16):
+            self.assertEqual(list(iter_json_array(self.path, chunk_size)),
+                             SALES)
+
+    def test_arreglo_vacio(self):
+        """Verifica que un arreglo vacío no produce elementos."""
+        self.write(' [ ]\n')
+        self.assertEqual(list(iter_json_array(self.path, 2)), [])
+
+    def test_espacios_al_final(self):
+        """Verifica que se aceptan espacios después de ']'."""
+        self.write(json.dumps(SALES[:3]) + '\n\n  ')
+        self.assertEqual(list(iter_json_array(self.path, 4)), SALES[:3])
+
+    def test_arreglo_truncado(self):
+        """Verifica que un arreglo incompleto lanza JSONDecodeError."""
+        text = json.dumps(SALES[:3])
+        for cut in (len(text) - 1, len(text) // 2, 1):
+            self.write(text[:cut])
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_array(self.path, 5))
+
+    def test_datos_extra(self):
+        """Verifica que datos después de ']' lanzan JSONDecodeError."""
+        for extra in (' garbage {', '[]', ','):
+            self.write(json.dumps(SALES[:3]) + extra)
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_array(self.path, 4))
+
+    def test_no_es_arreglo(self):
+        """Verifica que un objeto JSON lanza JSONDecodeError."""
+        self.write('{"Product": "A"}')
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(self.path))
+
+
+class TestSplitJsonArray(JsonFileTestCase):
+    """Pruebas unitarias para split_json_array e iter_segment."""
+
+    def read_segments(self, ranges):
+        """Interpreta cada rango de bytes con iter_segment."""
+        items = []
+        with open(self.path, 'rb') as file:
+            for start, end in ranges:
+                file.seek(start)
+                data = file.read(-1 if end is None else end - start)
+                items.extend(iter_segment(data.decode('utf-8'),
+                                          first=start == 0))
+        return items
+
+    def test_rangos_cubren_el_arreglo(self):
+        """Verifica que los rangos juntos producen todos los elementos."""
+        self.write(json.dumps(SALES, indent=4))
+        for parts in (1, 2, 5, 16):
+            ranges = split_json_array(self.path, parts)
+            self.assertLessEqual(len(ranges), parts)
+            self.assertIsNone(ranges[-1][1])
+            self.assertEqual(self.read_segments(ranges), SALES)
+
+    def test_mas_partes_que_elementos(self):
+        """Verifica que no se generan rangos vacíos repetidos."""
+        self.write(json.dumps(SALES[:2]))
+        ranges = split_json_array(self.path, 50)
+        self.assertEqual(self.read_segments(ranges), SALES[:2])
+
+    def test_segmento_con_datos_extra(self):
+        """Verifica que el último segmento rechaza datos después de ']'."""
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_segment('{"a": 1}] {', first=False))
+
+    def test_segmento_truncado(self):
+        """Verifica que un elemento cortado lanza JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_segment('[{"a": 1}, {"b"', first=True))
+
+
+class TestIterAppended(JsonFileTestCase):
+    """Pruebas unitarias para iter_appended."""
+
+    def test_elementos_agregados(self):
+        """Verifica que sólo se producen los elementos nuevos."""
+        self.write(json.dumps(SALES[:5], indent=2))
+        start = array_end(self.path)
+        self.write(json.dumps(SALES[:8], indent=2))
+        self.assertEqual(
+            list(iter_appended(self.path, start, array_end(self.path))),
+            SALES[5:8])
+
+    def test_arreglo_inicialmente_vacio(self):
+        """Verifica el caso de un punto de control sobre '[]'."""
+        self.write('[\n]')
+        start = array_end(self.path)
+        self.write(json.dumps(SALES[:2]))
+        self.assertEqual(
+            list(iter_appended(self.path, start, array_end(self.path))),
+            SALES[:2])
+
+    def test_sin_cambios(self):
+        """Verifica que sin elementos nuevos no se produce nada."""
+        self.write(json.dumps(SALES[:3]))
+        end = array_end(self.path)
+        self.assertEqual(list(iter_appended(self.path, end, end)), [])
+
+    def test_elemento_truncado(self):
+        """Verifica que un elemento agregado incompleto lanza error."""
+        self.write(json.dumps(SALES[:2]))
+        start = array_end(self.path)
+        self.write(json.dumps(SALES[:2])[:-1] + ', {"Product": "A"]')
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_appended(self.path, start, array_end(self.path)))
+
+
+class TestBatch(JsonFileTestCase):
+    """Pruebas unitarias para el modo lote."""
+
+    def write_file(self, *parts, content=b'[]'):
+        """Escribe content en folder/parts y retorna su ruta."""
+        path = os.path.join(self.folder.name, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_nombres_de_reporte_unicos(self):
+        """Verifica que archivos con el mismo nombre no comparten
+        reporte."""
+        paths = report_paths('out', ['d1/Sales.json', 'd2/Sales.json',
+                                     'TC1.Sales.json', 'd1-Sales.json'])
+        self.assertEqual([os.path.basename(path) for path in paths],
+                         ['d1-Sales-SalesResults.txt',
+                          'd2-Sales-SalesResults.txt',
+                          'TC1-SalesResults.txt',
+                          'd1-Sales-2-SalesResults.txt'])
+
+    def test_archivos_invalidos_no_detienen_el_lote(self):
+        """Verifica que un archivo que no es UTF-8 o con elementos que no
+        son objetos se reporta y el lote continúa."""
+        sale = b'[{"SALE_ID": 1, "Product": "A", "Quantity": 2}]'
+        files = [self.write_file('d1', 'Sales.json', content=sale),
+                 self.write_file('bad.json', content=b'[\xff\xfe]'),
+                 self.write_file('list.json', content=b'[[1, 2]]'),
+                 self.write_file('d2', 'Sales.json', content=sale)]
+        output_dir = os.path.join(self.folder.name, 'out')
+        entries = compute_sales_batch({'A': 1.5}, files, output_dir)
+        self.assertEqual([entry[1] for entry in entries],
+                         [3.0, 0.0, 0.0, 3.0])
+        self.assertEqual([entry[4] is None for entry in entries],
+                         [True, False, False, True])
+        self.assertEqual(sorted(os.listdir(output_dir)),
+                         ['d1-Sales-SalesResults.txt',
+                          'd2-Sales-SalesResults.txt'])
+
+
+class TestParallel(JsonFileTestCase):
+    """Pruebas de extremo a extremo para compute_sales_parallel."""
+
+    CATALOGUE = {'Caja [grande], roja': 2.5, 'Pan, integral': 1.1,
+                 'Té ] verde': 3.3}
+
+    def run_both(self, sales):
+        """Escribe sales y la calcula en serie y con 2 procesos en rangos
+        pequeños. Retorna ambos resultados y la salida en consola."""
+        self.write(json.dumps(sales, indent=2, ensure_ascii=False))
+        with redirect_stdout(io.StringIO()):
+            serial = compute_sales_function(self.CATALOGUE,
+                                            iter_json_array(self.path))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            parallel = compute_sales_parallel(self.CATALOGUE, self.path, 2,
+                                              segment_bytes=256)
+        return serial, parallel, output.getvalue()
+
+    def test_corchetes_y_comas_en_textos(self):
+        """Verifica que ']' y ',' dentro de los textos no afectan la
+        división: mismas líneas en el mismo orden y mismo total."""
+        names = list(self.CATALOGUE)
+        sales = [{"SALE_ID": i, "Product": names[i % 3],
+                  "Nota": "cliente ], frecuente [", "Quantity": i % 5 + 1}
+                 for i in range(300)]
+        serial, parallel, output = self.run_both(sales)
+        self.assertGreater(len(split_json_array(self.path, 2)), 1)
+        self.assertNotIn("Aviso", output)
+        self.assertEqual(parallel[1], serial[1])
+        self.assertAlmostEqual(parallel[0], serial[0], places=6)
+
+    def test_sin_punto_de_corte_se_procesa_en_serie(self):
+        """Verifica que si un corte cae dentro de un elemento se calcula
+        en un solo proceso con el mismo resultado."""
+        sales = [{"SALE_ID": i, "Product": "Pan, integral",
+                  "Nota": ", {" * 40, "Quantity": 2} for i in range(100)]
+        serial, parallel, output = self.run_both(sales)
+        self.assertIn("Aviso: no se pudo dividir", output)
+        self.assertEqual(parallel[1], serial[1])
+        self.assertAlmostEqual(parallel[0], serial[0], places=6)
+
+
+def run_quiet(function, *args):
+    """Llama function(*args) y retorna su resultado y lo que imprime."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = function(*args)
+    return result, output.getvalue()
+
+
+class TestNumpyEngine(unittest.TestCase):
+    """Pruebas unitarias para compute_sales_numpy."""
+
+    def setUp(self):
+        """Carga el catálogo de los casos de prueba."""
+        self.catalogue = build_price_catalogue(
+            iter_json_array(CATALOGUE_FILE))
+
+    def compare(self, sales, chunk_rows=4):
+        """Calcula sales con ambos motores, sólo totales y por producto,
+        y verifica que coinciden total, grupos y mensajes."""
+        expected_groups = {'Product': {}}
+        expected = run_quiet(compute_sales_function, self.catalogue, sales,
+                             False, expected_groups)
+        groups = {'Product': {}}
+        actual = run_quiet(compute_sales_numpy, self.catalogue, sales,
+                           False, groups, None, chunk_rows)
+        self.assertEqual(actual[0][0], expected[0][0])
+        self.assertEqual(groups, expected_groups)
+        self.assertEqual(actual[1], expected[1])
+        return actual[0][0], groups
+
+    def test_casos_de_prueba(self):
+        """Verifica que los totales de TC1 a TC3 coinciden con los del
+        motor escalar."""
+        for sales_file in SALES_FILES:
+            with self.subTest(sales_file=os.path.basename(sales_file)):
+                sales = list(iter_json_array(sales_file))
+                expected, _ = run_quiet(compute_sales_function,
+                                        self.catalogue, sales, False)
+                for chunk_rows in (1, 7, 1 << 16):
+                    total, _ = run_quiet(compute_sales_numpy,
+                                         self.catalogue, sales, False,
+                                         None, None, chunk_rows)
+                    self.assertEqual(total[0], expected[0])
+
+    def test_filas_invalidas(self):
+        """Verifica que productos no hashables y cantidades no numéricas
+        se reportan y omiten igual que en el motor escalar."""
+        product = next(iter(self.catalogue))
+        sales = [{"Product": product, "Quantity": 2},
+                 {"Product": [product], "Quantity": 1},
+                 {"Product": {"a": 1}, "Quantity": "x"},
+                 {"Product": product, "Quantity": "tres"},
+                 {"Product": product, "Quantity": [1]},
+                 {"Product": product, "Quantity": "4"},
+                 {"Product": product, "Quantity": 2.9},
+                 {"Product": product},
+                 {"Product": "Elotes", "Quantity": 1},
+                 {"Product": product, "Quantity": 10 ** 20}]
+        total, groups = self.compare(sales)
+        self.assertEqual(groups['Product'][product][0], 4)
+        self.assertGreater(total, 0)
+
+    def test_precios_no_numericos(self):
+        """Verifica que los precios no numéricos del catálogo se omiten
+        y ambos motores usan el mismo catálogo."""
+        data = [{"title": "A", "price": "1.5"},
+                {"title": "B", "price": "caro"},
+                {"title": "C", "price": [2]},
+                {"title": "D", "price": True}]
+        catalogue, output = run_quiet(build_price_catalogue, data)
+        self.assertEqual(catalogue, {'A': 1.5, 'D': 1.0})
+        self.assertEqual(output.count("Error al procesar el artículo"), 2)
+        self.catalogue = catalogue
+        sales = [{"Product": name, "Quantity": 3} for name in 'ABCD']
+        total, _ = self.compare(sales)
+        self.assertEqual(total, 7.5)
+
+    def test_cli_rechaza_lineas_con_numpy(self):
+        """Verifica que --engine numpy sin --aggregate-only es un error
+        de uso."""
+        argv = ['compute_sales.py', CATALOGUE_FILE, SALES_FILES[0],
+                '--engine', 'numpy']
+        errors = io.StringIO()
+        with mock.patch.object(sys, 'argv', argv), \
+                redirect_stderr(errors), \
+                self.assertRaises(SystemExit) as context:
+            main()
+        self.assertEqual(context.exception.code, 2)
+        self.assertIn("--aggregate-only", errors.getvalue())
+
+
+class TestGroupBy(JsonFileTestCase):
+    """Pruebas unitarias para los totales por grupo y --aggregate-only."""
+
+    CATALOGUE = [{"title": "A", "price": 1.5}, {"title": "B", "price": 2.0}]
+    SALES = [{"SALE_ID": 1, "SALE_Date": "01/12/23", "Product": "A",
+              "Quantity": 2},
+             {"SALE_ID": 1, "SALE_Date": "01/12/23", "Product": "B",
+              "Quantity": 1},
+             {"SALE_ID": 2, "SALE_Date": "02/12/23", "Product": "A",
+              "Quantity": 4},
+             {"SALE_ID": 3, "SALE_Date": "02/12/23", "Product": "C",
+              "Quantity": 9},
+             {"SALE_ID": 3, "SALE_Date": "02/12/23", "Product": "B",
+              "Quantity": -1}]
+
+    def test_totales_por_campo(self):
+        """Verifica líneas, unidades y subtotal de cada valor agrupado;
+        las ventas fuera del catálogo no se cuentan."""
+        groups = {'Product': {}, 'SALE_Date': {}, 'SALE_ID': {}}
+        (total, results), _ = run_quiet(
+            compute_sales_function, build_price_catalogue(self.CATALOGUE),
+            self.SALES, False, groups)
+        self.assertEqual(total, 9.0)
+        self.assertEqual(results, [])
+        self.assertEqual(groups, {
+            'Product': {'A': [2, 6, 9.0], 'B': [2, 0, 0.0]},
+            'SALE_Date': {'01/12/23': [2, 3, 5.0],
+                          '02/12/23': [2, 3, 4.0]},
+            'SALE_ID': {1: [2, 3, 5.0], 2: [1, 4, 6.0], 3: [1, -1, -2.0]},
+        })
+
+    def test_solo_totales_sin_lineas(self):
+        """Verifica que con --aggregate-only el reporte en consola y en
+        el archivo no tiene líneas de detalle."""
+        catalogue_file = os.path.join(self.folder.name, 'catalogo.json')
+        with open(catalogue_file, 'w', encoding='utf-8') as file:
+            json.dump(self.CATALOGUE, file)
+        self.write(json.dumps(self.SALES))
+        output_dir = os.path.join(self.folder.name, 'out')
+        argv = ['compute_sales.py', catalogue_file, self.path,
+                '--output-dir', output_dir, '--group-by', 'product',
+                '--aggregate-only']
+        with mock.patch.object(sys, 'argv', argv):
+            _, output = run_quiet(main)
+        with open(os.path.join(output_dir, 'SalesResults.txt'),
+                  encoding='utf-8') as file:
+            report = file.read()
+        self.assertIn(report, output)
+        self.assertNotIn("     x     ", report)
+        self.assertIn("TOTALES POR PRODUCTO", report)
+        self.assertIn("TOTAL: $9.00", report)
+
+
+class TestFixedEngine(unittest.TestCase):
+    """Pruebas unitarias para price_cents y compute_sales_fixed."""
+
+    def test_totales_exactos(self):
+        """Verifica que los totales de TC1 a TC3 son los de Resultados,
+        sin error de redondeo."""
+        catalogue = build_price_catalogue(iter_json_array(CATALOGUE_FILE))
+        expected = ('2481.86', '166568.23', '165235.37')
+        for sales_file, total in zip(SALES_FILES, expected):
+            (actual, _), _ = run_quiet(compute_sales_fixed, catalogue,
+                                       iter_json_array(sales_file), False)
+            self.assertIsInstance(actual, Decimal)
+            self.assertEqual(actual, Decimal(total))
+            self.assertEqual(str(actual), total)
+
+    def test_redondeo_de_precios(self):
+        """Verifica el redondeo al centavo con las mitades hacia
+        arriba."""
+        cases = {29.45: 2945, 0.005: 1, 0.0049: 0, 1e-3: 0, 0.015: 2,
+                 2.675: 268, 1e-7: 0, -0.005: -1, 3: 300, 0.1: 10}
+        for price, cents in cases.items():
+            self.assertEqual(price_cents(price), cents, price)
+
+    def test_precios_texto_y_bool(self):
+        """Verifica que un bool vale 0 o 1 y que un precio de texto o no
+        finito se rechaza; en el cálculo se omiten esas filas como en la
+        versión de float."""
+        self.assertEqual((price_cents(True), price_cents(False)), (100, 0))
+        for price in ('1.25', None, float('inf'), float('nan'), 10 ** 400):
+            with self.assertRaises((TypeError, ValueError)):
+                price_cents(price)
+        catalogue = {'A': 1.5, 'S': '1.25', 'T': True, 'N': float('nan')}
+        sales = [{"Product": name, "Quantity": 2} for name in 'ASTN']
+        (total, results), output = run_quiet(compute_sales_fixed,
+                                             catalogue, sales)
+        self.assertEqual(total, Decimal('5.00'))
+        self.assertEqual(results, [('A', 2, 1.5, 3.0), ('T', 2, True, 2.0)])
+        self.assertEqual(output.count("Error al procesar"), 2)
+        (expected, expected_results), _ = run_quiet(
+            compute_sales_function, {'A': 1.5, 'S': '1.25', 'T': True},
+            sales[:3])
+        self.assertEqual(total, Decimal(repr(expected)))
+        self.assertEqual(results, expected_results)
+
+    def test_filas_invalidas(self):
+        """Verifica que las filas inválidas se omiten con los mismos
+        mensajes que en la versión de float."""
+        catalogue = {'A': 1.5, 'B': 0.1}
+        sales = [{"Product": "A", "Quantity": 2},
+                 {"Product": "B"},
+                 {"Quantity": 1},
+                 {"Product": "A", "Quantity": "tres"},
+                 {"Product": ["A"], "Quantity": 1},
+                 {"Product": "C", "Quantity": 1},
+                 {"Product": "B", "Quantity": "3"},
+                 {"Product": "B", "Quantity": -1}]
+        groups = {'Product': {}}
+        (total, results), output = run_quiet(compute_sales_fixed, catalogue,
+                                             sales, True, groups)
+        expected_groups = {'Product': {}}
+        (expected, expected_results), expected_output = run_quiet(
+            compute_sales_function, catalogue, sales, True, expected_groups)
+        self.assertEqual(total, Decimal('3.20'))
+        self.assertAlmostEqual(float(total), expected)
+        self.assertEqual([line[:3] for line in results],
+                         [line[:3] for line in expected_results])
+        self.assertEqual(results[1][3], 0.3)
+        self.assertEqual(output, expected_output)
+        self.assertEqual(groups, {'Product': {'A': [1, 2, Decimal('3.00')],
+                                              'B': [2, 2, Decimal('0.20')]}})
+
+
+if __name__ == "__main__":
+    unittest.main()
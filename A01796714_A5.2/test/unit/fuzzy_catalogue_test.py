@@ -0,0 +1,126 @@
+"""Tests unitarios para el catálogo de coincidencias aproximadas."""
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# pylint: disable=wrong-import-position
+import unittest
+
+from compute_sales import (build_price_catalogue, compute_sales_function,
+                           iter_json_array, save_matches)
+from fuzzy_catalogue import FuzzyCatalogue, normalize_name
+
+
+CATALOGUE_FILE = os.path.join(os.path.dirname(__file__), '..', '..',
+                              'TCList', 'TC1.ProductList.json')
+
+
+class TestFuzzyCatalogue(unittest.TestCase):
+    """Pruebas unitarias para FuzzyCatalogue."""
+
+    def setUp(self):
+        """Construye el catálogo aproximado de los casos de prueba."""
+        self.prices = build_price_catalogue(iter_json_array(CATALOGUE_FILE))
+        self.catalogue = FuzzyCatalogue(self.prices)
+
+    def compute(self, sales):
+        """Calcula sales con el catálogo aproximado sin imprimir."""
+        with redirect_stdout(io.StringIO()):
+            return compute_sales_function(self.catalogue, sales)
+
+    def test_normalizacion(self):
+        """Verifica que se ignoran acentos, mayúsculas y puntuación."""
+        self.assertEqual(normalize_name('  Café-con_LECHE!! '),
+                         'cafe con leche')
+
+    def test_error_de_escritura(self):
+        """Verifica que un nombre con un error de escritura se resuelve
+        al producto del catálogo."""
+        match, score = self.catalogue.resolve('fresh stawbery')
+        self.assertEqual(match, 'Fresh stawberry')
+        self.assertGreaterEqual(score, self.catalogue.threshold)
+        self.assertIn('fresh stawbery', self.catalogue)
+        self.assertEqual(self.catalogue['fresh stawbery'],
+                         self.prices['Fresh stawberry'])
+
+    def test_bajo_el_umbral(self):
+        """Verifica que un nombre bajo el umbral sigue sin resolverse."""
+        match, score = self.catalogue.resolve('eggs')
+        self.assertIsNone(match)
+        self.assertGreater(score, 0)
+        self.assertLess(score, self.catalogue.threshold)
+        self.assertNotIn('eggs', self.catalogue)
+        self.assertNotIn('Elotes', self.catalogue)
+        with self.assertRaises(KeyError):
+            _ = self.catalogue['eggs']
+        total, results = self.compute([{"Product": "eggs", "Quantity": 1}])
+        self.assertEqual((total, results), (0.0, []))
+
+    def test_registro_de_sustituciones(self):
+        """Verifica que audit cuenta cada venta resuelta por nombre."""
+        sales = [{"Product": "fresh stawbery", "Quantity": 2},
+                 {"Product": "Brwn eggs", "Quantity": 1},
+                 {"Product": "fresh stawbery", "Quantity": 1},
+                 {"Product": "Elotes", "Quantity": 1},
+                 {"Product": "Brown eggs", "Quantity": 1}]
+        total, results = self.compute(sales)
+        self.assertEqual([line[0] for line in results],
+                         ['fresh stawbery', 'Brwn eggs', 'fresh stawbery',
+                          'Brown eggs'])
+        self.assertAlmostEqual(total, 3 * self.prices['Fresh stawberry']
+                               + 2 * self.prices['Brown eggs'])
+        self.assertEqual(self.catalogue.audit, {
+            'fresh stawbery': ['Fresh stawberry', 0.8966, 2],
+            'Brwn eggs': ['Brown eggs', 0.7368, 1]})
+
+    def test_coincidencia_exacta_sin_busqueda(self):
+        """Verifica que los nombres del catálogo no pasan por el índice
+        ni se registran."""
+        with mock.patch.object(FuzzyCatalogue, '_lookup') as lookup:
+            self.compute([{"Product": "Brown eggs", "Quantity": 3}])
+            self.assertIn('Fresh stawberry', self.catalogue)
+        lookup.assert_not_called()
+        self.assertEqual((self.catalogue.cache, self.catalogue.audit),
+                         ({}, {}))
+
+    def test_save_matches(self):
+        """Verifica SalesMatches.txt, la salida en consola y que la
+        caché guardada se vuelve a cargar con el mismo catálogo."""
+        self.compute([{"Product": "fresh stawbery", "Quantity": 1},
+                      {"Product": "Elotes", "Quantity": 1}])
+        with tempfile.TemporaryDirectory() as folder:
+            cache_path = os.path.join(folder, 'matches.json')
+            output = io.StringIO()
+            with redirect_stdout(output):
+                save_matches(self.catalogue, folder, cache_path, 'summary')
+            self.assertEqual(output.getvalue(),
+                             "Coincidencias aproximadas: 1 nombres, "
+                             "1 ventas "
+                             f"({os.path.join(folder, 'SalesMatches.txt')})"
+                             "\n")
+            with open(os.path.join(folder, 'SalesMatches.txt'),
+                      encoding='utf-8') as file:
+                report = file.read().splitlines()
+            self.assertEqual(report[3].split(),
+                             ['fresh', 'stawbery', '->', 'Fresh',
+                              'stawberry', '0.90', '1', 'ventas'])
+            self.assertEqual(report[-2], "Nombres resueltos: 1")
+            with open(cache_path, encoding='utf-8') as file:
+                data = json.load(file)
+            self.assertEqual(data['matches'], {
+                'fresh stawbery': ['Fresh stawberry', 0.8966],
+                'Elotes': [None, 0.0]})
+            self.assertEqual(FuzzyCatalogue(self.prices).load_cache(
+                cache_path), 2)
+            self.assertEqual(FuzzyCatalogue(self.prices, 0.8).load_cache(
+                cache_path), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
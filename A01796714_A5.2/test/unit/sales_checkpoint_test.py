@@ -0,0 +1,152 @@
+"""Tests unitarios para los puntos de control del modo incremental."""
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# pylint: disable=wrong-import-position
+import unittest
+
+from compute_sales import (compute_sales_function, compute_sales_incremental,
+                           iter_json_array)
+from sales_checkpoint import array_end, load_checkpoint
+
+
+CATALOGUE = {'A': 1.5, 'B': 2.25, 'C': 0.1}
+SALES = [{"SALE_ID": i // 3, "SALE_Date": f"0{i % 4 + 1}/12/23",
+          "Product": 'ABCD'[i % 4], "Quantity": i % 5 + 1}
+         for i in range(60)]
+FULL = "Punto de control inexistente o inválido"
+
+
+class TestIncremental(unittest.TestCase):
+    """Pruebas de ida y vuelta de compute_sales_incremental."""
+
+    def setUp(self):
+        """Crea el directorio temporal del archivo de ventas y del punto
+        de control."""
+        # pylint: disable=consider-using-with
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'ventas.json')
+        self.checkpoint = os.path.join(self.folder.name, 'checkpoint.json')
+
+    def tearDown(self):
+        """Elimina el directorio temporal."""
+        self.folder.cleanup()
+
+    def write(self, sales):
+        """Escribe sales como arreglo JSON; una lista más larga sólo
+        agrega bytes al final del arreglo."""
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps(sales, indent=2))
+
+    def run_incremental(self, catalogue_hash='catalogo', engine='python'):
+        """Ejecuta compute_sales_incremental agrupando por producto y
+        fecha. Retorna total, líneas, grupos y la salida en consola."""
+        groups = {'Product': {}, 'SALE_Date': {}}
+        output = io.StringIO()
+        with redirect_stdout(output):
+            total, results = compute_sales_incremental(
+                CATALOGUE, self.path, self.checkpoint, catalogue_hash,
+                engine, True, groups)
+        return total, results, groups, output.getvalue()
+
+    def full_run(self):
+        """Calcula el archivo completo en una sola pasada."""
+        groups = {'Product': {}, 'SALE_Date': {}}
+        with redirect_stdout(io.StringIO()):
+            total, results = compute_sales_function(
+                CATALOGUE, iter_json_array(self.path), True, groups)
+        return total, results, groups
+
+    def assert_groups(self, groups, expected):
+        """Compara los acumuladores por grupo; los subtotales con
+        tolerancia, porque se suman en otro orden."""
+        self.assertEqual(groups.keys(), expected.keys())
+        for field, table in expected.items():
+            self.assertEqual(groups[field].keys(), table.keys())
+            for key, (lines, quantity, subtotal) in table.items():
+                self.assertEqual(groups[field][key][:2], [lines, quantity])
+                self.assertAlmostEqual(groups[field][key][2], subtotal,
+                                       places=9)
+
+    def test_agregados_igual_a_completo(self):
+        """Verifica que procesar sólo lo agregado da el mismo total y
+        grupos que recalcular todo, en varias ejecuciones."""
+        self.write(SALES[:20])
+        self.assertIn(FULL, self.run_incremental()[3])
+        done = len(self.full_run()[1])
+        for size in (35, 35, 60):
+            self.write(SALES[:size])
+            total, results, groups, output = self.run_incremental()
+            self.assertNotIn(FULL, output)
+            expected_total, expected_results, expected_groups = \
+                self.full_run()
+            self.assertAlmostEqual(total, expected_total, places=9)
+            self.assertEqual(results, expected_results[done:])
+            self.assert_groups(groups, expected_groups)
+            done = len(expected_results)
+
+    def test_cambio_de_catalogo_o_motor(self):
+        """Verifica que un hash de catálogo u otro motor invalidan el
+        punto de control."""
+        self.write(SALES[:30])
+        self.run_incremental()
+        options = {'fields': ['Product', 'SALE_Date'], 'exact': False}
+        self.assertIsNotNone(load_checkpoint(self.checkpoint, self.path,
+                                             'catalogo', options))
+        self.assertIsNone(load_checkpoint(self.checkpoint, self.path,
+                                          'otro', options))
+        self.write(SALES[:40])
+        total, results, _, output = self.run_incremental('otro')
+        self.assertIn(FULL, output)
+        expected_total, expected_results, _ = self.full_run()
+        self.assertEqual(results, expected_results)
+        self.assertAlmostEqual(total, expected_total, places=9)
+        total, results, _, output = self.run_incremental('otro', 'fixed')
+        self.assertIn(FULL, output)
+        self.assertIsInstance(total, Decimal)
+        self.assertEqual(total, Decimal(str(round(expected_total, 2))))
+
+    def test_cambio_antes_del_punto_de_control(self):
+        """Verifica que modificar los bytes ya procesados (los que cubre
+        tail_hash) obliga a recalcular todo."""
+        self.write(SALES[:30])
+        self.run_incremental()
+        offset = array_end(self.path)
+        changed = [dict(sale) for sale in SALES[:40]]
+        changed[28]['Quantity'] += 1
+        self.write(changed)
+        self.assertEqual(array_end(self.path) - offset,
+                         len(json.dumps(SALES[:40], indent=2))
+                         - len(json.dumps(SALES[:30], indent=2)))
+        total, results, _, output = self.run_incremental()
+        self.assertIn(FULL, output)
+        expected_total, expected_results, _ = self.full_run()
+        self.assertEqual(results, expected_results)
+        self.assertAlmostEqual(total, expected_total, places=9)
+
+    def test_archivo_truncado(self):
+        """Verifica que un archivo más corto que el punto de control se
+        recalcula completo."""
+        self.write(SALES[:40])
+        self.run_incremental()
+        self.write(SALES[:25])
+        total, results, groups, output = self.run_incremental()
+        self.assertIn(FULL, output)
+        expected_total, expected_results, expected_groups = self.full_run()
+        self.assertEqual((total, results, groups),
+                         (expected_total, expected_results,
+                          expected_groups))
+        self.write(SALES[:30])
+        output = self.run_incremental()[3]
+        self.assertNotIn(FULL, output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Tests unitarios para ReportWriter y los reportes de compute_sales."""
+import csv
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# pylint: disable=wrong-import-position
+import unittest
+
+from compute_sales import (build_price_catalogue, compute_sales_function,
+                           iter_json_array)
+from sales_report import ReportWriter, format_output, print_report
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..', '..')
+LINES = (('Caja, "grande"', 2, 1.5, 3.0), ('Té verde', 1, 0.1, 0.1),
+         ('Pan', -1, 2.25, -2.25))
+GROUPS = {'Product': {'Pan': [1, -1, -2.25], 'Té verde': [1, 1, 0.1]}}
+
+
+class TestReportWriter(unittest.TestCase):
+    """Pruebas unitarias para ReportWriter en cada formato."""
+
+    def setUp(self):
+        """Crea el directorio temporal de los reportes."""
+        # pylint: disable=consider-using-with
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Elimina el directorio temporal."""
+        self.folder.cleanup()
+
+    def write(self, fmt, lines=LINES, groups=None):
+        """Escribe lines con ReportWriter en formato fmt y retorna el
+        contenido del reporte."""
+        path = os.path.join(self.folder.name, 'reporte.' + fmt)
+        writer = ReportWriter(path, fmt, buffer_size=16)
+        if lines:
+            writer.append(lines[0])
+            writer.extend(lines[1:])
+        self.assertEqual(len(writer), len(lines))
+        writer.close(0.85, 0.0123, groups)
+        self.assertEqual(os.listdir(self.folder.name), ['reporte.' + fmt])
+        with open(path, encoding='utf-8', newline='') as file:
+            return file.read()
+
+    def test_texto_igual_a_format_output(self):
+        """Verifica que el reporte de texto es el de format_output, sin
+        espacios de relleno."""
+        for lines, groups in ((LINES, None), (LINES, GROUPS), ((), None)):
+            self.assertEqual(self.write('text', lines, groups),
+                             format_output(0.85, 0.0123, lines, groups))
+
+    def test_texto_igual_a_resultados(self):
+        """Verifica que los reportes de TC1 a TC3 coinciden byte por byte
+        con los de Resultados."""
+        catalogue = build_price_catalogue(iter_json_array(
+            os.path.join(BASE_DIR, 'TCList', 'TC1.ProductList.json')))
+        path = os.path.join(self.folder.name, 'reporte.txt')
+        for case in ('TC1', 'TC2', 'TC3'):
+            with open(os.path.join(BASE_DIR, 'Resultados',
+                                   f'{case}-SalesResults.txt'),
+                      encoding='utf-8', newline='') as file:
+                expected = file.read()
+            seconds = float(re.search(r'Tiempo: ([\d.]+)',
+                                      expected).group(1))
+            writer = ReportWriter(path)
+            with redirect_stdout(io.StringIO()):
+                total, _ = compute_sales_function(
+                    catalogue, iter_json_array(os.path.join(
+                        BASE_DIR, case, f'{case}.Sales.json')),
+                    results=writer)
+            writer.close(total, seconds)
+            with open(path, encoding='utf-8', newline='') as file:
+                self.assertEqual(file.read(), expected, case)
+
+    def test_csv(self):
+        """Verifica los registros de línea, grupo y total en CSV."""
+        rows = list(csv.DictReader(io.StringIO(self.write('csv',
+                                                          groups=GROUPS))))
+        self.assertEqual([row['type'] for row in rows],
+                         ['line'] * 3 + ['group'] * 2 + ['total'])
+        self.assertEqual(rows[0]['product'], 'Caja, "grande"')
+        self.assertEqual(rows[2]['subtotal'], '-2.25')
+        self.assertEqual(
+            (rows[4]['field'], rows[4]['key'], rows[4]['lines']),
+            ('Product', 'Té verde', '1'))
+        self.assertEqual((rows[5]['lines'], rows[5]['total'],
+                          rows[5]['seconds']), ('3', '0.85', '0.0123'))
+
+    def test_jsonl(self):
+        """Verifica los registros de línea, grupo y total en JSON
+        Lines."""
+        records = [json.loads(line) for line in
+                   self.write('jsonl', groups=GROUPS).splitlines()]
+        self.assertEqual(records[1], {'type': 'line', 'product': 'Té verde',
+                                      'quantity': 1, 'price': 0.1,
+                                      'subtotal': 0.1})
+        self.assertEqual(records[3], {'type': 'group', 'field': 'Product',
+                                      'key': 'Pan', 'lines': 1,
+                                      'quantity': -1, 'subtotal': -2.25})
+        self.assertEqual(records[-1], {'type': 'total', 'lines': 3,
+                                       'total': 0.85, 'seconds': 0.0123})
+
+    def test_clear(self):
+        """Verifica que clear descarta las líneas en cada formato."""
+        for fmt in ('text', 'csv', 'jsonl'):
+            path = os.path.join(self.folder.name, 'reporte.' + fmt)
+            writer = ReportWriter(path, fmt)
+            writer.extend(LINES)
+            writer.clear()
+            writer.extend(LINES[:1])
+            writer.close(3.0, 0.0)
+            expected = os.path.join(self.folder.name, 'esperado.' + fmt)
+            writer = ReportWriter(expected, fmt)
+            writer.extend(LINES[:1])
+            writer.close(3.0, 0.0)
+            with open(path, encoding='utf-8') as actual, \
+                    open(expected, encoding='utf-8') as file:
+                self.assertEqual(actual.read(), file.read(), fmt)
+
+    def test_discard(self):
+        """Verifica que discard no deja archivos."""
+        for fmt in ('text', 'csv', 'jsonl'):
+            writer = ReportWriter(os.path.join(self.folder.name, 'r'), fmt)
+            writer.extend(LINES)
+            writer.discard()
+            self.assertEqual(os.listdir(self.folder.name), [])
+
+
+class TestPrintReport(unittest.TestCase):
+    """Pruebas unitarias para los modos de consola de print_report."""
+
+    def setUp(self):
+        """Escribe un reporte de texto en un directorio temporal."""
+        # pylint: disable=consider-using-with
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'SalesResults.txt')
+        writer = ReportWriter(self.path)
+        writer.extend(LINES)
+        writer.close(0.85, 0.0123)
+
+    def tearDown(self):
+        """Elimina el directorio temporal."""
+        self.folder.cleanup()
+
+    def console(self, mode):
+        """Retorna lo que print_report muestra en el modo indicado."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_report(self.path, 0.85, 0.0123, mode)
+        return output.getvalue()
+
+    def test_full(self):
+        """Verifica que 'full' muestra el reporte completo."""
+        self.assertEqual(self.console('full'),
+                         format_output(0.85, 0.0123, LINES) + '\n')
+
+    def test_summary(self):
+        """Verifica que 'summary' muestra sólo el total y la ruta."""
+        self.assertEqual(self.console('summary'),
+                         "TOTAL: $0.85\nTiempo: 0.0123 segundos\n"
+                         f"Reporte: {self.path}\n")
+
+    def test_quiet(self):
+        """Verifica que 'quiet' no muestra nada."""
+        self.assertEqual(self.console('quiet'), '')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Fachada asyncio para el sistema de reservaciones.
+
+AsyncReservationService envía todas las modificaciones a una sola tarea
+escritora. Las solicitudes que llegan dentro de una ventana corta se
+agrupan en una transacción que se aplica en un hilo aparte y se guarda
+con una sola escritura, de modo que el ciclo de eventos nunca espera por
+el disco. Las consultas de hoteles, clientes y reservaciones se
+responden desde la copia en memoria del almacén.
+
+Cada servicio usa su propio almacén (el de ``data_file`` o, por
+omisión, el compartido) sin cambiar ``storage.DATA_FILE``: las
+operaciones de Hotel, Customer y Reservation se ejecutan dentro de
+``storage.use_store``.
+"""
+
+import asyncio
+
+import storage
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation
+
+
+WINDOW = 0.002
+MAX_BATCH = 512
+
+
+class AsyncReservationService:
+    """Servicio asyncio con una tarea escritora que agrupa escrituras."""
+
+    def __init__(self, data_file=None, window=WINDOW, max_batch=MAX_BATCH):
+        if data_file is None:
+            self.store = storage.shared_store()
+        else:
+            self.store = storage.get_store(data_file)
+        self.window = window
+        self.max_batch = max_batch
+        self.stats = {"requests": 0, "batches": 0}
+        self._queue = None
+        self._writer = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        """Carga el almacén y arranca la tarea escritora."""
+        await asyncio.to_thread(self.store.get, "hotels", None)
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        """Espera a que se apliquen las solicitudes pendientes y termina."""
+        if self._writer is None:
+            return
+        await self._queue.put(None)
+        await self._writer
+        self._writer = None
+
+    async def submit(self, action, *args, **kwargs):
+        """Encola una modificación y espera su resultado."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, action, args, kwargs))
+        return await future
+
+    async def _write_loop(self):
+        """Agrupa las solicitudes de cada ventana y las aplica juntas."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            group = [item]
+            deadline = loop.time() + self.window
+            while len(group) < self.max_batch:
+                timeout = deadline - loop.time()
+                try:
+                    if timeout > 0:
+                        item = await asyncio.wait_for(self._queue.get(),
+                                                      timeout)
+                    else:
+                        item = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                group.append(item)
+            try:
+                outcomes = await asyncio.to_thread(self._apply, group)
+            except Exception as e:  # pylint: disable=broad-except
+                outcomes = [(False, e)] * len(group)
+            for (future, _, _, _), (ok, value) in zip(group, outcomes):
+                if future.cancelled():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _apply(self, group):
+        """Aplica un grupo de modificaciones en una sola transacción.
+
+        Si otro proceso escribió antes de guardar (StaleDataError), el
+        almacén ya descartó el grupo; cada solicitud se reintenta una vez
+        en su propia transacción y sólo las que vuelven a chocar fallan.
+        """
+        with storage.use_store(self.store):
+            try:
+                outcomes = self._apply_group(group)
+            except storage.StaleDataError:
+                outcomes = [self._apply_alone(item) for item in group]
+        self.stats["requests"] += len(group)
+        self.stats["batches"] += 1
+        return outcomes
+
+    def _apply_group(self, group):
+        """Aplica las solicitudes en una transacción; cada una dentro de un
+        savepoint, de modo que una excepción sólo deshace sus cambios.
+        """
+        outcomes = []
+        with self.store.transaction():
+            for _, action, args, kwargs in group:
+                try:
+                    with self.store.savepoint():
+                        outcomes.append((True, action(*args, **kwargs)))
+                except Exception as e:  # pylint: disable=broad-except
+                    outcomes.append((False, e))
+        return outcomes
+
+    def _apply_alone(self, item):
+        """Aplica una sola solicitud en su propia transacción."""
+        try:
+            return self._apply_group([item])[0]
+        except storage.StaleDataError as e:
+            return False, e
+
+    def _call(self, function, *args):
+        """Ejecuta una consulta de las clases sobre el almacén del
+        servicio."""
+        with storage.use_store(self.store):
+            return function(*args)
+
+    async def create_hotel(self, hotel_id, name, location, rooms):
+        """Crea un hotel."""
+        return await self.submit(Hotel.create, hotel_id, name, location,
+                                 rooms)
+
+    async def modify_hotel(self, hotel_id, **kwargs):
+        """Modifica un hotel."""
+        return await self.submit(Hotel.modify, hotel_id, **kwargs)
+
+    async def delete_hotel(self, hotel_id):
+        """Elimina un hotel."""
+        return await self.submit(Hotel.delete, hotel_id)
+
+    async def create_customer(self, customer_id, name, email, phone=""):
+        """Registra un cliente."""
+        return await self.submit(Customer.create, customer_id, name, email,
+                                 phone)
+
+    async def modify_customer(self, customer_id, **kwargs):
+        """Modifica un cliente."""
+        return await self.submit(Customer.modify, customer_id, **kwargs)
+
+    async def delete_customer(self, customer_id):
+        """Elimina un cliente."""
+        return await self.submit(Customer.delete, customer_id)
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    async def create_reservation(self, reservation_id, customer_id,
+                                 hotel_id, check_in, check_out):
+        """Crea una reservación."""
+        return await self.submit(Reservation.create, reservation_id,
+                                 customer_id, hotel_id, check_in, check_out)
+
+    async def cancel_reservation(self, reservation_id):
+        """Cancela una reservación."""
+        return await self.submit(Reservation.cancel, reservation_id)
+
+    def get_hotel(self, hotel_id):
+        """Retorna el hotel desde la memoria, o None."""
+        record = self.store.peek("hotels", hotel_id)
+        return Hotel(**record) if record else None
+
+    def get_customer(self, customer_id):
+        """Retorna el cliente desde la memoria, o None."""
+        record = self.store.peek("customers", customer_id)
+        return Customer(**record) if record else None
+
+    def get_reservation(self, reservation_id):
+        """Retorna la reservación desde la memoria, o None."""
+        record = self.store.peek("reservations", reservation_id)
+        return Reservation(**record) if record else None
+
+    async def available_rooms_between(self, hotel_id, check_in, check_out):
+        """Retorna las habitaciones libres de un hotel en un rango."""
+        return await asyncio.to_thread(self._call,
+                                       Hotel.available_rooms_between,
+                                       hotel_id, check_in, check_out)
@@ -0,0 +1,118 @@
+"""
+Inventario de habitaciones por fechas.
+
+Para cada hotel se mantiene un árbol de segmentos disperso sobre los días
+del calendario: reservar suma 1 a cada noche del intervalo
+[check_in, check_out) y cancelar resta 1. El árbol responde en O(log D)
+la ocupación máxima dentro de un rango de fechas, de modo que las
+habitaciones libres son ``rooms - ocupación máxima``.
+"""
+
+from datetime import date
+from functools import lru_cache
+
+
+FIRST_DAY = date.min.toordinal()
+LAST_DAY = date.max.toordinal() + 1
+
+
+@lru_cache(maxsize=8192)
+def parse_date(text):
+    """Convierte una fecha 'dd/mm/aaaa' en su número de día ordinal."""
+    day, month, year = text.split("/")
+    return date(int(year), int(month), int(day)).toordinal()
+
+
+def parse_range(check_in, check_out):
+    """Retorna el intervalo de días [inicio, fin) o None si es inválido."""
+    try:
+        start = parse_date(check_in)
+        end = parse_date(check_out)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if end <= start:
+        return None
+    return start, end
+
+
+class OccupancyTree:
+    """Árbol de segmentos disperso con suma y máximo por rangos de días."""
+
+    def __init__(self):
+        self._max = {}
+        self._add = {}
+
+    def add(self, start, end, delta):
+        """Suma delta a la ocupación de cada día en [start, end)."""
+        self._update(1, FIRST_DAY, LAST_DAY, start, end, delta)
+
+    def peak(self, start, end):
+        """Retorna la ocupación máxima de los días en [start, end)."""
+        return self._query(1, FIRST_DAY, LAST_DAY, start, end)
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _update(self, node, low, high, start, end, delta):
+        """Aplica la suma sobre el nodo que cubre [low, high)."""
+        if end <= low or high <= start:
+            return
+        if start <= low and high <= end:
+            self._add[node] = self._add.get(node, 0) + delta
+            self._max[node] = self._max.get(node, 0) + delta
+            return
+        middle = (low + high) // 2
+        self._update(2 * node, low, middle, start, end, delta)
+        self._update(2 * node + 1, middle, high, start, end, delta)
+        self._max[node] = self._add.get(node, 0) + max(
+            self._max.get(2 * node, 0), self._max.get(2 * node + 1, 0))
+
+    def _query(self, node, low, high, start, end):
+        """Retorna el máximo del nodo que cubre [low, high) en el rango."""
+        if end <= low or high <= start:
+            return 0
+        if start <= low and high <= end:
+            return self._max.get(node, 0)
+        middle = (low + high) // 2
+        return self._add.get(node, 0) + max(
+            self._query(2 * node, low, middle, start, end),
+            self._query(2 * node + 1, middle, high, start, end))
+
+
+class AvailabilityIndex:
+    """Índice de ocupación por fechas con un árbol por hotel."""
+
+    def __init__(self):
+        self.trees = {}
+
+    def rebuild(self, data):
+        """Reconstruye los árboles recorriendo todas las reservaciones."""
+        self.trees = {}
+        for record in data["reservations"].values():
+            self.update("reservations", None, None, record)
+
+    def update(self, collection, key, old, new):
+        """Ajusta la ocupación según el cambio de una reservación."""
+        # pylint: disable=unused-argument
+        if collection != "reservations":
+            return
+        self._apply(old, -1)
+        self._apply(new, 1)
+
+    def _apply(self, record, delta):
+        """Suma delta a las noches de una reservación activa."""
+        if record is None or record.get("status") != "activa":
+            return
+        nights = parse_range(record.get("check_in"), record.get("check_out"))
+        if nights is None:
+            return
+        hotel_id = record.get("hotel_id")
+        tree = self.trees.get(hotel_id)
+        if tree is None:
+            tree = self.trees[hotel_id] = OccupancyTree()
+        tree.add(nights[0], nights[1], delta)
+
+    def peak(self, hotel_id, start, end):
+        """Retorna la ocupación máxima de un hotel en [start, end)."""
+        tree = self.trees.get(hotel_id)
+        if tree is None:
+            return 0
+        return tree.peak(start, end)
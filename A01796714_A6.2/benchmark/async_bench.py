@@ -0,0 +1,133 @@
+"""
+Benchmark de carga para AsyncReservationService.
+
+Simula clientes concurrentes que reservan al mismo tiempo y compara la
+latencia (p50, p95, p99) de dos estrategias:
+
+    directo  : cada solicitud llama a Reservation.create en un hilo y
+               guarda el archivo por su cuenta.
+    servicio : las solicitudes pasan por AsyncReservationService, que
+               agrupa las escrituras de cada ventana.
+
+Uso:
+    python benchmark/async_bench.py [--clients N] [--requests M]
+        [--window segundos] [--data-file ruta]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+import storage
+from async_service import AsyncReservationService
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation
+
+
+def percentile(values, fraction):
+    """Retorna el percentil indicado (0 a 1) de una lista de valores."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+def reset(path, clients):
+    """Crea un archivo nuevo con un hotel y un cliente por cliente."""
+    storage.DATA_FILE = path
+    storage.close_store(path)
+    for suffix in ("", ".lock"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    service = AsyncReservationService(path)
+    Hotel.create("H1", "Hotel", "MX", 10 ** 9)
+    Customer.create_many([
+        {"customer_id": f"C{c}", "name": f"Cliente {c}",
+         "email": f"c{c}@example.com"}
+        for c in range(clients)
+    ])
+    return service
+
+
+async def run_clients(book, clients, requests):
+    """Ejecuta los clientes y retorna las latencias y el tiempo total."""
+    latencies = []
+
+    async def client(number):
+        for i in range(requests):
+            start = time.perf_counter()
+            await book(f"R{number}-{i}", f"C{number}")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    return latencies, time.perf_counter() - start
+
+
+async def direct(path, clients, requests):
+    """Mide la estrategia directa: un guardado por solicitud."""
+    reset(path, clients)
+
+    async def book(reservation_id, customer_id):
+        await asyncio.to_thread(Reservation.create, reservation_id,
+                                customer_id, "H1", "10/04/2026",
+                                "12/04/2026")
+
+    return await run_clients(book, clients, requests)
+
+
+async def coalesced(path, clients, requests, window):
+    """Mide la estrategia con AsyncReservationService."""
+    service = reset(path, clients)
+    service.window = window
+    async with service:
+        async def book(reservation_id, customer_id):
+            await service.create_reservation(
+                reservation_id, customer_id, "H1", "10/04/2026",
+                "12/04/2026")
+
+        result = await run_clients(book, clients, requests)
+    return result + (service.stats["batches"],)
+
+
+def report(name, latencies, elapsed, writes):
+    """Imprime las métricas de una estrategia."""
+    print(f"{name:<10} p50 {percentile(latencies, 0.50) * 1000:8.2f} ms   "
+          f"p95 {percentile(latencies, 0.95) * 1000:8.2f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:8.2f} ms   "
+          f"{len(latencies) / elapsed:9.1f} ops/s   {writes} escrituras")
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--data-file", default="bench_async.json")
+    args = parser.parse_args()
+    path = os.path.abspath(args.data_file)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        latencies, elapsed = asyncio.run(
+            direct(path, args.clients, args.requests))
+    report("directo", latencies, elapsed, len(latencies))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        latencies, elapsed, batches = asyncio.run(
+            coalesced(path, args.clients, args.requests, args.window))
+    report("servicio", latencies, elapsed, batches)
+    storage.close_store(path)
+
+
+if __name__ == "__main__":
+    main()
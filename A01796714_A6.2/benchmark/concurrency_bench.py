@@ -0,0 +1,127 @@
+"""
+Benchmark de reservaciones concurrentes.
+
+Lanza varios procesos que reservan en paralelo sobre el mismo archivo de
+datos, reporta el rendimiento y verifica que ninguna reservación
+confirmada se pierda y que ningún hotel quede sobrevendido.
+
+Uso:
+    python benchmark/concurrency_bench.py [--workers N] [--bookings M]
+        [--hotels H] [--rooms R] [--data-file ruta]
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+import storage
+from availability import parse_range
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation
+
+CHECK_IN = "10/04/2026"
+CHECK_OUT = "15/04/2026"
+
+
+def use_data_file(path):
+    """Apunta Hotel, Customer y Reservation al archivo del benchmark."""
+    storage.DATA_FILE = path
+
+
+def prepare(path, hotels, rooms):
+    """Crea un archivo nuevo con los hoteles y un cliente."""
+    shutil.rmtree(path, ignore_errors=True)
+    for suffix in ("", ".lock", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    use_data_file(path)
+    Hotel.create_many([
+        {"hotel_id": f"H{h}", "name": f"Hotel {h}", "location": "MX",
+         "rooms": rooms}
+        for h in range(hotels)
+    ])
+    Customer.create("C1", "Benchmark", "bench@example.com")
+    storage.close_store(path)
+
+
+def worker(args):
+    """Intenta reservar y retorna los IDs de las reservaciones logradas."""
+    path, number, bookings, hotels = args
+    use_data_file(path)
+    confirmed = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(bookings):
+            reservation_id = f"W{number}-{i}"
+            if Reservation.create(reservation_id, "C1", f"H{i % hotels}",
+                                  CHECK_IN, CHECK_OUT):
+                confirmed.append(reservation_id)
+    storage.close_store(path)
+    return confirmed
+
+
+def verify(path, confirmed, hotels, rooms):
+    """Retorna la lista de problemas encontrados en el archivo final."""
+    storage.close_store(path)
+    store = storage.get_store(path)
+    problems = []
+    for reservation_id in confirmed:
+        if not store.contains("reservations", reservation_id):
+            problems.append(f"reservación perdida: {reservation_id}")
+    nights = parse_range(CHECK_IN, CHECK_OUT)
+    for h in range(hotels):
+        peak = store.peak_occupancy(f"H{h}", *nights)
+        if peak > rooms:
+            problems.append(f"H{h} sobrevendido: {peak} > {rooms}")
+    return problems
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--bookings", type=int, default=200)
+    parser.add_argument("--hotels", type=int, default=10)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--data-file", default="bench_concurrency.json")
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.data_file)
+    prepare(path, args.hotels, args.rooms)
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        results = pool.map(worker, [
+            (path, number, args.bookings, args.hotels)
+            for number in range(args.workers)
+        ])
+    elapsed = time.perf_counter() - start
+
+    confirmed = [rid for result in results for rid in result]
+    attempts = args.workers * args.bookings
+    problems = verify(path, confirmed, args.hotels, args.rooms)
+
+    print(f"Procesos      : {args.workers}")
+    print(f"Intentos      : {attempts}")
+    print(f"Confirmadas   : {len(confirmed)} "
+          f"(capacidad {args.hotels * args.rooms})")
+    print(f"Tiempo        : {elapsed:.3f} segundos")
+    print(f"Rendimiento   : {attempts / elapsed:.1f} operaciones/segundo")
+    if problems:
+        print("[ERROR] Inconsistencias encontradas:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("Sin sobreventa ni reservaciones perdidas.")
+
+
+if __name__ == "__main__":
+    main()
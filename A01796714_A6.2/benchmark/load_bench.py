@@ -0,0 +1,229 @@
+"""
+Benchmark de carga con operaciones mixtas de lectura y escritura.
+
+Para cada tamaño genera hoteles, clientes y reservaciones sintéticos y
+ejecuta una mezcla de Reservation.get, Hotel.available_rooms,
+Reservation.create y Reservation.cancel con uno o varios procesos sobre
+el mismo archivo de datos. Reporta en JSON, por tamaño y número de
+procesos, el rendimiento total y los percentiles de latencia de cada
+operación, para comparar corridas y detectar regresiones.
+
+Uso:
+    python benchmark/load_bench.py [--sizes 1000,10000,100000]
+        [--workers 1,4] [--operations N]
+        [--mix get=50,available=25,create=20,cancel=5]
+        [--data-file ruta] [--output resultados.json] [--seed S]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+import storage
+from hotel import Hotel
+from reservation import Reservation
+
+FIRST_DAY = date(2026, 1, 1)
+PERCENTILES = (50, 90, 95, 99)
+ROOMS = 1000
+
+
+def use_data_file(path):
+    """Apunta Hotel, Customer y Reservation al archivo del benchmark."""
+    storage.DATA_FILE = path
+
+
+def dimensions(size):
+    """Retorna el número de hoteles y de clientes para size reservaciones."""
+    return max(10, size // 1000), max(10, size // 10)
+
+
+def stay(rng):
+    """Retorna fechas de entrada y salida aleatorias dentro de 2026."""
+    check_in = FIRST_DAY + timedelta(days=rng.randrange(360))
+    check_out = check_in + timedelta(days=rng.randint(1, 5))
+    return check_in.strftime("%d/%m/%Y"), check_out.strftime("%d/%m/%Y")
+
+
+def remove_files(path):
+    """Elimina el archivo o directorio de datos y sus auxiliares."""
+    storage.close_store(path)
+    shutil.rmtree(path, ignore_errors=True)
+    for suffix in ("", ".lock", ".journal", ".journal.old", "-wal", "-shm"):
+        if os.path.isfile(path + suffix):
+            os.remove(path + suffix)
+
+
+def seed(path, size, rng):
+    """Crea un almacén nuevo con datos sintéticos de size reservaciones."""
+    remove_files(path)
+    hotels, customers = dimensions(size)
+    store = storage.get_store(path)
+    with store.transaction():
+        for h in range(hotels):
+            store.put("hotels", f"H{h}", {
+                "hotel_id": f"H{h}", "name": f"Hotel {h}",
+                "location": "MX", "rooms": ROOMS})
+        for c in range(customers):
+            store.put("customers", f"C{c}", {
+                "customer_id": f"C{c}", "name": f"Cliente {c}",
+                "email": f"c{c}@example.com", "phone": ""})
+        for r in range(size):
+            check_in, check_out = stay(rng)
+            store.put("reservations", f"R{r}", {
+                "reservation_id": f"R{r}",
+                "customer_id": f"C{rng.randrange(customers)}",
+                "hotel_id": f"H{rng.randrange(hotels)}",
+                "check_in": check_in, "check_out": check_out,
+                "status": "activa"})
+    storage.close_store(path)
+
+
+def parse_mix(text):
+    """Convierte 'get=50,create=20' en una lista de (operación, peso)."""
+    mix = []
+    for part in text.split(","):
+        name, weight = part.split("=")
+        mix.append((name.strip(), int(weight)))
+    return mix
+
+
+def run_operation(name, number, i, size, rng, created):
+    """Ejecuta una operación del benchmark."""
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    hotels, customers = dimensions(size)
+    if name == "get":
+        Reservation.get(f"R{rng.randrange(size)}")
+    elif name == "available":
+        Hotel.available_rooms(f"H{rng.randrange(hotels)}")
+    elif name == "create":
+        reservation_id = f"L{number}-{i}"
+        check_in, check_out = stay(rng)
+        if Reservation.create(reservation_id, f"C{rng.randrange(customers)}",
+                              f"H{rng.randrange(hotels)}", check_in,
+                              check_out):
+            created.append(reservation_id)
+    elif name == "cancel":
+        if created:
+            Reservation.cancel(created.pop())
+        else:
+            Reservation.cancel(f"R{rng.randrange(size)}")
+    else:
+        raise ValueError(f"Operación desconocida: {name}")
+
+
+def worker(args):
+    """Ejecuta la mezcla de operaciones y retorna sus latencias."""
+    path, number, size, operations, mix, base_seed = args
+    use_data_file(path)
+    rng = random.Random(base_seed * 1000 + number)
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    latencies = {name: [] for name in names}
+    created = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        Reservation.get("R0")
+        for i, name in enumerate(rng.choices(names, weights,
+                                             k=operations)):
+            start = time.perf_counter()
+            run_operation(name, number, i, size, rng, created)
+            latencies[name].append(time.perf_counter() - start)
+    storage.close_store(path)
+    return latencies
+
+
+def summarize(samples):
+    """Retorna el conteo y los percentiles (en ms) de unas latencias."""
+    samples = sorted(samples)
+    if not samples:
+        return {"count": 0}
+    summary = {"count": len(samples)}
+    for percentile in PERCENTILES:
+        position = max(0, -(-percentile * len(samples) // 100) - 1)
+        summary[f"p{percentile}_ms"] = round(samples[position] * 1000, 4)
+    summary["max_ms"] = round(samples[-1] * 1000, 4)
+    return summary
+
+
+def run(path, size, workers, operations, mix, base_seed):
+    """Ejecuta una corrida y retorna su resultado."""
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    seed(path, size, random.Random(base_seed))
+    jobs = [(path, number, size, operations, mix, base_seed)
+            for number in range(workers)]
+    start = time.perf_counter()
+    if workers == 1:
+        results = [worker(jobs[0])]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(worker, jobs)
+    elapsed = time.perf_counter() - start
+    merged = {}
+    for latencies in results:
+        for name, samples in latencies.items():
+            merged.setdefault(name, []).extend(samples)
+    total = workers * operations
+    return {
+        "size": size,
+        "workers": workers,
+        "operations": total,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_ops": round(total / elapsed, 1),
+        "latency": {name: summarize(samples)
+                    for name, samples in merged.items()},
+    }
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--workers", default="1,4")
+    parser.add_argument("--operations", type=int, default=2000,
+                        help="operaciones por proceso")
+    parser.add_argument("--mix", default="get=50,available=25,"
+                                         "create=20,cancel=5")
+    parser.add_argument("--data-file", default="bench_load.json")
+    parser.add_argument("--output")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.data_file)
+    mix = parse_mix(args.mix)
+    report = {
+        "backend": type(storage.get_store(path)).__name__,
+        "mix": dict(mix),
+        "runs": [],
+    }
+    storage.close_store(path)
+    for size in (int(s) for s in args.sizes.split(",")):
+        for workers in (int(w) for w in args.workers.split(",")):
+            result = run(path, size, workers, args.operations, mix,
+                         args.seed)
+            report["runs"].append(result)
+            print(f"size={size} workers={workers} "
+                  f"{result['throughput_ops']} ops/s", file=sys.stderr)
+    remove_files(path)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark de memoria por reservación.
+
+Construye N reservaciones sintéticas y mide con tracemalloc los bytes por
+reservación de tres representaciones:
+
+    dict         : diccionarios tal como los produce json.load.
+    dict+intern  : diccionarios con los textos repetidos compartidos,
+                   como los deja DataStore al cargar.
+    __slots__    : instancias de Reservation.
+
+Uso:
+    python benchmark/memory_bench.py [--count N] [--hotels H]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from json_store import empty_data, intern_values
+from reservation import Reservation
+
+
+def synthetic_json(count, hotels):
+    """Retorna el texto JSON de un documento con count reservaciones."""
+    data = empty_data()
+    for i in range(count):
+        data["reservations"][f"R{i}"] = {
+            "reservation_id": f"R{i}",
+            "customer_id": f"C{i % 50000}",
+            "hotel_id": f"H{i % hotels}",
+            "check_in": f"{1 + i % 28:02d}/{1 + i % 12:02d}/2026",
+            "check_out": f"{1 + i % 28:02d}/{1 + i % 12:02d}/2027",
+            "status": "activa" if i % 10 else "cancelada",
+        }
+    return json.dumps(data)
+
+
+def measure(build):
+    """Retorna los bytes retenidos por el resultado de build()."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return current
+
+
+def as_dicts(text):
+    """Interpreta el documento sin compartir textos."""
+    return json.loads(text)
+
+
+def as_interned(text):
+    """Interpreta el documento y comparte los textos repetidos."""
+    data = json.loads(text)
+    intern_values(data)
+    return data
+
+
+def as_slots(text):
+    """Interpreta el documento y lo convierte en instancias con slots."""
+    data = json.loads(text)
+    intern_values(data)
+    return {key: Reservation(**record)
+            for key, record in data.pop("reservations").items()}
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--hotels", type=int, default=300)
+    args = parser.parse_args()
+
+    text = synthetic_json(args.count, args.hotels)
+    print(f"Reservaciones: {args.count}")
+    for name, build in (("dict", as_dicts), ("dict+intern", as_interned),
+                        ("__slots__", as_slots)):
+        used = measure(lambda build=build: build(text))
+        print(f"{name:<12} {used / args.count:8.1f} bytes/reservación   "
+              f"{used / 2 ** 20:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark del tiempo hasta la primera consulta: JSON contra binario.
+
+Para cada tamaño genera un documento sintético, lo guarda como JSON con
+sangría (DataStore) y como snapshot binario (BinaryStore), y mide el
+tiempo que tarda un almacén nuevo en responder su primera consulta
+(lectura del archivo, interpretación y búsqueda de una reservación).
+
+Uso:
+    python benchmark/startup_bench.py [--counts 10000,100000,1000000]
+                                      [--repeat R]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from binary_store import BinaryStore, encode_snapshot
+from json_store import DataStore, empty_data, intern_values, write_atomic
+
+
+def synthetic_data(count, hotels=300):
+    """Retorna un documento con count reservaciones y sus referencias."""
+    data = empty_data()
+    for i in range(hotels):
+        data["hotels"][f"H{i}"] = {"hotel_id": f"H{i}", "name": f"Hotel {i}",
+                                   "location": "CDMX", "rooms": 500}
+    for i in range(min(count, 50000)):
+        data["customers"][f"C{i}"] = {"customer_id": f"C{i}",
+                                      "name": f"Cliente {i}",
+                                      "email": f"c{i}@mail.com",
+                                      "phone": ""}
+    for i in range(count):
+        data["reservations"][f"R{i}"] = {
+            "reservation_id": f"R{i}",
+            "customer_id": f"C{i % 50000}",
+            "hotel_id": f"H{i % hotels}",
+            "check_in": f"{1 + i % 28:02d}/{1 + i % 12:02d}/2026",
+            "check_out": f"{1 + i % 28:02d}/{1 + i % 12:02d}/2027",
+            "status": "activa" if i % 10 else "cancelada",
+        }
+    return data
+
+
+def first_query(factory, path, repeat):
+    """Retorna el mejor tiempo de un almacén nuevo hasta su primer get."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        store = factory(path)
+        store.get("reservations", "R0")
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del store
+    return best
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--counts", default="10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'registros':>10} {'formato':>8} {'MiB':>8} {'primera (s)':>12}")
+    with tempfile.TemporaryDirectory() as folder:
+        for count in (int(c) for c in args.counts.split(",")):
+            data = synthetic_data(count)
+            intern_values(data)
+            json_path = os.path.join(folder, f"datos-{count}.json")
+            bin_path = os.path.join(folder, f"datos-{count}.bin")
+            write_atomic(json_path, json.dumps(data, indent=4))
+            write_atomic(bin_path, encode_snapshot(data))
+            del data
+            for name, factory, path in (("json", DataStore, json_path),
+                                        ("binario", BinaryStore, bin_path)):
+                elapsed = first_query(factory, path, args.repeat)
+                size = os.path.getsize(path) / 2 ** 20
+                print(f"{count:>10} {name:>8} {size:8.1f} {elapsed:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Almacén de datos con un snapshot binario (pickle, protocolo 5).
+
+El documento completo se guarda con pickle en lugar de JSON con sangría:
+el archivo es más pequeño, los textos que se repiten se guardan una sola
+vez y la carga no tiene que interpretar texto. El archivo se lee a través
+de un mapa de memoria (mmap), sin copiarlo antes a un objeto bytes.
+
+Pickle puede ejecutar código al cargar, por lo que este formato sólo debe
+usarse con archivos generados por el propio sistema.
+
+La versión JSON legible sigue disponible con los comandos::
+
+    python binary_store.py export datos.bin datos.json
+    python binary_store.py import datos.json datos.bin
+"""
+
+import argparse
+import json
+import mmap
+import os
+import pickle
+
+from json_store import (COLLECTIONS, DataStore, empty_data, intern_values,
+                        write_atomic)
+
+
+PROTOCOL = 5
+
+
+def encode_snapshot(data):
+    """Serializa el documento completo en bytes."""
+    return pickle.dumps(data, protocol=PROTOCOL)
+
+
+def decode_snapshot(path):
+    """Lee un snapshot binario a través de un mapa de memoria."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("El archivo está vacío.")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return pickle.loads(view)
+
+
+class BinaryStore(DataStore):
+    """DataStore que guarda su documento como snapshot binario."""
+
+    def _read(self):
+        """Lee el snapshot y aplica las bitácoras.
+
+        Pickle guarda una sola vez cada texto compartido y lo restaura
+        compartido, así que sólo hay que compartir los textos de nuevo si
+        se reprodujo alguna bitácora.
+        """
+        data = self._read_snapshot()
+        journals = [path for path in (self.rotated_path, self.journal_path)
+                    if os.path.exists(path)]
+        for path in journals:
+            self._replay(data, path)
+        if journals:
+            intern_values(data)
+        return data
+
+    def _read_snapshot(self):
+        """Lee el snapshot binario completo."""
+        if not os.path.exists(self.path):
+            return empty_data()
+        try:
+            data = decode_snapshot(self.path)
+            if not isinstance(data, dict):
+                raise ValueError(
+                    "El snapshot debe contener un diccionario.")
+        except (pickle.UnpicklingError, EOFError, ValueError) as e:
+            print(f"[ERROR] No se pudo cargar {self.path}: {e}")
+            return empty_data()
+        for name in COLLECTIONS:
+            data.setdefault(name, {})
+        return data
+
+    @staticmethod
+    def _encode(data):
+        """Serializa el documento completo para guardarlo."""
+        return encode_snapshot(data)
+
+
+def export_json(source, target):
+    """Escribe en target la versión JSON legible de un snapshot."""
+    data = BinaryStore(source).load()
+    write_atomic(target, json.dumps(data, indent=4))
+
+
+def import_json(source, target):
+    """Convierte un archivo JSON de datos en un snapshot binario."""
+    data = DataStore(source).load()
+    write_atomic(target, encode_snapshot(data))
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(
+        description="Convierte entre el formato JSON y el binario.")
+    parser.add_argument("command", choices=("export", "import"))
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args()
+    if args.command == "export":
+        export_json(args.source, args.target)
+    else:
+        import_json(args.source, args.target)
+    print(f"{args.source} -> {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Caché LRU de entidades compartida por Hotel, Customer y Reservation.
+
+Guarda las instancias ya construidas por ``get`` con llave
+(archivo, colección, ID). Se suscribe a cada almacén que consulta, de
+modo que ``create``, ``modify``, ``delete`` y ``cancel`` invalidan
+exactamente la entrada afectada, y una escritura de otro proceso, que
+el almacén detecta al refrescarse, invalida todas las entradas de ese
+archivo. Las entidades devueltas son compartidas: no deben modificarse.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+
+CAPACITY = 1024
+
+
+class EntityCache:
+    """Caché LRU acotada de entidades con contadores de uso."""
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._stores = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def get(self, store, collection, key, build):
+        """Retorna la entidad en caché o la construye con build(record).
+
+        Retorna None, sin guardarlo, si el registro no existe.
+        """
+        self._attach(store)
+        store.refresh()
+        cache_key = (store.path, collection, key)
+        with self._lock:
+            entity = self._entries.get(cache_key)
+            if entity is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entity
+            self.misses += 1
+        record = store.get(collection, key)
+        if record is None:
+            return None
+        entity = build(record)
+        with self._lock:
+            self._entries[cache_key] = entity
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entity
+
+    def _attach(self, store):
+        """Se suscribe una sola vez a los cambios de un almacén.
+
+        Las entradas de la misma ruta que dejó un almacén anterior (por
+        ejemplo, uno reemplazado con configure_store) se descartan.
+        """
+        if store in self._stores:
+            return
+        self._stores.add(store)
+        path = store.path
+        self.invalidate_path(path)
+
+        def listener(collection, key):
+            if collection is None:
+                self.invalidate_path(path)
+            else:
+                self.invalidate(path, collection, key)
+
+        store.subscribe(listener)
+
+    def invalidate(self, path, collection, key):
+        """Descarta la entrada de un registro."""
+        with self._lock:
+            self._entries.pop((path, collection, key), None)
+
+    def invalidate_path(self, path):
+        """Descarta todas las entradas de un archivo de datos."""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] == path]:
+                del self._entries[cache_key]
+
+    def clear(self):
+        """Descarta todas las entradas y reinicia los contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Retorna los contadores de aciertos, fallos y desalojos."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "size": len(self._entries),
+                    "capacity": self.capacity}
+
+
+ENTITY_CACHE = EntityCache()
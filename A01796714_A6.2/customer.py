@@ -3,12 +3,14 @@ Clase Customer (Huésped) con las acciones CRUD
 para la información del cliente.
 """
 
-import json
-import os
+from cache import ENTITY_CACHE
+from storage import run_batch, shared_store
 
 
 class Customer:
     """Clase que representa un cliente."""
+    __slots__ = ("customer_id", "name", "email", "phone")
+
     def __init__(self, customer_id, name, email, phone=""):
         self.customer_id = customer_id
         self.name = name
@@ -18,39 +20,64 @@ class Customer:
     @staticmethod
     def create(customer_id, name, email, phone=""):
         """Acción para registrar un nuevo cliente."""
-        data = _load()
-        if customer_id in data["customers"]:
-            print(f"[ERROR] El cliente '{customer_id}' ya existe.")
-            return False
-        data["customers"][customer_id] = {
-            "customer_id": customer_id,
-            "name": name,
-            "email": email,
-            "phone": phone,
-        }
-        _save(data)
+        with _store().transaction() as store:
+            if store.contains("customers", customer_id):
+                print(f"[ERROR] El cliente '{customer_id}' ya existe.")
+                return False
+            store.put("customers", customer_id, {
+                "customer_id": customer_id,
+                "name": name,
+                "email": email,
+                "phone": phone,
+            })
         return True
 
+    @staticmethod
+    def create_many(records):
+        """Acción para registrar varios clientes con una sola escritura.
+
+        records: diccionarios con los argumentos de create. Retorna una
+        lista con el resultado de cada cliente.
+        """
+        return run_batch(_store(), Customer.create, records)
+
+    @staticmethod
+    def delete_many(customer_ids):
+        """Acción para eliminar varios clientes con una sola escritura."""
+        return run_batch(_store(), Customer.delete, customer_ids)
+
+    @staticmethod
+    def modify_many(changes):
+        """Acción para modificar varios clientes con una sola escritura.
+
+        changes: diccionarios con 'customer_id' y los campos a modificar.
+        """
+        return run_batch(_store(), Customer.modify, changes)
+
     @staticmethod
     def delete(customer_id):
         """Acción para eliminar un cliente."""
-        data = _load()
-        if customer_id not in data["customers"]:
-            print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
-            return False
-        del data["customers"][customer_id]
-        _save(data)
+        with _store().transaction() as store:
+            if not store.contains("customers", customer_id):
+                print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
+                return False
+            store.remove("customers", customer_id)
         return True
 
     @staticmethod
     def get(customer_id):
         """Acción para obtener un cliente por su ID."""
-        data = _load()
-        record = data["customers"].get(customer_id)
-        if record is None:
+        entity = ENTITY_CACHE.get(_store(), "customers", customer_id,
+                                  lambda record: Customer(**record))
+        if entity is None:
             print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
-            return None
-        return Customer(**record)
+        return entity
+
+    @staticmethod
+    def iter_all():
+        """Acción para recorrer todos los clientes sin cargarlos a la vez."""
+        for record in _store().records("customers"):
+            yield Customer(**record)
 
     @staticmethod
     def display(customer_id):
@@ -65,42 +92,21 @@ class Customer:
     @staticmethod
     def modify(customer_id, **kwargs):
         """Acción para modificar un cliente existente."""
-        data = _load()
-        if customer_id not in data["customers"]:
-            print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
-            return False
-        allowed = {"name", "email", "phone"}
-        for key, value in kwargs.items():
-            if key in allowed:
-                data["customers"][customer_id][key] = value
-            else:
-                print(f"[ADVERTENCIA] El campo '{key}' no es modificable.")
-        _save(data)
+        with _store().transaction() as store:
+            if not store.contains("customers", customer_id):
+                print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
+                return False
+            record = dict(store.get("customers", customer_id))
+            allowed = {"name", "email", "phone"}
+            for key, value in kwargs.items():
+                if key in allowed:
+                    record[key] = value
+                else:
+                    print(f"[ADVERTENCIA] El campo '{key}' no es modificable.")
+            store.put("customers", customer_id, record)
         return True
 
 
-DATA_FILE = "./test/tc1.json"
-
-
-def _load():
-    """Carga y retorna el diccionario de datos desde un archivo JSON."""
-    if not os.path.exists(DATA_FILE):
-        return {"hotels": {}, "customers": {}, "reservations": {}}
-    try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            raise ValueError("El archivo de datos debe ser un objeto JSON.")
-        return data
-    except (json.JSONDecodeError, ValueError) as e:
-        print(f"[ERROR] No se pudo cargar {DATA_FILE}: {e}")
-        return {"hotels": {}, "customers": {}, "reservations": {}}
-
-
-def _save(data):
-    """Guarda el diccionario de datos en un archivo JSON."""
-    try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
-    except OSError as e:
-        print(f"[ERROR] No se pudo guardar {DATA_FILE}: {e}")
+def _store():
+    """Retorna el almacén compartido asociado a storage.DATA_FILE."""
+    return shared_store()
@@ -3,12 +3,15 @@ Clase Hotel con las acciones CRUD para la información del hotel
  y manejo de las habitaciones disponibles
 """
 
-import json
-import os
+from availability import FIRST_DAY, LAST_DAY, parse_range
+from cache import ENTITY_CACHE
+from storage import run_batch, shared_store
 
 
 class Hotel:
     """Clase que representa un hotel."""
+    __slots__ = ("hotel_id", "name", "location", "rooms")
+
     def __init__(self, hotel_id, name, location, rooms):
         self.hotel_id = hotel_id
         self.name = name
@@ -18,39 +21,64 @@ class Hotel:
     @staticmethod
     def create(hotel_id, name, location, rooms):
         """Acción para crear un nuevo hotel."""
-        data = _load()
-        if hotel_id in data["hotels"]:
-            print(f"[ERROR] El hotel '{hotel_id}' ya existe.")
-            return False
-        data["hotels"][hotel_id] = {
-            "hotel_id": hotel_id,
-            "name": name,
-            "location": location,
-            "rooms": rooms,
-        }
-        _save(data)
+        with _store().transaction() as store:
+            if store.contains("hotels", hotel_id):
+                print(f"[ERROR] El hotel '{hotel_id}' ya existe.")
+                return False
+            store.put("hotels", hotel_id, {
+                "hotel_id": hotel_id,
+                "name": name,
+                "location": location,
+                "rooms": rooms,
+            })
         return True
 
+    @staticmethod
+    def create_many(records):
+        """Acción para crear varios hoteles con una sola escritura.
+
+        records: diccionarios con los argumentos de create. Retorna una
+        lista con el resultado de cada hotel.
+        """
+        return run_batch(_store(), Hotel.create, records)
+
+    @staticmethod
+    def delete_many(hotel_ids):
+        """Acción para eliminar varios hoteles con una sola escritura."""
+        return run_batch(_store(), Hotel.delete, hotel_ids)
+
+    @staticmethod
+    def modify_many(changes):
+        """Acción para modificar varios hoteles con una sola escritura.
+
+        changes: diccionarios con 'hotel_id' y los campos a modificar.
+        """
+        return run_batch(_store(), Hotel.modify, changes)
+
     @staticmethod
     def delete(hotel_id):
         """Acción para eliminar un hotel."""
-        data = _load()
-        if hotel_id not in data["hotels"]:
-            print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
-            return False
-        del data["hotels"][hotel_id]
-        _save(data)
+        with _store().transaction() as store:
+            if not store.contains("hotels", hotel_id):
+                print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
+                return False
+            store.remove("hotels", hotel_id)
         return True
 
     @staticmethod
     def get(hotel_id):
         """Acción para obtener un hotel por su ID."""
-        data = _load()
-        record = data["hotels"].get(hotel_id)
-        if record is None:
+        entity = ENTITY_CACHE.get(_store(), "hotels", hotel_id,
+                                  lambda record: Hotel(**record))
+        if entity is None:
             print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
-            return None
-        return Hotel(**record)
+        return entity
+
+    @staticmethod
+    def iter_all():
+        """Acción para recorrer todos los hoteles sin cargarlos a la vez."""
+        for record in _store().records("hotels"):
+            yield Hotel(**record)
 
     @staticmethod
     def display(hotel_id):
@@ -65,57 +93,54 @@ class Hotel:
     @staticmethod
     def modify(hotel_id, **kwargs):
         """Acción para modificar un hotel."""
-        data = _load()
-        if hotel_id not in data["hotels"]:
-            print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
-            return False
-        allowed = {"name", "location", "rooms"}
-        for key, value in kwargs.items():
-            if key in allowed:
-                data["hotels"][hotel_id][key] = value
-            else:
-                print(f"[ADVERTENCIA] El campo '{key}' no es modificable.")
-        _save(data)
+        with _store().transaction() as store:
+            if not store.contains("hotels", hotel_id):
+                print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
+                return False
+            record = dict(store.get("hotels", hotel_id))
+            allowed = {"name", "location", "rooms"}
+            for key, value in kwargs.items():
+                if key in allowed:
+                    record[key] = value
+                else:
+                    print(f"[ADVERTENCIA] El campo '{key}' no es modificable.")
+            store.put("hotels", hotel_id, record)
         return True
 
     @staticmethod
     def available_rooms(hotel_id):
         """Acción para mostrar las habitaciones disponibles en un hotel.
+
+        Son las habitaciones libres en la noche más ocupada del
+        calendario; reservaciones que no se traslapan ocupan la misma
+        habitación. Nunca es negativo.
         """
-        data = _load()
-        if hotel_id not in data["hotels"]:
+        store = _store()
+        record = store.get("hotels", hotel_id)
+        if record is None:
             print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
             return 0
-        total = data["hotels"][hotel_id]["rooms"]
-        occupied = sum(
-            1 for r in data["reservations"].values()
-            if r["hotel_id"] == hotel_id and r["status"] == "activa"
-        )
-        return total - occupied
-
-
-DATA_FILE = "tc.json"
-
-
-def _load():
-    """Carga y retorna el diccionario de datos desde un archivo JSON."""
-    if not os.path.exists(DATA_FILE):
-        return {"hotels": {}, "customers": {}, "reservations": {}}
-    try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            raise ValueError("El archivo de datos debe ser un JSON.")
-        return data
-    except (json.JSONDecodeError, ValueError) as e:
-        print(f"[ERROR] No se pudo cargar {DATA_FILE}: {e}")
-        return {"hotels": {}, "customers": {}, "reservations": {}}
-
-
-def _save(data):
-    """Guarda el diccionario de datos en un archivo JSON."""
-    try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
-    except OSError as e:
-        print(f"[ERROR] No se pudo guardar {DATA_FILE}: {e}")
+        peak = store.peak_occupancy(hotel_id, FIRST_DAY, LAST_DAY)
+        return max(0, record["rooms"] - peak)
+
+    @staticmethod
+    def available_rooms_between(hotel_id, check_in, check_out):
+        """Acción para obtener las habitaciones libres de un hotel
+        durante todas las noches entre check_in y check_out.
+        """
+        store = _store()
+        record = store.get("hotels", hotel_id)
+        if record is None:
+            print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
+            return 0
+        nights = parse_range(check_in, check_out)
+        if nights is None:
+            print(f"[ERROR] Fechas inválidas: '{check_in}' - '{check_out}'.")
+            return 0
+        peak = store.peak_occupancy(hotel_id, *nights)
+        return max(0, record["rooms"] - peak)
+
+
+def _store():
+    """Retorna el almacén compartido asociado a storage.DATA_FILE."""
+    return shared_store()
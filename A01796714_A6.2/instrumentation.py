@@ -0,0 +1,241 @@
+"""
+Medición de tiempos en las rutas críticas del sistema de reservaciones.
+
+``enable()`` envuelve la lectura y escritura de los almacenes, las
+consultas de ocupación y los métodos públicos de Hotel, Customer y
+Reservation con un temporizador; ``disable()`` restaura las funciones
+originales. Mientras está desactivado no queda ningún envoltorio, por lo
+que el costo es nulo.
+
+Por cada operación se guardan un contador, el tiempo total y un
+histograma de latencias con cubetas en potencias de 2 microsegundos.
+Además se pueden registrar ganchos hook(nombre, segundos) y capturar un
+perfil con cProfile.
+
+Ejemplo::
+
+    import instrumentation
+    instrumentation.enable(profile=True)
+    ...
+    instrumentation.dump(sys.stdout)
+    instrumentation.dump_profile("perfil.prof")
+    instrumentation.disable()
+"""
+
+import cProfile
+import functools
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from binary_store import BinaryStore
+from customer import Customer
+from hotel import Hotel
+from json_store import DataStore
+from reservation import Reservation
+from sharded_store import ShardedStore
+from sqlite_store import SQLiteStore
+
+
+BUCKETS = 27
+
+TARGETS = (
+    (DataStore, "_read", "store.read"),
+    (BinaryStore, "_read", "store.read"),
+    (DataStore, "_write", "store.write"),
+    (ShardedStore, "_write", "store.write"),
+    (DataStore, "_append_journal", "store.journal"),
+    (DataStore, "commit", "store.commit"),
+    (SQLiteStore, "commit", "store.commit"),
+    (DataStore, "peak_occupancy", "index.peak_occupancy"),
+    (SQLiteStore, "peak_occupancy", "index.peak_occupancy"),
+) + tuple(
+    (entity, name, f"{entity.__name__.lower()}.{name}")
+    for entity, names in (
+        (Hotel, ("create", "modify", "delete", "get", "available_rooms",
+                 "available_rooms_between", "create_many", "modify_many",
+                 "delete_many")),
+        (Customer, ("create", "modify", "delete", "get", "create_many",
+                    "modify_many", "delete_many")),
+        (Reservation, ("create", "cancel", "get", "find", "create_many",
+                       "cancel_many")),
+    )
+    for name in names
+)
+
+
+class Metrics:
+    """Contadores e histogramas de latencia por operación."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.operations = {}
+
+    def record(self, name, elapsed):
+        """Agrega una medición en segundos a la operación indicada."""
+        bucket = min(int(elapsed * 1e6).bit_length(), BUCKETS - 1)
+        with self._lock:
+            entry = self.operations.get(name)
+            if entry is None:
+                entry = self.operations[name] = {
+                    "count": 0, "total": 0.0, "max": 0.0,
+                    "histogram": [0] * BUCKETS}
+            entry["count"] += 1
+            entry["total"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+            entry["histogram"][bucket] += 1
+
+    def reset(self):
+        """Descarta todas las mediciones."""
+        with self._lock:
+            self.operations = {}
+
+    @staticmethod
+    def _percentile(histogram, count, percentile):
+        """Retorna el límite superior, en ms, de la cubeta del percentil."""
+        target = percentile * count / 100
+        seen = 0
+        for bucket, hits in enumerate(histogram):
+            seen += hits
+            if hits and seen >= target:
+                return (1 << bucket) / 1000
+        return 0.0
+
+    def snapshot(self):
+        """Retorna un resumen de las mediciones listo para JSON."""
+        with self._lock:
+            operations = {name: dict(entry, histogram=list(entry["histogram"]))
+                          for name, entry in self.operations.items()}
+        summary = {}
+        for name, entry in sorted(operations.items()):
+            count = entry["count"]
+            summary[name] = {
+                "count": count,
+                "total_ms": round(entry["total"] * 1000, 3),
+                "mean_ms": round(entry["total"] * 1000 / count, 4),
+                "max_ms": round(entry["max"] * 1000, 4),
+                "p50_ms": self._percentile(entry["histogram"], count, 50),
+                "p99_ms": self._percentile(entry["histogram"], count, 99),
+                "histogram_us": {
+                    f"<{1 << bucket}": hits
+                    for bucket, hits in enumerate(entry["histogram"])
+                    if hits},
+            }
+        return summary
+
+
+METRICS = Metrics()
+_HOOKS = []
+_ORIGINALS = {}
+_PROFILER = []
+
+
+def _emit(name, elapsed):
+    """Registra una medición y la pasa a los ganchos."""
+    METRICS.record(name, elapsed)
+    for hook in _HOOKS:
+        hook(name, elapsed)
+
+
+def _timed(func, name):
+    """Retorna func envuelta con un temporizador.
+
+    En los generadores se mide el recorrido completo, no su creación.
+    """
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                yield from func(*args, **kwargs)
+            finally:
+                _emit(name, time.perf_counter() - start)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _emit(name, time.perf_counter() - start)
+    return wrapper
+
+
+@contextmanager
+def measure(name):
+    """Mide un bloque de código arbitrario con el nombre indicado."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _emit(name, time.perf_counter() - start)
+
+
+def enabled():
+    """Indica si la medición está activa."""
+    return bool(_ORIGINALS)
+
+
+def enable(profile=False):
+    """Instala los temporizadores y, opcionalmente, inicia cProfile."""
+    if not _ORIGINALS:
+        for owner, attribute, name in TARGETS:
+            original = vars(owner)[attribute]
+            _ORIGINALS[(owner, attribute)] = original
+            if isinstance(original, staticmethod):
+                wrapped = staticmethod(_timed(original.__func__, name))
+            else:
+                wrapped = _timed(original, name)
+            setattr(owner, attribute, wrapped)
+    if profile:
+        if not _PROFILER:
+            _PROFILER.append(cProfile.Profile())
+        _PROFILER[0].enable()
+
+
+def disable():
+    """Restaura las funciones originales y detiene cProfile."""
+    for (owner, attribute), original in _ORIGINALS.items():
+        setattr(owner, attribute, original)
+    _ORIGINALS.clear()
+    if _PROFILER:
+        _PROFILER[0].disable()
+
+
+def add_hook(hook):
+    """Registra hook(nombre, segundos), llamado en cada medición."""
+    _HOOKS.append(hook)
+
+
+def remove_hook(hook):
+    """Quita un gancho registrado con add_hook."""
+    _HOOKS.remove(hook)
+
+
+def dump(stream=None):
+    """Retorna el resumen de las mediciones y lo escribe como JSON en
+    stream, si se indica.
+    """
+    summary = METRICS.snapshot()
+    if stream is not None:
+        json.dump(summary, stream, indent=2)
+        stream.write("\n")
+    return summary
+
+
+def dump_profile(path):
+    """Guarda el perfil de cProfile en path; retorna False si no hay."""
+    if not _PROFILER:
+        return False
+    _PROFILER[0].dump_stats(path)
+    return True
+
+
+def reset():
+    """Descarta las mediciones y el perfil capturado."""
+    METRICS.reset()
+    if _PROFILER:
+        _PROFILER.pop().disable()
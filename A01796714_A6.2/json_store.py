@@ -0,0 +1,488 @@
+"""
+Almacén de datos respaldado por un archivo JSON.
+
+Mantiene en memoria el documento JSON ya interpretado y sólo lo vuelve
+a leer cuando cambia la fecha de modificación o el tamaño del archivo.
+
+En modo bitácora (journal) cada cambio se agrega como una línea al
+archivo ``<DATA_FILE>.journal`` y el documento completo sólo se reescribe
+al compactar, en segundo plano, cuando la bitácora supera un umbral.
+
+Entre procesos, las escrituras se coordinan con un candado ``fcntl``
+sobre ``<DATA_FILE>.lock``, que además guarda un contador de versión:
+una escritura hecha sobre una versión que ya no es la vigente se
+rechaza con StaleDataError. Sólo ``transaction()`` mantiene el candado
+desde la lectura hasta la escritura; quien escribe fuera de ella debe
+capturar StaleDataError y volver a aplicar sus cambios.
+"""
+
+import json
+import os
+import sys
+import threading
+from contextlib import ExitStack, contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sin fcntl
+    fcntl = None
+
+from availability import AvailabilityIndex
+from queries import ReservationIndex
+
+
+COLLECTIONS = ("hotels", "customers", "reservations")
+COMPACT_BYTES = 1024 * 1024
+SHARED_FIELDS = ("customer_id", "hotel_id", "check_in", "check_out",
+                 "status")
+
+
+def empty_data():
+    """Retorna la estructura vacía del documento de datos."""
+    return {name: {} for name in COLLECTIONS}
+
+
+def intern_values(data):
+    """Comparte una sola copia de los textos repetidos en reservaciones.
+
+    ``json`` crea un objeto str por cada aparición de un valor; con
+    millones de reservaciones que repiten hotel, fechas y estado, usar
+    la misma cadena reduce la memoria de forma considerable.
+    """
+    for record in data["reservations"].values():
+        if not isinstance(record, dict):
+            continue
+        for field in SHARED_FIELDS:
+            value = record.get(field)
+            if isinstance(value, str):
+                record[field] = sys.intern(value)
+
+
+def file_signature(path):
+    """Retorna la firma (mtime, tamaño) de un archivo o None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class StaleDataError(Exception):
+    """El archivo cambió desde que se leyó; la operación debe repetirse."""
+
+
+def write_atomic(path, content):
+    """Escribe un archivo temporal y lo renombra sobre el destino.
+
+    content puede ser texto o bytes.
+    """
+    tmp = f"{path}.tmp"
+    binary = isinstance(content, bytes)
+    with open(tmp, "wb" if binary else "w",
+              encoding=None if binary else "utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class DataStore:  # pylint: disable=too-many-instance-attributes
+    """Repositorio en memoria respaldado por un archivo JSON."""
+
+    def __init__(self, path, journal=False, compact_bytes=COMPACT_BYTES):
+        self.path = path
+        self.journal = journal
+        self.compact_bytes = compact_bytes
+        self.journal_path = f"{path}.journal"
+        self.rotated_path = f"{path}.journal.old"
+        self.lock_path = f"{path}.lock"
+        self._data = None
+        self._signature = None
+        self._dirty = False
+        self._pending = []
+        self._lock = threading.RLock()
+        self._compactor = None
+        self._indexes = {}
+        self._listeners = []
+        self._depth = 0
+        self._undo = None
+        self._version = 0
+        self._lock_file = None
+        self._lock_depth = 0
+
+    def _stat(self):
+        """Retorna la firma conjunta del archivo, bitácoras y versión."""
+        return (file_signature(self.path),
+                file_signature(self.rotated_path),
+                file_signature(self.journal_path),
+                file_signature(self.lock_path))
+
+    @contextmanager
+    def _file_lock(self):
+        """Toma el candado exclusivo entre procesos; es reentrante."""
+        with self._lock:
+            if self._lock_depth == 0:
+                # pylint: disable=consider-using-with
+                self._lock_file = open(self.lock_path, "a+",
+                                       encoding="utf-8")
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield self._lock_file
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _read_version(self):
+        """Lee el contador de versión guardado en el archivo de candado."""
+        try:
+            with open(self.lock_path, "r", encoding="utf-8") as f:
+                return int(f.read() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _bump_version(self):
+        """Incrementa el contador de versión; requiere el candado."""
+        self._version += 1
+        self._lock_file.seek(0)
+        self._lock_file.truncate()
+        self._lock_file.write(str(self._version))
+        self._lock_file.flush()
+
+    def _read(self):
+        """Lee el archivo JSON completo y aplica las bitácoras."""
+        data = self._read_snapshot()
+        self._replay(data, self.rotated_path)
+        self._replay(data, self.journal_path)
+        intern_values(data)
+        return data
+
+    def _read_snapshot(self):
+        """Lee e interpreta el archivo JSON completo."""
+        if not os.path.exists(self.path):
+            return empty_data()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError(
+                    "El archivo de datos debe ser un objeto JSON.")
+        except (json.JSONDecodeError, ValueError) as e:
+            print(f"[ERROR] No se pudo cargar {self.path}: {e}")
+            return empty_data()
+        for name in COLLECTIONS:
+            data.setdefault(name, {})
+        return data
+
+    @staticmethod
+    def _replay(data, path):
+        """Aplica sobre data las operaciones registradas en una bitácora."""
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                try:
+                    entry = json.loads(line)
+                    collection = data[entry["c"]]
+                    if entry["op"] == "put":
+                        collection[entry["k"]] = entry["v"]
+                    else:
+                        collection.pop(entry["k"], None)
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    print(f"[ADVERTENCIA] Línea {number} de {path} "
+                          f"ignorada: {e}")
+
+    @staticmethod
+    def _encode(data):
+        """Serializa el documento completo para guardarlo."""
+        return json.dumps(data, indent=4)
+
+    def _write(self, data):
+        """Escribe el documento completo de forma atómica."""
+        write_atomic(self.path, self._encode(data))
+
+    def _append_journal(self):
+        """Agrega a la bitácora las operaciones pendientes."""
+        lines = "".join(
+            json.dumps(entry, separators=(",", ":")) + "\n"
+            for entry in self._pending
+        )
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending = []
+
+    def load(self):
+        """Retorna el documento, releyéndolo sólo si el archivo cambió."""
+        with self._lock:
+            if self._data is None:
+                self._signature = self._stat()
+                self._reload()
+            elif not self._dirty and not self._depth:
+                signature = self._stat()
+                if signature != self._signature:
+                    self._signature = signature
+                    self._reload()
+            return self._data
+
+    def _reload(self):
+        """Relee el documento y reconstruye los índices registrados."""
+        self._version = self._read_version()
+        self._data = self._read()
+        for index in self._indexes.values():
+            index.rebuild(self._data)
+        for listener in self._listeners:
+            listener(None, None)
+
+    def refresh(self):
+        """Vuelve a leer el documento si otro proceso lo modificó."""
+        self.load()
+
+    def subscribe(self, listener):
+        """Registra listener(collection, key), que se llama en cada cambio
+        de un registro y con (None, None) cuando se relee el documento.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def index(self, name, factory):
+        """Retorna el índice registrado con ese nombre, creándolo si falta.
+
+        ``factory`` construye el índice, que se reconstruye una sola vez
+        aquí y cada vez que el documento se vuelve a leer del disco.
+        """
+        with self._lock:
+            data = self.load()
+            index = self._indexes.get(name)
+            if index is None:
+                index = self._indexes[name] = factory()
+                index.rebuild(data)
+            return index
+
+    def _notify(self, collection, key, old, new):
+        """Informa a los índices registrados del cambio de un registro."""
+        for index in self._indexes.values():
+            index.update(collection, key, old, new)
+        for listener in self._listeners:
+            listener(collection, key)
+
+    def get(self, collection, key):
+        """Retorna el registro con la llave indicada o None."""
+        return self.load()[collection].get(key)
+
+    def peek(self, collection, key):
+        """Retorna el registro en memoria sin candados ni releer el disco.
+
+        Pensado para lectores que no deben bloquearse; los cambios de otros
+        procesos se ven hasta la siguiente lectura normal.
+        """
+        data = self._data
+        if data is None:
+            return self.get(collection, key)
+        return data[collection].get(key)
+
+    def contains(self, collection, key):
+        """Indica si existe un registro con la llave indicada."""
+        return key in self.load()[collection]
+
+    def records(self, collection):
+        """Itera sobre los registros de una colección."""
+        return iter(self.load()[collection].values())
+
+    def put(self, collection, key, record):
+        """Inserta o reemplaza un registro y marca el documento como sucio."""
+        with self._lock:
+            records = self.load()[collection]
+            old = records.get(key)
+            records[key] = record
+            self._notify(collection, key, old, record)
+            self._dirty = True
+            if self._undo is not None:
+                self._undo.append((collection, key, old))
+            if self.journal:
+                self._pending.append(
+                    {"op": "put", "c": collection, "k": key, "v": record})
+
+    def remove(self, collection, key):
+        """Elimina un registro y marca el documento como sucio."""
+        with self._lock:
+            old = self.load()[collection].pop(key)
+            self._notify(collection, key, old, None)
+            self._dirty = True
+            if self._undo is not None:
+                self._undo.append((collection, key, old))
+            if self.journal:
+                self._pending.append(
+                    {"op": "del", "c": collection, "k": key})
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa varias operaciones en una sola escritura.
+
+        El candado entre procesos se mantiene desde la lectura hasta la
+        escritura, de modo que ningún otro proceso puede intercalar sus
+        cambios. El documento se valida una vez al entrar; dentro del
+        bloque cada ``commit`` se pospone hasta salir del bloque más
+        externo. Si el bloque lanza una excepción los cambios se descartan.
+
+        Si el candado no se puede tomar, el bloque se ejecuta igual y el
+        error se informa al guardar, descartando los cambios.
+        """
+        with self._lock, ExitStack() as stack:
+            try:
+                stack.enter_context(self._file_lock())
+            except OSError:
+                pass  # commit informa el error al intentar guardar
+            self.load()
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if not self._depth:
+                    self.rollback()
+                raise
+            self._depth -= 1
+            if not self._depth:
+                self.commit()
+
+    @contextmanager
+    def savepoint(self):
+        """Deshace sólo los cambios del bloque si éste lanza una excepción.
+
+        Se usa dentro de ``transaction()`` para que una operación que
+        falla a la mitad no deje escrita una parte de sus cambios en la
+        transacción que la contiene. Cada put y remove del bloque guarda
+        el registro anterior, que se restaura en orden inverso.
+        """
+        with self._lock:
+            outer, self._undo = self._undo, []
+            try:
+                yield self
+            except BaseException:
+                undo, self._undo = self._undo, None
+                for collection, key, old in reversed(undo):
+                    if old is None:
+                        self.remove(collection, key)
+                    else:
+                        self.put(collection, key, old)
+                raise
+            finally:
+                undo, self._undo = self._undo, outer
+                if outer is not None and undo is not None:
+                    outer.extend(undo)
+
+    def rollback(self):
+        """Descarta los cambios pendientes y vuelve a leer del disco."""
+        with self._lock:
+            self._pending = []
+            self._dirty = False
+            self._data = None
+
+    def commit(self):
+        """Escribe los cambios sólo si hay cambios pendientes.
+
+        Lanza StaleDataError, descartando los cambios, si otro proceso
+        escribió después de la última lectura. No se reintenta: el
+        documento se vuelve a leer en el siguiente acceso y quien llama
+        debe repetir la operación, de preferencia dentro de
+        ``transaction()``, donde no puede ocurrir. Si no se puede
+        escribir (OSError) se informa el error y también se descartan
+        los cambios, para no mostrar datos que no están en el disco.
+        """
+        with self._lock:
+            if not self._dirty or self._depth:
+                return
+            try:
+                self._commit_locked()
+            except OSError as e:
+                print(f"[ERROR] No se pudo guardar {self.path}: {e}")
+                self.rollback()
+                return
+            if self.journal and self._signature[2][1] >= self.compact_bytes:
+                self.compact(background=True)
+
+    def _commit_locked(self):
+        """Valida la versión y escribe los cambios bajo el candado."""
+        with self._file_lock():
+            version = self._read_version()
+            if version != self._version:
+                self.rollback()
+                raise StaleDataError(
+                    f"{self.path} cambió (versión {version}, "
+                    f"se esperaba {self._version}).")
+            if self.journal:
+                self._append_journal()
+            else:
+                self._write(self._data)
+            self._bump_version()
+            self._dirty = False
+            self._signature = self._stat()
+
+    def compact(self, background=False):
+        """Integra la bitácora en el archivo JSON principal.
+
+        La bitácora actual se renombra y se toma una copia superficial de
+        las colecciones; los registros nunca se modifican en sitio, por lo
+        que la copia puede serializarse fuera del candado.
+        """
+        if not background:
+            self.commit()
+            self.wait()
+        with self._lock, self._file_lock():
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            data = self.load()
+            snapshot = {name: dict(value) if isinstance(value, dict) else value
+                        for name, value in data.items()}
+            if (os.path.exists(self.journal_path)
+                    and not os.path.exists(self.rotated_path)):
+                os.replace(self.journal_path, self.rotated_path)
+            self._signature = self._stat()
+        if background:
+            self._compactor = threading.Thread(
+                target=self._finish_compaction, args=(snapshot,),
+                daemon=True)
+            self._compactor.start()
+        else:
+            self._finish_compaction(snapshot)
+
+    def _finish_compaction(self, snapshot):
+        """Escribe la copia del documento y descarta la bitácora rotada."""
+        content = self._encode(snapshot)
+        with self._lock, self._file_lock():
+            try:
+                write_atomic(self.path, content)
+                if os.path.exists(self.rotated_path):
+                    os.remove(self.rotated_path)
+            except OSError as e:
+                print(f"[ERROR] No se pudo compactar {self.path}: {e}")
+            self._signature = self._stat()
+
+    def peak_occupancy(self, hotel_id, start, end):
+        """Retorna la ocupación máxima de un hotel en [start, end)."""
+        index = self.index("availability", AvailabilityIndex)
+        return index.peak(hotel_id, start, end)
+
+    def query_reservations(self, filters, first_day=None, last_day=None):
+        """Itera las reservaciones que cumplen los filtros exactos y el
+        rango de días de entrada, en orden de entrada y de ID.
+        """
+        index = self.index("reservations", ReservationIndex)
+        return index.find(self.load()["reservations"], filters,
+                          first_day, last_day)
+
+    def close(self):
+        """Escribe los cambios pendientes y espera a la compactación."""
+        self.commit()
+        self.wait()
+
+    def wait(self):
+        """Espera a que termine la compactación en segundo plano."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
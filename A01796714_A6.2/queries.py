@@ -0,0 +1,161 @@
+"""
+Índices secundarios y consultas sobre las reservaciones.
+
+ReservationIndex mantiene, para el almacén JSON, las reservaciones por
+cliente, por hotel y por estado, además de todas ellas, en listas ya
+ordenadas por fecha de entrada e ID (SortedKeys). Una consulta recorre
+sólo el rango de fechas de la lista más pequeña que corresponde a sus
+filtros, de modo que el historial de un cliente se obtiene sin recorrer
+ni ordenar todas las reservaciones.
+
+Los resultados se ordenan por fecha de entrada y después por ID en todos
+los almacenes, para que la paginación sea estable.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from availability import parse_date
+
+
+FILTERS = ("customer_id", "hotel_id", "status")
+CHUNK = 256
+LAST_KEY = chr(0x10FFFF)
+
+
+def check_in_day(record):
+    """Retorna el día ordinal de entrada de un registro, o 0 si no tiene."""
+    try:
+        return parse_date(record.get("check_in"))
+    except (ValueError, TypeError, AttributeError):
+        return 0
+
+
+class SortedKeys:
+    """Lista ordenada de pares (día, ID) repartida en bloques.
+
+    Insertar o eliminar sólo desplaza los elementos de un bloque de a lo
+    más 2 * CHUNK, en lugar de los de toda la lista como insort.
+    """
+
+    def __init__(self, entries=()):
+        entries = sorted(entries)
+        self._chunks = [entries[i:i + CHUNK]
+                        for i in range(0, len(entries), CHUNK)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._len = len(entries)
+
+    def __len__(self):
+        return self._len
+
+    def add(self, entry):
+        """Inserta un par conservando el orden."""
+        self._len += 1
+        if not self._chunks:
+            self._chunks.append([entry])
+            self._maxes.append(entry)
+            return
+        position = min(bisect_left(self._maxes, entry),
+                       len(self._maxes) - 1)
+        chunk = self._chunks[position]
+        insort(chunk, entry)
+        self._maxes[position] = chunk[-1]
+        if len(chunk) > 2 * CHUNK:
+            self._chunks[position:position + 1] = [chunk[:CHUNK],
+                                                   chunk[CHUNK:]]
+            self._maxes[position:position + 1] = [chunk[CHUNK - 1],
+                                                  chunk[-1]]
+
+    def discard(self, entry):
+        """Elimina un par si está en la lista."""
+        position = bisect_left(self._maxes, entry)
+        if position == len(self._maxes):
+            return
+        chunk = self._chunks[position]
+        offset = bisect_left(chunk, entry)
+        if chunk[offset] != entry:
+            return
+        del chunk[offset]
+        self._len -= 1
+        if chunk:
+            self._maxes[position] = chunk[-1]
+        else:
+            del self._chunks[position]
+            del self._maxes[position]
+
+    def between(self, first_day=None, last_day=None):
+        """Itera en orden los pares cuyo día está en [first_day, last_day].
+
+        Cada bloque se copia al llegar a él, de modo que modificar el
+        índice mientras se itera no salta ni repite pares de ese bloque.
+        """
+        low = None if first_day is None else (first_day,)
+        high = None if last_day is None else (last_day, LAST_KEY)
+        start = 0 if low is None else bisect_left(self._maxes, low)
+        for chunk in self._chunks[start:]:
+            if high is not None and chunk[0] > high:
+                return
+            begin = 0 if low is None else bisect_left(chunk, low)
+            end = len(chunk) if high is None else bisect_right(chunk, high)
+            yield from chunk[begin:end]
+            low = None
+
+
+class ReservationIndex:
+    """Índices por cliente, hotel, estado y fecha de entrada."""
+
+    def __init__(self):
+        self.lists = {name: {} for name in FILTERS}
+        self.by_check_in = SortedKeys()
+
+    def rebuild(self, data):
+        """Reconstruye los índices recorriendo todas las reservaciones."""
+        groups = {name: {} for name in FILTERS}
+        entries = []
+        for key, record in data["reservations"].items():
+            entry = (check_in_day(record), key)
+            entries.append(entry)
+            for name in FILTERS:
+                groups[name].setdefault(record.get(name), []).append(entry)
+        self.lists = {name: {value: SortedKeys(members)
+                             for value, members in values.items()}
+                      for name, values in groups.items()}
+        self.by_check_in = SortedKeys(entries)
+
+    def update(self, collection, key, old, new):
+        """Ajusta los índices según el cambio de una reservación."""
+        if collection != "reservations":
+            return
+        if old is not None:
+            entry = (check_in_day(old), key)
+            for name in FILTERS:
+                members = self.lists[name].get(old.get(name))
+                if members is not None:
+                    members.discard(entry)
+                    if not members:
+                        del self.lists[name][old.get(name)]
+            self.by_check_in.discard(entry)
+        if new is not None:
+            entry = (check_in_day(new), key)
+            for name in FILTERS:
+                members = self.lists[name].get(new.get(name))
+                if members is None:
+                    members = self.lists[name][new.get(name)] = SortedKeys()
+                members.add(entry)
+            self.by_check_in.add(entry)
+
+    def find(self, records, filters, first_day=None, last_day=None):
+        """Itera, en orden de entrada, las reservaciones que cumplen.
+
+        records: diccionario de reservaciones del almacén.
+        filters: valores exactos por campo de FILTERS.
+        first_day, last_day: días ordinales de entrada, inclusivos.
+        """
+        candidates = [self.lists[name].get(value, SortedKeys())
+                      for name, value in filters.items()]
+        keys = min(candidates, key=len) if candidates else self.by_check_in
+        for _, key in keys.between(first_day, last_day):
+            record = records.get(key)
+            if record is not None and all(
+                    record.get(name) == value
+                    for name, value in filters.items()):
+                yield record
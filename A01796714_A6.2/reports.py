@@ -0,0 +1,194 @@
+"""
+Reportes de ocupación y cancelaciones por hotel.
+
+ReportIndex se registra en el almacén como cualquier otro índice, de modo
+que Reservation.create y Reservation.cancel lo actualizan al guardar.
+Por hotel mantiene el número de reservaciones por estado y, para las
+activas, el cambio de ocupación en cada día (+1 al entrar, -1 al salir).
+Con eso un reporte cuesta O(hoteles × días con cambios) y no recorre las
+reservaciones.
+
+Los registros no tienen precios, así que no se reportan ingresos.
+
+Uso:
+    python reports.py datos.json 01/01/2026 01/02/2026 [--format csv]
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import date
+
+from availability import parse_range
+from storage import get_store, shared_store
+
+
+FIELDS = ("hotel_id", "name", "rooms", "reservations", "active",
+          "cancelled", "cancellation_ratio", "room_nights",
+          "occupancy_rate", "peak")
+
+
+class ReportIndex:
+    """Agregados incrementales por hotel para los reportes."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.changes = {}
+
+    def rebuild(self, data):
+        """Reconstruye los agregados recorriendo todas las reservaciones."""
+        self.statuses = {}
+        self.changes = {}
+        for record in data["reservations"].values():
+            self.update("reservations", None, None, record)
+
+    def update(self, collection, key, old, new):
+        """Ajusta los agregados según el cambio de una reservación."""
+        # pylint: disable=unused-argument
+        if collection != "reservations":
+            return
+        self._apply(old, -1)
+        self._apply(new, 1)
+
+    def _apply(self, record, delta):
+        """Suma delta al estado y, si está activa, a sus noches."""
+        if record is None:
+            return
+        hotel_id = record.get("hotel_id")
+        statuses = self.statuses.setdefault(hotel_id, {})
+        status = record.get("status")
+        statuses[status] = statuses.get(status, 0) + delta
+        if status != "activa":
+            return
+        nights = parse_range(record.get("check_in"), record.get("check_out"))
+        if nights is None:
+            return
+        changes = self.changes.setdefault(hotel_id, {})
+        for day, step in ((nights[0], delta), (nights[1], -delta)):
+            changes[day] = changes.get(day, 0) + step
+            if not changes[day]:
+                del changes[day]
+
+    def count(self, hotel_id, status):
+        """Retorna el número de reservaciones de un hotel en un estado."""
+        return self.statuses.get(hotel_id, {}).get(status, 0)
+
+    def total(self, hotel_id):
+        """Retorna el número de reservaciones de un hotel."""
+        return sum(self.statuses.get(hotel_id, {}).values())
+
+    def nights(self, hotel_id, start, end):
+        """Itera (día, habitaciones ocupadas) para cada noche de
+        [start, end).
+        """
+        changes = self.changes.get(hotel_id, {})
+        occupied = sum(step for day, step in changes.items() if day < start)
+        for day in range(start, end):
+            occupied += changes.get(day, 0)
+            yield day, occupied
+
+
+def _store():
+    """Retorna el almacén compartido asociado a storage.DATA_FILE."""
+    return shared_store()
+
+
+def _index(store):
+    """Retorna el índice de reportes vigente de un almacén."""
+    store.refresh()
+    return store.index("reports", ReportIndex)
+
+
+def occupancy_curve(hotel_id, check_in, check_out, store=None):
+    """Itera (fecha, habitaciones ocupadas) por noche de un hotel.
+
+    Retorna un iterador vacío si el rango de fechas es inválido.
+    """
+    nights = parse_range(check_in, check_out)
+    if nights is None:
+        print(f"[ERROR] Rango de fechas inválido: {check_in} - {check_out}")
+        return
+    index = _index(store or _store())
+    for day, occupied in index.nights(hotel_id, *nights):
+        yield date.fromordinal(day).strftime("%d/%m/%Y"), occupied
+
+
+def hotel_report(hotel_id, check_in, check_out, store=None):
+    """Retorna el reporte de un hotel para las noches del rango, o None."""
+    store = store or _store()
+    nights = parse_range(check_in, check_out)
+    hotel = store.get("hotels", hotel_id)
+    if nights is None or hotel is None:
+        print(f"[ERROR] No se puede reportar el hotel {hotel_id} "
+              f"entre {check_in} y {check_out}.")
+        return None
+    index = _index(store)
+    rooms = hotel.get("rooms") or 0
+    room_nights = peak = 0
+    for _, occupied in index.nights(hotel_id, *nights):
+        room_nights += occupied
+        peak = max(peak, occupied)
+    total = index.total(hotel_id)
+    cancelled = index.count(hotel_id, "cancelada")
+    capacity = rooms * (nights[1] - nights[0])
+    return {
+        "hotel_id": hotel_id,
+        "name": hotel.get("name"),
+        "rooms": rooms,
+        "reservations": total,
+        "active": index.count(hotel_id, "activa"),
+        "cancelled": cancelled,
+        "cancellation_ratio": cancelled / total if total else 0.0,
+        "room_nights": room_nights,
+        "occupancy_rate": room_nights / capacity if capacity else 0.0,
+        "peak": peak,
+    }
+
+
+def hotel_reports(check_in, check_out, store=None):
+    """Itera el reporte de cada hotel para las noches del rango."""
+    store = store or _store()
+    for hotel in store.records("hotels"):
+        report = hotel_report(hotel["hotel_id"], check_in, check_out, store)
+        if report is not None:
+            yield report
+
+
+def export_reports(reports, stream, fmt="jsonl"):
+    """Escribe cada reporte en stream conforme se genera.
+
+    fmt: "jsonl" (un objeto JSON por línea) o "csv".
+    Retorna el número de reportes escritos.
+    """
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(report):
+            stream.write(json.dumps(report, ensure_ascii=False) + "\n")
+    count = 0
+    for report in reports:
+        write(report)
+        count += 1
+    return count
+
+
+def main():
+    """Función principal (main)."""
+    parser = argparse.ArgumentParser(
+        description="Reporte de ocupación y cancelaciones por hotel.")
+    parser.add_argument("data_file")
+    parser.add_argument("check_in")
+    parser.add_argument("check_out")
+    parser.add_argument("--format", choices=("jsonl", "csv"),
+                        default="jsonl")
+    args = parser.parse_args()
+    reports = hotel_reports(args.check_in, args.check_out,
+                            get_store(args.data_file))
+    export_reports(reports, sys.stdout, args.format)
+
+
+if __name__ == "__main__":
+    main()
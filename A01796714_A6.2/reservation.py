@@ -1,13 +1,19 @@
 """Clase Reservation con las acciones CRUD
 para la información de las reservaciones y manejo de su estado."""
 
-import json
-import os
+from itertools import islice
+
+from availability import parse_date, parse_range
 from hotel import Hotel
+from cache import ENTITY_CACHE
+from storage import run_batch, shared_store
 
 
 class Reservation:
     """Clase que representa una reservación de hotel."""
+    __slots__ = ("reservation_id", "customer_id", "hotel_id",
+                 "check_in", "check_out", "status")
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, reservation_id, customer_id, hotel_id,
                  check_in, check_out, status="activa"):
@@ -21,64 +27,125 @@ class Reservation:
     @staticmethod
     def create(reservation_id, customer_id, hotel_id, check_in, check_out):
         """Acción para crear una nueva reservación."""
-        data = _load()
-
-        if reservation_id in data["reservations"]:
-            print(f"[ERROR] La reservación '{reservation_id}' ya existe.")
-            return False
-
-        if customer_id not in data["customers"]:
-            print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
-            return False
-
-        if hotel_id not in data["hotels"]:
-            print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
-            return False
-
-        if Hotel.available_rooms(hotel_id) <= 0:
-            print(
-                f"[ERROR] No hay habitaciones disponibles "
-                f"en el hotel '{hotel_id}'."
-            )
-            return False
-
-        data["reservations"][reservation_id] = {
-            "reservation_id": reservation_id,
-            "customer_id": customer_id,
-            "hotel_id": hotel_id,
-            "check_in": check_in,
-            "check_out": check_out,
-            "status": "activa",
-        }
-        _save(data)
+        with _store().transaction() as store:
+
+            if store.contains("reservations", reservation_id):
+                print(f"[ERROR] La reservación '{reservation_id}' ya existe.")
+                return False
+
+            if not store.contains("customers", customer_id):
+                print(f"[ERROR] Cliente '{customer_id}' no encontrado.")
+                return False
+
+            if not store.contains("hotels", hotel_id):
+                print(f"[ERROR] Hotel '{hotel_id}' no encontrado.")
+                return False
+
+            if parse_range(check_in, check_out) is None:
+                print(
+                    f"[ERROR] Fechas inválidas: '{check_in}' - '{check_out}'."
+                )
+                return False
+
+            free = Hotel.available_rooms_between(hotel_id, check_in,
+                                                 check_out)
+            if free <= 0:
+                print(
+                    f"[ERROR] No hay habitaciones disponibles "
+                    f"en el hotel '{hotel_id}' para esas fechas."
+                )
+                return False
+
+            store.put("reservations", reservation_id, {
+                "reservation_id": reservation_id,
+                "customer_id": customer_id,
+                "hotel_id": hotel_id,
+                "check_in": check_in,
+                "check_out": check_out,
+                "status": "activa",
+            })
         return True
 
+    @staticmethod
+    def create_many(records):
+        """Acción para crear varias reservaciones con una sola escritura.
+
+        records: diccionarios con los argumentos de create. Retorna una
+        lista con el resultado de cada reservación.
+        """
+        return run_batch(_store(), Reservation.create, records)
+
+    @staticmethod
+    def cancel_many(reservation_ids):
+        """Acción para cancelar varias reservaciones con una sola escritura.
+        """
+        return run_batch(_store(), Reservation.cancel, reservation_ids)
+
     @staticmethod
     def cancel(reservation_id):
         """Acción para cancelar una reservación."""
-        data = _load()
-        if reservation_id not in data["reservations"]:
-            print(f"[ERROR] Reservación '{reservation_id}' no encontrada.")
-            return False
-        if data["reservations"][reservation_id]["status"] == "cancelada":
-            print(
-                f"[ERROR] La reservación '{reservation_id}' "
-                f"ya está cancelada."
-            )
-            return False
-        data["reservations"][reservation_id]["status"] = "cancelada"
-        _save(data)
+        with _store().transaction() as store:
+            record = store.get("reservations", reservation_id)
+            if record is None:
+                print(
+                    f"[ERROR] Reservación '{reservation_id}' no encontrada."
+                )
+                return False
+            if record["status"] == "cancelada":
+                print(
+                    f"[ERROR] La reservación '{reservation_id}' "
+                    f"ya está cancelada."
+                )
+                return False
+            store.put("reservations", reservation_id,
+                      dict(record, status="cancelada"))
         return True
 
     @staticmethod
     def get(reservation_id):
         """Acción para obtener una reservación por su ID."""
-        data = _load()
-        record = data["reservations"].get(reservation_id)
-        if record is None:
+        entity = ENTITY_CACHE.get(_store(), "reservations", reservation_id,
+                                  lambda record: Reservation(**record))
+        if entity is None:
             print(f"[ERROR] Reservación '{reservation_id}' no encontrada.")
-            return None
-        return Reservation(**record)
+        return entity
+
+    @staticmethod
+    def iter_all():
+        """Acción para recorrer todas las reservaciones sin cargarlas a la
+        vez.
+        """
+        for record in _store().records("reservations"):
+            yield Reservation(**record)
+
+    @staticmethod
+    def find(customer_id=None, hotel_id=None, status=None,
+             check_in_from=None, check_in_to=None, *, offset=0, limit=None):
+        """Acción para buscar reservaciones por cliente, hotel, estado y
+        rango de fechas de entrada (inclusivo), usando índices.
+
+        Es un generador ordenado por fecha de entrada; offset y limit
+        permiten paginar los resultados.
+        """
+        filters = {
+            name: value for name, value in (
+                ("customer_id", customer_id), ("hotel_id", hotel_id),
+                ("status", status))
+            if value is not None
+        }
+        try:
+            first_day = (None if check_in_from is None
+                         else parse_date(check_in_from))
+            last_day = (None if check_in_to is None
+                        else parse_date(check_in_to))
+        except (ValueError, TypeError, AttributeError):
+            print(f"[ERROR] Fechas inválidas: '{check_in_from}' - "
+                  f"'{check_in_to}'.")
+            return
+        records = _store().query_reservations(filters, first_day, last_day)
+        stop = None if limit is None else offset + limit
+        for record in islice(records, offset, stop):
+            yield Reservation(**record)
 
     @staticmethod
     def display(reservation_id):
@@ -93,28 +160,6 @@ class Reservation:
             print(f"Estado       : {res.status}")
 
 
-DATA_FILE = "tc.json"
-
-
-def _load():
-    """Carga y retorna el diccionario de datos desde un archivo JSON."""
-    if not os.path.exists(DATA_FILE):
-        return {"hotels": {}, "customers": {}, "reservations": {}}
-    try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            raise ValueError("El archivo de datos debe ser un objeto JSON.")
-        return data
-    except (json.JSONDecodeError, ValueError) as e:
-        print(f"[ERROR] No se pudo cargar {DATA_FILE}: {e}")
-        return {"hotels": {}, "customers": {}, "reservations": {}}
-
-
-def _save(data):
-    """Guarda el diccionario de datos en un archivo JSON."""
-    try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
-    except OSError as e:
-        print(f"[ERROR] No se pudo guardar {DATA_FILE}: {e}")
+def _store():
+    """Retorna el almacén compartido asociado a storage.DATA_FILE."""
+    return shared_store()
@@ -0,0 +1,214 @@
+"""
+Almacén de datos repartido en varios archivos JSON (shards).
+
+La ruta de datos es un directorio (por convención ``*.shards``) con:
+
+    manifest.json          número de grupos de clientes y archivo de
+                           cada hotel.
+    hotel-<id>.json        el hotel y todas sus reservaciones.
+    customers-<n>.json     los clientes cuyo ID cae en el grupo n según
+                           su CRC32.
+
+En memoria se comporta igual que DataStore, pero al guardar sólo se
+reescriben los archivos que contienen registros modificados, de modo que
+el costo de cada escritura depende del tamaño del hotel afectado y no
+del de toda la cadena. Del mismo modo, cuando otro proceso escribe sólo
+se vuelven a leer los shards cuya firma (mtime, tamaño) cambió; la
+recarga todavía revisa la firma de cada shard y reconstruye los índices
+en memoria sobre el documento completo.
+"""
+
+import hashlib
+import json
+import os
+import re
+import zlib
+
+from json_store import DataStore, empty_data, file_signature, write_atomic
+
+
+CUSTOMER_BUCKETS = 16
+SAFE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def read_shard(path):
+    """Lee un archivo de shard y retorna su documento parcial."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"El shard {path} debe ser un objeto JSON.")
+    return data
+
+
+def hotel_shard(hotel_id):
+    """Retorna el nombre del archivo de shard de un hotel."""
+    text = str(hotel_id)
+    if SAFE_ID.fullmatch(text):
+        return f"hotel-{text}.json"
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+    return f"hotel-~{digest}.json"
+
+
+class ShardedStore(DataStore):
+    """DataStore que guarda cada hotel y cada grupo de clientes aparte."""
+
+    def __init__(self, path, customer_buckets=CUSTOMER_BUCKETS,
+                 journal=False):
+        if journal:
+            raise ValueError(
+                "ShardedStore no admite el modo bitácora: cada escritura "
+                "ya sólo reescribe los shards modificados.")
+        super().__init__(path)
+        self.manifest_path = os.path.join(path, "manifest.json")
+        self.customer_buckets = customer_buckets
+        self._members = {}
+        self._signatures = {}
+        self._dirty_shards = set()
+        self._manifest_dirty = False
+
+    def _stat(self):
+        """Retorna la firma del manifiesto y del contador de versión."""
+        return (file_signature(self.manifest_path),
+                file_signature(self.lock_path))
+
+    def shard_of(self, collection, key, record):
+        """Retorna el nombre del shard que guarda un registro."""
+        if collection == "customers":
+            bucket = zlib.crc32(str(key).encode("utf-8"))
+            return f"customers-{bucket % self.customer_buckets}.json"
+        if collection == "hotels":
+            return hotel_shard(key)
+        return hotel_shard(record.get("hotel_id"))
+
+    def shard_paths(self):
+        """Retorna las rutas de todos los shards, p. ej. para procesarlos
+        en paralelo con read_shard.
+        """
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(
+            os.path.join(self.path, name) for name in os.listdir(self.path)
+            if name.endswith(".json") and name != "manifest.json")
+
+    def _read_snapshot(self):
+        """Lee el manifiesto y los shards que cambiaron desde la última
+        lectura; los registros de los demás shards se conservan de la
+        copia en memoria.
+
+        Se arman colecciones nuevas en lugar de modificar las de la copia
+        actual, que sigue siendo válida si la lectura falla. Un shard que
+        desaparece entre listar el directorio y abrirlo se trata como
+        eliminado.
+        """
+        if self._data is None:
+            data = empty_data()
+            members = {}
+            previous = {}
+        else:
+            data = {name: dict(records)
+                    for name, records in self._data.items()}
+            members = dict(self._members)
+            previous = self._signatures
+        self._dirty_shards = set()
+        self._manifest_dirty = False
+        try:
+            customer_buckets = self.customer_buckets
+            try:
+                manifest = read_shard(self.manifest_path)
+                customer_buckets = manifest.get("customer_buckets",
+                                                customer_buckets)
+            except FileNotFoundError:
+                pass
+            signatures = {os.path.basename(path): file_signature(path)
+                          for path in self.shard_paths()}
+            changed = sorted(
+                shard for shard in set(signatures) | set(previous)
+                if signatures.get(shard) != previous.get(shard))
+            for shard in changed:
+                for collection, key in members.pop(shard, ()):
+                    data[collection].pop(key, None)
+            for shard in changed:
+                if signatures.get(shard) is None:
+                    signatures.pop(shard, None)
+                    continue
+                try:
+                    content = read_shard(os.path.join(self.path, shard))
+                except FileNotFoundError:
+                    del signatures[shard]
+                    continue
+                shard_members = members[shard] = set()
+                for collection, records in content.items():
+                    data.setdefault(collection, {}).update(records)
+                    shard_members.update((collection, key)
+                                         for key in records)
+        except (json.JSONDecodeError, ValueError) as e:
+            print(f"[ERROR] No se pudo cargar {self.path}: {e}")
+            self._members = {}
+            self._signatures = {}
+            return empty_data()
+        self.customer_buckets = customer_buckets
+        self._members = members
+        self._signatures = signatures
+        return data
+
+    def _track(self, collection, key, record, present):
+        """Registra en qué shard está (o deja de estar) un registro."""
+        shard = self.shard_of(collection, key, record)
+        members = self._members.setdefault(shard, set())
+        if present:
+            members.add((collection, key))
+        else:
+            members.discard((collection, key))
+        self._dirty_shards.add(shard)
+        if collection == "hotels":
+            self._manifest_dirty = True
+
+    def put(self, collection, key, record):
+        """Inserta o reemplaza un registro y marca su shard como sucio."""
+        with self._lock:
+            old = self.load()[collection].get(key)
+            if old is not None:
+                self._track(collection, key, old, False)
+            super().put(collection, key, record)
+            self._track(collection, key, record, True)
+
+    def remove(self, collection, key):
+        """Elimina un registro y marca su shard como sucio."""
+        with self._lock:
+            old = self.load()[collection][key]
+            super().remove(collection, key)
+            self._track(collection, key, old, False)
+
+    def rollback(self):
+        """Descarta los cambios pendientes y vuelve a leer los shards."""
+        with self._lock:
+            super().rollback()
+            self._dirty_shards = set()
+            self._manifest_dirty = False
+
+    def _write(self, data):
+        """Escribe sólo los shards modificados y el manifiesto si cambió."""
+        os.makedirs(self.path, exist_ok=True)
+        for shard in sorted(self._dirty_shards):
+            members = self._members.get(shard, set())
+            path = os.path.join(self.path, shard)
+            if not members:
+                if os.path.exists(path):
+                    os.remove(path)
+                self._signatures.pop(shard, None)
+                continue
+            content = {}
+            for collection, key in sorted(members):
+                content.setdefault(collection, {})[key] = (
+                    data[collection][key])
+            write_atomic(path, json.dumps(content, indent=4))
+            self._signatures[shard] = file_signature(path)
+        if self._manifest_dirty or not os.path.exists(self.manifest_path):
+            manifest = {
+                "customer_buckets": self.customer_buckets,
+                "hotels": {hotel_id: hotel_shard(hotel_id)
+                           for hotel_id in data["hotels"]},
+            }
+            write_atomic(self.manifest_path, json.dumps(manifest, indent=4))
+        self._dirty_shards = set()
+        self._manifest_dirty = False
@@ -0,0 +1,274 @@
+"""
+Almacén de datos respaldado por una base de datos SQLite.
+
+Cada colección es una tabla con índices sobre ``hotel_id``,
+``customer_id`` y ``status``, de modo que las búsquedas por llave y el
+conteo de ocupación son consultas indexadas en lugar de leer un archivo
+completo. La base de datos se abre en modo WAL.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from availability import parse_range
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hotels (
+    hotel_id TEXT PRIMARY KEY,
+    name TEXT,
+    location TEXT,
+    rooms INTEGER
+);
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    name TEXT,
+    email TEXT,
+    phone TEXT
+);
+CREATE TABLE IF NOT EXISTS reservations (
+    reservation_id TEXT PRIMARY KEY,
+    customer_id TEXT,
+    hotel_id TEXT,
+    check_in TEXT,
+    check_out TEXT,
+    status TEXT,
+    start_day INTEGER,
+    end_day INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_reservations_hotel
+    ON reservations (hotel_id, status, start_day);
+CREATE INDEX IF NOT EXISTS idx_reservations_customer
+    ON reservations (customer_id);
+CREATE INDEX IF NOT EXISTS idx_reservations_status
+    ON reservations (status);
+CREATE INDEX IF NOT EXISTS idx_reservations_check_in
+    ON reservations (start_day);
+"""
+
+COLUMNS = {
+    "hotels": ("hotel_id", "name", "location", "rooms"),
+    "customers": ("customer_id", "name", "email", "phone"),
+    "reservations": ("reservation_id", "customer_id", "hotel_id",
+                     "check_in", "check_out", "status"),
+}
+
+
+class SQLiteStore:
+    """Repositorio con la misma interfaz que DataStore sobre SQLite."""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._listeners = []
+        self._indexes = {}
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self):
+        """Retorna el contador que SQLite incrementa cuando otra conexión
+        confirma cambios.
+        """
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _notify(self, collection, key):
+        """Informa a los suscriptores del cambio de un registro."""
+        for listener in self._listeners:
+            listener(collection, key)
+
+    def refresh(self):
+        """Avisa a los suscriptores si otra conexión modificó la base."""
+        version = self._read_data_version()
+        if version != self._data_version:
+            self._data_version = version
+            self._indexes = {}
+            self._notify(None, None)
+
+    def subscribe(self, listener):
+        """Registra listener(collection, key), que se llama en cada cambio
+        de un registro y con (None, None) si otra conexión escribió.
+        """
+        self._listeners.append(listener)
+
+    def index(self, name, factory):
+        """Retorna el índice registrado con ese nombre, creándolo si falta.
+
+        Igual que en DataStore, el índice se construye con todos los
+        registros y después se actualiza en cada put y remove. Se descarta
+        al deshacer una transacción o si otra conexión escribió.
+        """
+        with self._lock:
+            index = self._indexes.get(name)
+            if index is None:
+                data = {collection: {record[columns[0]]: record
+                                     for record in self.records(collection)}
+                        for collection, columns in COLUMNS.items()}
+                index = self._indexes[name] = factory()
+                index.rebuild(data)
+            return index
+
+    def _update_indexes(self, collection, key, old, new):
+        """Informa a los índices registrados del cambio de un registro."""
+        for index in self._indexes.values():
+            index.update(collection, key, old, new)
+
+    def _row_to_record(self, collection, row):
+        """Convierte una fila de la tabla en un diccionario."""
+        return dict(zip(COLUMNS[collection], row))
+
+    def get(self, collection, key):
+        """Retorna el registro con la llave indicada o None."""
+        columns = COLUMNS[collection]
+        row = self._conn.execute(
+            f"SELECT {', '.join(columns)} FROM {collection} "
+            f"WHERE {columns[0]} = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return self._row_to_record(collection, row)
+
+    def peek(self, collection, key):
+        """Equivale a get; SQLite ya sirve las lecturas desde su caché."""
+        return self.get(collection, key)
+
+    def contains(self, collection, key):
+        """Indica si existe un registro con la llave indicada."""
+        row = self._conn.execute(
+            f"SELECT 1 FROM {collection} "
+            f"WHERE {COLUMNS[collection][0]} = ?", (key,)).fetchone()
+        return row is not None
+
+    def records(self, collection):
+        """Itera sobre los registros de una colección."""
+        columns = COLUMNS[collection]
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(columns)} FROM {collection}")
+        for row in cursor:
+            yield self._row_to_record(collection, row)
+
+    def put(self, collection, key, record):
+        """Inserta o reemplaza un registro dentro de la transacción."""
+        old = self.get(collection, key) if self._indexes else None
+        columns = COLUMNS[collection]
+        values = [key] + [record.get(name) for name in columns[1:]]
+        if collection == "reservations":
+            columns = columns + ("start_day", "end_day")
+            nights = parse_range(record.get("check_in"),
+                                 record.get("check_out"))
+            values += list(nights) if nights else [None, None]
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {collection} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})", values)
+        self._update_indexes(collection, key, old, record)
+        self._notify(collection, key)
+
+    def remove(self, collection, key):
+        """Elimina un registro dentro de la transacción."""
+        old = self.get(collection, key) if self._indexes else None
+        self._conn.execute(
+            f"DELETE FROM {collection} "
+            f"WHERE {COLUMNS[collection][0]} = ?", (key,))
+        self._update_indexes(collection, key, old, None)
+        self._notify(collection, key)
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa varias operaciones en una sola transacción de SQLite.
+
+        La transacción se abre con BEGIN IMMEDIATE para tomar el candado
+        de escritura antes de validar, igual que el candado del almacén
+        JSON.
+        """
+        with self._lock:
+            if not self._depth and not self._conn.in_transaction:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if not self._depth:
+                    self.rollback()
+                raise
+            self._depth -= 1
+            if not self._depth:
+                self.commit()
+
+    @contextmanager
+    def savepoint(self):
+        """Deshace sólo los cambios del bloque si éste lanza una excepción,
+        con un SAVEPOINT de SQLite dentro de la transacción abierta.
+        """
+        with self._lock:
+            self._conn.execute("SAVEPOINT action")
+            try:
+                yield self
+            except BaseException:
+                self._conn.execute("ROLLBACK TO action")
+                self._conn.execute("RELEASE action")
+                self._indexes = {}
+                self._notify(None, None)
+                raise
+            self._conn.execute("RELEASE action")
+
+    def rollback(self):
+        """Descarta la transacción abierta."""
+        self._conn.rollback()
+        self._indexes = {}
+        self._notify(None, None)
+
+    def commit(self):
+        """Confirma la transacción abierta, salvo dentro de transaction()."""
+        if self._conn.in_transaction and not self._depth:
+            self._conn.commit()
+
+    def peak_occupancy(self, hotel_id, start, end):
+        """Retorna la ocupación máxima de un hotel en los días [start, end).
+
+        Sólo se leen las reservaciones activas que se traslapan con el
+        rango y se recorren sus extremos en orden (barrido de línea).
+        """
+        rows = self._conn.execute(
+            "SELECT start_day, end_day FROM reservations "
+            "WHERE hotel_id = ? AND status = 'activa' "
+            "AND start_day < ? AND end_day > ?", (hotel_id, end, start))
+        events = []
+        for first, last in rows:
+            events.append((max(first, start), 1))
+            events.append((min(last, end), -1))
+        events.sort()
+        occupied = peak = 0
+        for _, delta in events:
+            occupied += delta
+            peak = max(peak, occupied)
+        return peak
+
+    def query_reservations(self, filters, first_day=None, last_day=None):
+        """Itera las reservaciones que cumplen los filtros exactos y el
+        rango de días de entrada, en orden de entrada y de ID.
+        """
+        conditions = [f"{name} = ?" for name in filters]
+        values = list(filters.values())
+        if first_day is not None:
+            conditions.append("start_day >= ?")
+            values.append(first_day)
+        if last_day is not None:
+            conditions.append("start_day <= ?")
+            values.append(last_day)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        columns = COLUMNS["reservations"]
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(columns)} FROM reservations {where}"
+            f"ORDER BY IFNULL(start_day, 0), reservation_id", values)
+        for row in cursor:
+            yield self._row_to_record("reservations", row)
+
+    def close(self):
+        """Confirma los cambios pendientes y cierra la conexión."""
+        self.commit()
+        self._conn.close()
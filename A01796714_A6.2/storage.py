@@ -0,0 +1,136 @@
+"""
+Registro de almacenes de datos compartidos por Hotel, Customer y
+Reservation.
+
+Cada ruta de datos tiene un único almacén por proceso; Hotel, Customer y
+Reservation comparten el de ``DATA_FILE``. El tipo de almacén se elige
+por la extensión del archivo: ``.db``, ``.sqlite`` y ``.sqlite3`` usan
+SQLite, ``.shards`` un directorio con un archivo por hotel, ``.bin`` un
+snapshot binario y cualquier otra el documento JSON.
+
+Todo almacén ofrece la misma interfaz: ``get``, ``peek``, ``contains``,
+``records``, ``put``, ``remove``, ``commit``, ``transaction``,
+``savepoint``, ``rollback``, ``refresh``, ``subscribe``, ``index``,
+``peak_occupancy``, ``query_reservations`` y ``close``.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+from binary_store import BinaryStore
+from json_store import COLLECTIONS, DataStore, StaleDataError
+from sharded_store import ShardedStore
+from sqlite_store import SQLiteStore
+
+
+__all__ = [
+    "BACKENDS", "BinaryStore", "COLLECTIONS", "DATA_FILE", "DataStore",
+    "SQLiteStore", "ShardedStore", "StaleDataError",
+    "close_store", "configure_store", "copy_store", "get_store",
+    "run_batch", "shared_store", "use_store",
+]
+
+DATA_FILE = "tc.json"
+
+BACKENDS = {
+    ".db": SQLiteStore,
+    ".sqlite": SQLiteStore,
+    ".sqlite3": SQLiteStore,
+    ".shards": ShardedStore,
+    ".bin": BinaryStore,
+}
+
+_STORES = {}
+_CURRENT = threading.local()
+
+
+def _backend(path):
+    """Retorna la clase de almacén que corresponde a la ruta."""
+    return BACKENDS.get(os.path.splitext(path)[1].lower(), DataStore)
+
+
+def get_store(path):
+    """Retorna el almacén compartido para la ruta indicada."""
+    key = os.path.abspath(path)
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = _backend(key)(key)
+    return store
+
+
+def shared_store():
+    """Retorna el almacén compartido por Hotel, Customer y Reservation.
+
+    Las tres clases usan siempre la ruta vigente de ``storage.DATA_FILE``,
+    salvo en un hilo que esté dentro de ``use_store``.
+    """
+    store = getattr(_CURRENT, "store", None)
+    if store is not None:
+        return store
+    return get_store(DATA_FILE)
+
+
+@contextmanager
+def use_store(store):
+    """Hace que shared_store() retorne store en el hilo actual dentro del
+    bloque, sin cambiar ``DATA_FILE`` para el resto del proceso.
+    """
+    previous = getattr(_CURRENT, "store", None)
+    _CURRENT.store = store
+    try:
+        yield store
+    finally:
+        _CURRENT.store = previous
+
+
+def configure_store(path, backend=None, **options):
+    """Reemplaza el almacén compartido de una ruta con nuevas opciones.
+
+    Ejemplos: ``configure_store(DATA_FILE, journal=True)`` o
+    ``configure_store("datos.dat", backend=SQLiteStore)``.
+    """
+    key = os.path.abspath(path)
+    previous = _STORES.pop(key, None)
+    if previous is not None:
+        previous.close()
+    factory = backend or _backend(key)
+    store = _STORES[key] = factory(key, **options)
+    return store
+
+
+def close_store(path):
+    """Cierra el almacén compartido de una ruta y lo olvida."""
+    store = _STORES.pop(os.path.abspath(path), None)
+    if store is not None:
+        store.close()
+
+
+def run_batch(store, action, items):
+    """Aplica action a cada elemento dentro de una sola transacción.
+
+    Los elementos que son diccionarios se pasan como argumentos por
+    nombre y el resto como único argumento. Retorna una lista con el
+    resultado de cada elemento; los elementos inválidos dan False.
+    """
+    results = []
+    with store.transaction():
+        for item in items:
+            try:
+                if isinstance(item, dict):
+                    results.append(action(**item))
+                else:
+                    results.append(action(item))
+            except TypeError as e:
+                print(f"[ERROR] Elemento inválido {item}: {e}")
+                results.append(False)
+    return results
+
+
+def copy_store(source, target):
+    """Copia todos los registros de un almacén a otro y confirma."""
+    with target.transaction():
+        for collection in COLLECTIONS:
+            key_name = f"{collection[:-1]}_id"
+            for record in source.records(collection):
+                target.put(collection, record[key_name], record)
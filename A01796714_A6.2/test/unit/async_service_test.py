@@ -0,0 +1,150 @@
+"""Tests unitarios para AsyncReservationService."""
+import asyncio
+import os
+import sys
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import unittest
+import hotel as hotel_mod
+import storage
+
+from async_service import AsyncReservationService
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+TEST_FILE = os.path.join(BASE_DIR, "tc_async.json")
+OTHER_FILE = os.path.join(BASE_DIR, "tc_async_other.json")
+
+
+def clean():
+    """Elimina los archivos de prueba entre tests."""
+    for path in (TEST_FILE, OTHER_FILE):
+        storage.close_store(path)
+        for suffix in ("", ".lock"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+def partial_write(hotel_id):
+    """Escribe un hotel en el almacén vigente y después falla."""
+    storage.shared_store().put("hotels", hotel_id, {"hotel_id": hotel_id})
+    raise ValueError("falla a la mitad")
+
+
+class TestAsyncReservationService(unittest.IsolatedAsyncioTestCase):
+    """Pruebas unitarias para la fachada asyncio."""
+
+    def setUp(self):
+        """Guarda la configuración de los módulos y limpia el archivo."""
+        self.previous = storage.DATA_FILE
+        clean()
+
+    def tearDown(self):
+        """Restaura la configuración de los módulos."""
+        storage.DATA_FILE = self.previous
+        clean()
+
+    async def test_solicitudes_concurrentes_se_agrupan(self):
+        """Verifica que reservas simultáneas comparten escritura."""
+        async with AsyncReservationService(TEST_FILE) as service:
+            await service.create_hotel("H1", "Te big apple", "NYC", 5)
+            await service.create_customer("C1", "Mario", "m@gmail.com")
+            results = await asyncio.gather(*(
+                service.create_reservation(
+                    f"R{i}", "C1", "H1", "10/04/2026", "12/04/2026")
+                for i in range(8)
+            ))
+        self.assertEqual(results.count(True), 5)
+        self.assertLess(service.stats["batches"], service.stats["requests"])
+
+    async def test_lecturas_desde_memoria(self):
+        """Verifica que las consultas ven las modificaciones aplicadas."""
+        async with AsyncReservationService(TEST_FILE) as service:
+            await service.create_hotel("H1", "Te big apple", "NYC", 2)
+            await service.modify_hotel("H1", rooms=3)
+            self.assertEqual(service.get_hotel("H1").rooms, 3)
+            self.assertIsNone(service.get_customer("C1"))
+            self.assertEqual(await service.available_rooms_between(
+                "H1", "10/04/2026", "12/04/2026"), 3)
+
+    async def test_excepcion_de_una_solicitud(self):
+        """Verifica que un error sólo afecta a su propia solicitud."""
+        async with AsyncReservationService(TEST_FILE) as service:
+            with self.assertRaises(TypeError):
+                await service.submit(hotel_mod.Hotel.create, "H1")
+            self.assertTrue(
+                await service.create_hotel("H1", "A", "B", 1))
+
+    async def test_error_de_la_transaccion(self):
+        """Verifica que un error al guardar no detiene la tarea escritora."""
+        async with AsyncReservationService(TEST_FILE) as service:
+            failure = OSError("database is locked")
+            with mock.patch.object(service.store, "transaction",
+                                   side_effect=failure):
+                results = await asyncio.gather(
+                    service.create_hotel("H1", "A", "B", 1),
+                    service.create_customer("C1", "Mario", "m@gmail.com"),
+                    return_exceptions=True)
+            self.assertEqual(results, [failure, failure])
+            self.assertTrue(
+                await service.create_hotel("H1", "A", "B", 1))
+
+    async def test_no_cambia_data_file(self):
+        """Verifica que cada servicio usa su propio archivo sin cambiar
+        storage.DATA_FILE."""
+        storage.DATA_FILE = OTHER_FILE
+        async with AsyncReservationService(TEST_FILE) as service:
+            await service.create_hotel("H1", "A", "B", 2)
+            self.assertEqual(await service.available_rooms_between(
+                "H1", "10/04/2026", "12/04/2026"), 2)
+        self.assertEqual(storage.DATA_FILE, OTHER_FILE)
+        self.assertIsNone(hotel_mod.Hotel.get("H1"))
+        self.assertTrue(storage.get_store(TEST_FILE).contains("hotels",
+                                                              "H1"))
+
+    async def test_excepcion_deshace_sus_cambios(self):
+        """Verifica que una solicitud que falla a la mitad no deja sus
+        escrituras en la transacción del grupo."""
+        async with AsyncReservationService(TEST_FILE) as service:
+            results = await asyncio.gather(
+                service.create_hotel("H1", "A", "B", 1),
+                service.submit(partial_write, "H2"),
+                service.create_hotel("H3", "C", "D", 1),
+                return_exceptions=True)
+        self.assertEqual(service.stats["batches"], 1)
+        self.assertEqual(results[0::2], [True, True])
+        self.assertIsInstance(results[1], ValueError)
+        store = storage.DataStore(TEST_FILE)
+        self.assertEqual(sorted(store.load()["hotels"]), ["H1", "H3"])
+
+    async def test_datos_obsoletos_por_solicitud(self):
+        """Verifica que StaleDataError en el grupo sólo hace fallar a las
+        solicitudes que vuelven a chocar al reintentarlas."""
+        async with AsyncReservationService(TEST_FILE) as service:
+            # pylint: disable=protected-access
+            apply_group = service._apply_group
+            calls = []
+
+            def conflict(group):
+                calls.append(len(group))
+                if len(calls) == 1 or group[0][2][0] == "H2":
+                    raise storage.StaleDataError("otro proceso escribió")
+                return apply_group(group)
+
+            with mock.patch.object(service, "_apply_group",
+                                   side_effect=conflict):
+                results = await asyncio.gather(
+                    *(service.create_hotel(f"H{i}", "A", "B", 1)
+                      for i in (1, 2, 3)),
+                    return_exceptions=True)
+        self.assertEqual(calls, [3, 1, 1, 1])
+        self.assertEqual(results[0::2], [True, True])
+        self.assertIsInstance(results[1], storage.StaleDataError)
+        store = storage.DataStore(TEST_FILE)
+        self.assertEqual(sorted(store.load()["hotels"]), ["H1", "H3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
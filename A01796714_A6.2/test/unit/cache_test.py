@@ -0,0 +1,80 @@
+"""Tests unitarios para la caché LRU de entidades."""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import unittest
+import storage
+
+from cache import ENTITY_CACHE, EntityCache
+from hotel import Hotel
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+TEST_FILE = os.path.join(BASE_DIR, "tc_cache.json")
+
+
+def clean():
+    """Elimina el archivo de prueba entre tests."""
+    for suffix in ("", ".lock"):
+        if os.path.exists(TEST_FILE + suffix):
+            os.remove(TEST_FILE + suffix)
+
+
+class TestEntityCache(unittest.TestCase):
+    """Pruebas unitarias para EntityCache."""
+
+    def setUp(self):
+        """Redirige Hotel a un archivo de prueba y vacía la caché."""
+        self.previous = storage.DATA_FILE
+        storage.DATA_FILE = TEST_FILE
+        clean()
+        ENTITY_CACHE.clear()
+        Hotel.create("H1", "Te big apple", "NYC", 10)
+
+    def tearDown(self):
+        """Restaura la configuración y limpia el archivo."""
+        storage.DATA_FILE = self.previous
+        clean()
+
+    def test_lecturas_repetidas_son_aciertos(self):
+        """Verifica que la segunda lectura sale de la caché."""
+        self.assertIs(Hotel.get("H1"), Hotel.get("H1"))
+        self.assertEqual(ENTITY_CACHE.stats()["hits"], 1)
+        self.assertEqual(ENTITY_CACHE.stats()["misses"], 1)
+
+    def test_modificar_invalida(self):
+        """Verifica que modify y delete invalidan la entrada."""
+        Hotel.get("H1")
+        Hotel.modify("H1", rooms=20)
+        self.assertEqual(Hotel.get("H1").rooms, 20)
+        Hotel.delete("H1")
+        self.assertIsNone(Hotel.get("H1"))
+
+    def test_escritura_externa_invalida(self):
+        """Verifica que un cambio hecho por otro proceso se detecta."""
+        Hotel.get("H1")
+        with open(TEST_FILE, "w", encoding="utf-8") as f:
+            json.dump({"hotels": {"H1": {
+                "hotel_id": "H1", "name": "Otro", "location": "LON",
+                "rooms": 1}}, "customers": {}, "reservations": {}}, f)
+        self.assertEqual(Hotel.get("H1").name, "Otro")
+
+    def test_desalojo_lru(self):
+        """Verifica que se desaloja la entrada usada hace más tiempo."""
+        cache = EntityCache(capacity=1)
+        store = storage.get_store(TEST_FILE)
+        store.put("hotels", "H2", dict(store.get("hotels", "H1"),
+                                       hotel_id="H2"))
+        cache.get(store, "hotels", "H1", dict)
+        cache.get(store, "hotels", "H2", dict)
+        cache.get(store, "hotels", "H1", dict)
+        self.assertEqual(cache.stats()["evictions"], 2)
+        self.assertEqual(cache.stats()["hits"], 0)
+        store.rollback()
+
+
+if __name__ == "__main__":
+    unittest.main()
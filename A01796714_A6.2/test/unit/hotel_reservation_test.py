@@ -6,9 +6,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import unittest
-import hotel as hotel_mod
-import customer as customer_mod
-import reservation as reservation_mod
+import storage
 
 from hotel import Hotel
 from customer import Customer
@@ -21,15 +19,15 @@ TEST_FILE = os.path.join(BASE_DIR, "tc1.json")
 
 def use_test_file():
     """Redirige el archivo de datos a uno exclusivo para pruebas."""
-    hotel_mod.DATA_FILE = TEST_FILE
-    customer_mod.DATA_FILE = TEST_FILE
-    reservation_mod.DATA_FILE = TEST_FILE
+    storage.DATA_FILE = TEST_FILE
 
 
 def clean():
     """Elimina el archivo de prueba entre tests."""
     if os.path.exists(TEST_FILE):
         os.remove(TEST_FILE)
+    if os.path.exists(TEST_FILE + ".lock"):
+        os.remove(TEST_FILE + ".lock")
 
 
 class TestHotel(unittest.TestCase):
@@ -78,6 +76,19 @@ class TestHotel(unittest.TestCase):
         Hotel.create("H1", "Te big apple", "NYC", 5)
         self.assertEqual(Hotel.available_rooms("H1"), 5)
 
+    def test_listar_hoteles(self):
+        """Verifica que iter_all recorre los hoteles de forma perezosa."""
+        Hotel.create("H1", "Te big apple", "NYC", 10)
+        Hotel.create("H2", "Hilton", "LON", 5)
+        hoteles = Hotel.iter_all()
+        self.assertEqual(next(hoteles).hotel_id, "H1")
+        self.assertEqual([h.hotel_id for h in hoteles], ["H2"])
+
+    def test_hotel_sin_diccionario_de_instancia(self):
+        """Verifica que Hotel usa __slots__ en lugar de __dict__."""
+        Hotel.create("H1", "Te big apple", "NYC", 10)
+        self.assertFalse(hasattr(Hotel.get("H1"), "__dict__"))
+
     def test_crear_hotel_duplicado(self):
         """Verifica que no se puede crear un hotel con ID duplicado."""
         Hotel.create("H1", "Te big apple", "NYC", 10)
@@ -152,6 +163,12 @@ class TestCustomer(unittest.TestCase):
         Customer.create("C1", "Mario Jimenez", "mjim@gmail.com")
         Customer.display("C1")
 
+    def test_listar_clientes(self):
+        """Verifica que iter_all recorre todos los clientes."""
+        Customer.create("C1", "Mario Jimenez", "mjim@gmail.com")
+        self.assertEqual([c.name for c in Customer.iter_all()],
+                         ["Mario Jimenez"])
+
     def test_crear_cliente_duplicado(self):
         """Verifica que no se puede crear un cliente con ID duplicado."""
         Customer.create("C1", "Mario Jimenez", "mjim@gmail.com")
@@ -181,8 +198,8 @@ class TestCustomer(unittest.TestCase):
         Customer.display("customer1")
 
 
-class TestReservation(unittest.TestCase):
-    """Pruebas unitarias para la clase Reservation."""
+class ReservationTestCase(unittest.TestCase):
+    """Base de las pruebas de Reservation con un hotel y un cliente."""
 
     def setUp(self):
         """Configura el entorno y crea hotel y cliente base."""
@@ -195,6 +212,10 @@ class TestReservation(unittest.TestCase):
         """Limpia el entorno después de cada prueba."""
         clean()
 
+
+class TestReservation(ReservationTestCase):
+    """Pruebas unitarias para la clase Reservation."""
+
     def test_crear_reservacion(self):
         """Verifica que se puede crear una reservación correctamente."""
         self.assertTrue(
@@ -261,6 +282,15 @@ class TestReservation(unittest.TestCase):
                 "R2", "C2", "HHTTLL", "10/04/2026", "25/04/2026")
         )
 
+    def test_crear_reservacion_fechas_invalidas(self):
+        """Verifica que no se puede reservar con fechas inválidas."""
+        self.assertFalse(
+            Reservation.create("R1", "C1", "H1", "25/04/2026", "10/04/2026")
+        )
+        self.assertFalse(
+            Reservation.create("R1", "C1", "H1", "abril", "10/04/2026")
+        )
+
     def test_cancelar_reservacion_inexistente(self):
         """Verifica que cancelar una reservación inexistente retorna False."""
         self.assertFalse(Reservation.cancel("RV1"))
@@ -296,5 +326,124 @@ class TestReservation(unittest.TestCase):
         self.assertIsNone(Hotel.get("H1"))
 
 
+class TestReservationDates(ReservationTestCase):
+    """Pruebas de disponibilidad por fechas de Reservation."""
+
+    def test_habitaciones_con_reservaciones_sin_traslape(self):
+        """Verifica que reservas en fechas distintas no restan de más."""
+        Hotel.create("H2", "Hostal", "CDMX", 1)
+        for number, month in enumerate(("04", "05", "06")):
+            self.assertTrue(Reservation.create(
+                f"R{number}", "C1", "H2", f"10/{month}/2026",
+                f"12/{month}/2026"))
+        self.assertEqual(Hotel.available_rooms("H2"), 0)
+        Hotel.modify("H2", rooms=3)
+        self.assertEqual(Hotel.available_rooms("H2"), 2)
+        Hotel.modify("H2", rooms=0)
+        self.assertEqual(Hotel.available_rooms("H2"), 0)
+        self.assertEqual(
+            Hotel.available_rooms_between("H2", "10/04/2026", "12/04/2026"),
+            0)
+
+    def test_reservar_fechas_sin_traslape(self):
+        """Verifica que una habitación se reutiliza en fechas distintas."""
+        Hotel.create("HHTTLL", "Boutique Hotel", "BCN", 1)
+        Reservation.create("R1", "C1", "HHTTLL", "10/04/2026", "15/04/2026")
+        self.assertTrue(
+            Reservation.create(
+                "R2", "C1", "HHTTLL", "15/04/2026", "20/04/2026")
+        )
+        self.assertFalse(
+            Reservation.create(
+                "R3", "C1", "HHTTLL", "12/04/2026", "13/04/2026")
+        )
+
+    def test_habitaciones_disponibles_por_fechas(self):
+        """Verifica el conteo de habitaciones libres en un rango."""
+        Reservation.create("R1", "C1", "H1", "10/04/2026", "15/04/2026")
+        Reservation.create("R2", "C1", "H1", "14/04/2026", "20/04/2026")
+        self.assertEqual(
+            Hotel.available_rooms_between("H1", "01/04/2026", "10/04/2026"), 3)
+        self.assertEqual(
+            Hotel.available_rooms_between("H1", "12/04/2026", "16/04/2026"), 1)
+        Reservation.cancel("R2")
+        self.assertEqual(
+            Hotel.available_rooms_between("H1", "12/04/2026", "16/04/2026"), 2)
+
+
+class TestReservationFind(ReservationTestCase):
+    """Pruebas de listado y búsqueda de reservaciones."""
+
+    def test_listar_reservaciones(self):
+        """Verifica que iter_all recorre todas las reservaciones."""
+        Reservation.create("R1", "C1", "H1", "10/04/2026", "25/04/2026")
+        Reservation.create("R2", "C1", "H1", "10/04/2026", "25/04/2026")
+        self.assertEqual(
+            [r.reservation_id for r in Reservation.iter_all()], ["R1", "R2"])
+
+    def test_buscar_reservaciones(self):
+        """Verifica las búsquedas por índice, rango de fechas y páginas."""
+        Hotel.create("H2", "Hilton", "LON", 5)
+        Customer.create("C2", "Jorge Diaz", "jdiaz@gmail.com")
+        Reservation.create("R1", "C1", "H1", "12/04/2026", "14/04/2026")
+        Reservation.create("R2", "C2", "H1", "10/04/2026", "11/04/2026")
+        Reservation.create("R3", "C1", "H2", "01/05/2026", "03/05/2026")
+        Reservation.cancel("R1")
+
+        def ids(resultados):
+            return [r.reservation_id for r in resultados]
+
+        self.assertEqual(ids(Reservation.find(customer_id="C1")),
+                         ["R1", "R3"])
+        self.assertEqual(ids(Reservation.find(hotel_id="H1")), ["R2", "R1"])
+        self.assertEqual(
+            ids(Reservation.find(hotel_id="H1", status="cancelada")), ["R1"])
+        self.assertEqual(
+            ids(Reservation.find(check_in_from="11/04/2026",
+                                 check_in_to="01/05/2026")), ["R1", "R3"])
+        self.assertEqual(ids(Reservation.find(offset=1, limit=1)), ["R1"])
+        self.assertEqual(ids(Reservation.find(check_in_from="mayo")), [])
+
+
+class TestReservationBatch(ReservationTestCase):
+    """Pruebas de las operaciones en lote."""
+
+    def test_crear_reservaciones_en_lote(self):
+        """Verifica que un lote reporta el resultado de cada elemento."""
+        resultados = Reservation.create_many([
+            {"reservation_id": "R1", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "10/04/2026", "check_out": "25/04/2026"},
+            {"reservation_id": "R1", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "10/04/2026", "check_out": "25/04/2026"},
+            {"reservation_id": "R2", "customer_id": "C9", "hotel_id": "H1",
+             "check_in": "10/04/2026", "check_out": "25/04/2026"},
+            {"reservation_id": "R3"},
+        ])
+        self.assertEqual(resultados, [True, False, False, False])
+        self.assertEqual(Reservation.cancel_many(["R1", "R1"]),
+                         [True, False])
+        self.assertEqual(Hotel.available_rooms("H1"), 3)
+
+    def test_lote_de_hoteles_y_clientes(self):
+        """Verifica las operaciones en lote de hoteles y clientes."""
+        self.assertEqual(Hotel.create_many([
+            {"hotel_id": "H2", "name": "A", "location": "B", "rooms": 1},
+            {"hotel_id": "H3", "name": "C", "location": "D", "rooms": 2},
+        ]), [True, True])
+        self.assertEqual(Hotel.modify_many([
+            {"hotel_id": "H2", "rooms": 4}, {"hotel_id": "H9", "rooms": 1},
+        ]), [True, False])
+        self.assertEqual(Hotel.get("H2").rooms, 4)
+        self.assertEqual(Hotel.delete_many(["H2", "H3"]), [True, True])
+        self.assertEqual(Customer.create_many([
+            {"customer_id": "C2", "name": "Jorge", "email": "j@gmail.com"},
+        ]), [True])
+        self.assertEqual(Customer.modify_many([
+            {"customer_id": "C2", "phone": "1234-5678"},
+        ]), [True])
+        self.assertEqual(Customer.get("C2").phone, "1234-5678")
+        self.assertEqual(Customer.delete_many(["C2", "C9"]), [True, False])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+"""Tests unitarios para la medición de tiempos."""
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import unittest
+import instrumentation
+import storage
+
+from customer import Customer
+from hotel import Hotel
+from json_store import DataStore
+from reservation import Reservation
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+TEST_FILE = os.path.join(BASE_DIR, "tc_instrumentation.json")
+PROFILE_FILE = os.path.join(BASE_DIR, "tc_instrumentation.prof")
+
+
+def clean():
+    """Elimina los archivos de prueba entre tests."""
+    storage.close_store(TEST_FILE)
+    for path in (TEST_FILE, TEST_FILE + ".lock", PROFILE_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Pruebas unitarias para instrumentation."""
+
+    def setUp(self):
+        """Redirige los módulos a un archivo de prueba."""
+        self.previous = storage.DATA_FILE
+        clean()
+        storage.DATA_FILE = TEST_FILE
+        instrumentation.reset()
+
+    def tearDown(self):
+        """Desactiva la medición y restaura la configuración."""
+        instrumentation.disable()
+        instrumentation.reset()
+        storage.DATA_FILE = self.previous
+        clean()
+
+    def test_desactivado_no_envuelve(self):
+        """Verifica que enable y disable restauran las funciones."""
+        original = DataStore.__dict__["_write"]
+        instrumentation.enable()
+        self.assertIsNot(DataStore.__dict__["_write"], original)
+        instrumentation.disable()
+        self.assertIs(DataStore.__dict__["_write"], original)
+        Hotel.create("H1", "Te big apple", "NYC", 2)
+        self.assertEqual(instrumentation.dump(), {})
+
+    def test_cuenta_operaciones(self):
+        """Verifica contadores de CRUD, escritura y consultas."""
+        instrumentation.enable()
+        Hotel.create("H1", "Te big apple", "NYC", 2)
+        Customer.create("C1", "Mario", "m@gmail.com")
+        Reservation.create("R1", "C1", "H1", "01/04/2026", "03/04/2026")
+        list(Reservation.find(hotel_id="H1"))
+        stream = io.StringIO()
+        summary = instrumentation.dump(stream)
+        self.assertEqual(json.loads(stream.getvalue()), summary)
+        self.assertEqual(summary["hotel.create"]["count"], 1)
+        self.assertEqual(summary["reservation.find"]["count"], 1)
+        self.assertEqual(summary["store.write"]["count"], 3)
+        self.assertGreaterEqual(summary["index.peak_occupancy"]["count"], 1)
+        self.assertEqual(
+            sum(summary["store.write"]["histogram_us"].values()), 3)
+
+    def test_ganchos_y_perfil(self):
+        """Verifica los ganchos y la captura de cProfile."""
+        seen = []
+
+        def hook(name, elapsed):
+            """Guarda cada medición recibida."""
+            seen.append((name, elapsed))
+
+        instrumentation.add_hook(hook)
+        try:
+            instrumentation.enable(profile=True)
+            Hotel.create("H1", "Te big apple", "NYC", 2)
+            instrumentation.disable()
+        finally:
+            instrumentation.remove_hook(hook)
+        self.assertIn("hotel.create", [name for name, _ in seen])
+        self.assertTrue(instrumentation.dump_profile(PROFILE_FILE))
+        self.assertTrue(os.path.exists(PROFILE_FILE))
+
+
+if __name__ == "__main__":
+    unittest.main()
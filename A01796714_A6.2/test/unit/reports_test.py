@@ -0,0 +1,101 @@
+"""Tests unitarios para los reportes de ocupación."""
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import unittest
+import reports
+import storage
+
+from customer import Customer
+from hotel import Hotel
+from reservation import Reservation
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+TEST_FILE = os.path.join(BASE_DIR, "tc_reports.json")
+TEST_DB = os.path.join(BASE_DIR, "tc_reports.db")
+
+
+def clean():
+    """Elimina los archivos de prueba entre tests."""
+    for path in (TEST_FILE, TEST_DB):
+        storage.close_store(path)
+        for suffix in ("", ".lock", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+class TestReports(unittest.TestCase):
+    """Pruebas de los reportes sobre el almacén JSON."""
+
+    data_file = TEST_FILE
+
+    def setUp(self):
+        """Crea un hotel de 2 habitaciones con tres reservaciones."""
+        self.previous = storage.DATA_FILE
+        clean()
+        storage.DATA_FILE = self.data_file
+        Hotel.create("H1", "Te big apple", "NYC", 2)
+        Customer.create("C1", "Mario", "m@gmail.com")
+        Reservation.create("R1", "C1", "H1", "01/04/2026", "03/04/2026")
+        Reservation.create("R2", "C1", "H1", "02/04/2026", "04/04/2026")
+        Reservation.create("R3", "C1", "H1", "02/04/2026", "03/04/2026")
+
+    def tearDown(self):
+        """Restaura la configuración de los módulos."""
+        storage.DATA_FILE = self.previous
+        clean()
+
+    def test_curva_de_ocupacion(self):
+        """Verifica las habitaciones ocupadas por noche."""
+        curve = list(reports.occupancy_curve("H1", "31/03/2026",
+                                             "05/04/2026"))
+        self.assertEqual(curve, [("31/03/2026", 0), ("01/04/2026", 1),
+                                 ("02/04/2026", 2), ("03/04/2026", 1),
+                                 ("04/04/2026", 0)])
+
+    def test_reporte_se_actualiza_al_cancelar(self):
+        """Verifica ocupación y razón de cancelación tras cancelar."""
+        before = reports.hotel_report("H1", "01/04/2026", "03/04/2026")
+        self.assertEqual(before["room_nights"], 3)
+        self.assertEqual(before["peak"], 2)
+        Reservation.cancel("R2")
+        after = reports.hotel_report("H1", "01/04/2026", "03/04/2026")
+        self.assertEqual(after["room_nights"], 2)
+        self.assertEqual(after["occupancy_rate"], 0.5)
+        self.assertEqual(after["cancelled"], 1)
+        self.assertEqual(after["reservations"], 2)
+        self.assertEqual(after["cancellation_ratio"], 0.5)
+
+    def test_reporte_invalido(self):
+        """Verifica que un hotel inexistente o un rango inválido dan None."""
+        self.assertIsNone(reports.hotel_report("H9", "01/04/2026",
+                                               "03/04/2026"))
+        self.assertIsNone(reports.hotel_report("H1", "03/04/2026",
+                                               "01/04/2026"))
+
+    def test_exportacion(self):
+        """Verifica la exportación en JSON por líneas y en CSV."""
+        stream = io.StringIO()
+        count = reports.export_reports(
+            reports.hotel_reports("01/04/2026", "03/04/2026"), stream)
+        self.assertEqual(count, 1)
+        self.assertEqual(json.loads(stream.getvalue())["hotel_id"], "H1")
+        stream = io.StringIO()
+        reports.export_reports(
+            reports.hotel_reports("01/04/2026", "03/04/2026"), stream, "csv")
+        self.assertTrue(stream.getvalue().startswith("hotel_id,name"))
+
+
+class TestReportsSQLite(TestReports):
+    """Las mismas pruebas sobre el almacén SQLite."""
+
+    data_file = TEST_DB
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,547 @@
+"""Tests unitarios para el almacén de datos compartido."""
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import unittest
+import storage
+import binary_store
+import sharded_store
+import queries
+from availability import parse_range
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+TEST_FILE = os.path.join(BASE_DIR, "tc_storage.json")
+TEST_DB = os.path.join(BASE_DIR, "tc_storage.db")
+TEST_SHARDS = os.path.join(BASE_DIR, "tc_storage.shards")
+TEST_BIN = os.path.join(BASE_DIR, "tc_storage.bin")
+
+
+def clean():
+    """Elimina el archivo de prueba y sus bitácoras entre tests."""
+    for suffix in ("", ".journal", ".journal.old", ".tmp", ".lock"):
+        if os.path.exists(TEST_FILE + suffix):
+            os.remove(TEST_FILE + suffix)
+
+
+class TestDataStore(unittest.TestCase):
+    """Pruebas unitarias para DataStore."""
+
+    def setUp(self):
+        """Configura el entorno antes de cada prueba."""
+        clean()
+        self.store = storage.DataStore(TEST_FILE)
+
+    def tearDown(self):
+        """Limpia el entorno después de cada prueba."""
+        clean()
+
+    def test_misma_instancia_por_ruta(self):
+        """Verifica que la misma ruta comparte el mismo almacén."""
+        self.assertIs(storage.get_store(TEST_FILE),
+                      storage.get_store(os.path.abspath(TEST_FILE)))
+
+    def test_no_relee_si_no_cambia(self):
+        """Verifica que el documento en memoria se reutiliza."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        self.assertIs(self.store.load(), self.store.load())
+
+    def test_relee_si_otro_proceso_escribe(self):
+        """Verifica que un cambio externo en el archivo se detecta."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        with open(TEST_FILE, "w", encoding="utf-8") as f:
+            json.dump({"hotels": {}, "customers": {"C1": {}},
+                       "reservations": {}}, f)
+        self.assertFalse(self.store.contains("hotels", "H1"))
+        self.assertTrue(self.store.contains("customers", "C1"))
+
+    def test_commit_sin_cambios_no_escribe(self):
+        """Verifica que commit sin cambios no crea el archivo."""
+        self.store.load()
+        self.store.commit()
+        self.assertFalse(os.path.exists(TEST_FILE))
+
+    def test_escritura_obsoleta_se_rechaza(self):
+        """Verifica que no se sobrescriben cambios de otro proceso."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        other = storage.DataStore(TEST_FILE)
+        other.put("hotels", "H2", {"hotel_id": "H2"})
+        self.store.put("hotels", "H3", {"hotel_id": "H3"})
+        other.commit()
+        with self.assertRaises(storage.StaleDataError):
+            self.store.commit()
+        self.assertEqual(sorted(self.store.load()["hotels"]), ["H1", "H2"])
+        with self.store.transaction():
+            self.store.put("hotels", "H3", {"hotel_id": "H3"})
+        self.assertEqual(sorted(other.load()["hotels"]), ["H1", "H2", "H3"])
+
+    def test_transaccion_relee_cambios_de_otro_proceso(self):
+        """Verifica que una transacción parte de la versión vigente."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        other = storage.DataStore(TEST_FILE)
+        with other.transaction():
+            other.put("hotels", "H2", {"hotel_id": "H2"})
+        with self.store.transaction():
+            self.store.put("hotels", "H3", {"hotel_id": "H3"})
+        self.assertEqual(sorted(other.load()["hotels"]), ["H1", "H2", "H3"])
+
+    def test_directorio_inexistente_reporta_error(self):
+        """Verifica que sin poder crear el candado no se lanza excepción
+        y los cambios que no se guardaron se descartan."""
+        missing = os.path.join(BASE_DIR, "no_existe", "datos.json")
+        store = storage.DataStore(missing)
+        stream = io.StringIO()
+        with contextlib.redirect_stdout(stream):
+            with store.transaction():
+                store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.assertIn(f"[ERROR] No se pudo guardar {missing}",
+                      stream.getvalue())
+        self.assertFalse(store.contains("hotels", "H1"))
+        store.commit()
+        self.assertFalse(os.path.exists(os.path.dirname(missing)))
+
+    def test_savepoint_deshace_solo_el_bloque(self):
+        """Verifica que un savepoint que falla restaura sus registros y
+        conserva los del resto de la transacción."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1", "rooms": 1})
+        self.store.commit()
+        with self.store.transaction():
+            self.store.put("hotels", "H2", {"hotel_id": "H2"})
+            with self.assertRaises(ValueError):
+                with self.store.savepoint():
+                    self.store.put("hotels", "H1", {"hotel_id": "H1",
+                                                    "rooms": 9})
+                    with self.store.savepoint():
+                        self.store.put("hotels", "H3", {"hotel_id": "H3"})
+                    self.store.remove("hotels", "H2")
+                    raise ValueError("falla")
+            with self.store.savepoint():
+                self.store.put("hotels", "H4", {"hotel_id": "H4"})
+        other = storage.DataStore(TEST_FILE)
+        self.assertEqual(sorted(other.load()["hotels"]), ["H1", "H2", "H4"])
+        self.assertEqual(other.get("hotels", "H1")["rooms"], 1)
+
+
+class TestJournal(unittest.TestCase):
+    """Pruebas unitarias para el modo bitácora de DataStore."""
+
+    def setUp(self):
+        """Configura un almacén en modo bitácora."""
+        clean()
+        self.store = storage.DataStore(TEST_FILE, journal=True)
+
+    def tearDown(self):
+        """Limpia el entorno después de cada prueba."""
+        self.store.wait()
+        clean()
+
+    def test_commit_agrega_a_bitacora(self):
+        """Verifica que un cambio sólo agrega una línea a la bitácora."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        self.assertFalse(os.path.exists(TEST_FILE))
+        with open(TEST_FILE + ".journal", encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def test_bitacora_se_reproduce_al_cargar(self):
+        """Verifica que otro almacén reconstruye el estado."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.put("hotels", "H2", {"hotel_id": "H2"})
+        self.store.remove("hotels", "H1")
+        self.store.commit()
+        other = storage.DataStore(TEST_FILE, journal=True)
+        self.assertEqual(list(other.load()["hotels"]), ["H2"])
+
+    def test_linea_truncada_se_ignora(self):
+        """Verifica que una escritura interrumpida no pierde lo anterior."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        with open(TEST_FILE + ".journal", "a", encoding="utf-8") as f:
+            f.write('{"op":"put","c":"hot')
+        other = storage.DataStore(TEST_FILE, journal=True)
+        self.assertTrue(other.contains("hotels", "H1"))
+
+    def test_compactacion(self):
+        """Verifica que compactar integra la bitácora en el archivo."""
+        self.store.put("hotels", "H1", {"hotel_id": "H1"})
+        self.store.commit()
+        self.store.compact()
+        self.assertFalse(os.path.exists(TEST_FILE + ".journal"))
+        self.assertFalse(os.path.exists(TEST_FILE + ".journal.old"))
+        with open(TEST_FILE, encoding="utf-8") as f:
+            self.assertIn("H1", json.load(f)["hotels"])
+
+    def test_compactacion_automatica(self):
+        """Verifica que superar el umbral compacta en segundo plano."""
+        store = storage.DataStore(TEST_FILE, journal=True, compact_bytes=1)
+        store.put("hotels", "H1", {"hotel_id": "H1"})
+        store.commit()
+        store.wait()
+        self.assertTrue(os.path.exists(TEST_FILE))
+        self.assertTrue(storage.DataStore(TEST_FILE).contains("hotels", "H1"))
+
+
+class TestStoreIndex(unittest.TestCase):
+    """Pruebas unitarias para los índices registrados en el almacén."""
+
+    NIGHTS = parse_range("10/04/2026", "15/04/2026")
+
+    def setUp(self):
+        """Configura un almacén con una reservación activa."""
+        clean()
+        self.store = storage.DataStore(TEST_FILE)
+        self.store.put("reservations", "R1", self.record("activa"))
+        self.store.commit()
+
+    def tearDown(self):
+        """Limpia el entorno después de cada prueba."""
+        clean()
+
+    @staticmethod
+    def record(status):
+        """Retorna una reservación de H1 con el estado indicado."""
+        return {"hotel_id": "H1", "status": status,
+                "check_in": "10/04/2026", "check_out": "15/04/2026"}
+
+    def test_indice_se_construye_al_cargar(self):
+        """Verifica que el índice cuenta las reservaciones existentes."""
+        other = storage.DataStore(TEST_FILE)
+        self.assertEqual(other.peak_occupancy("H1", *self.NIGHTS), 1)
+
+    def test_indice_se_actualiza(self):
+        """Verifica que altas, cancelaciones y bajas ajustan el índice."""
+        self.assertEqual(self.store.peak_occupancy("H1", *self.NIGHTS), 1)
+        self.store.put("reservations", "R2", self.record("activa"))
+        self.assertEqual(self.store.peak_occupancy("H1", *self.NIGHTS), 2)
+        self.store.put("reservations", "R1", self.record("cancelada"))
+        self.store.remove("reservations", "R2")
+        self.assertEqual(self.store.peak_occupancy("H1", *self.NIGHTS), 0)
+
+
+class TestReservationIndex(unittest.TestCase):
+    """Pruebas de las listas ordenadas del índice de reservaciones."""
+
+    def test_lista_ordenada_en_bloques(self):
+        """Verifica altas, bajas y rangos contra una lista ordenada, con
+        bloques pequeños para forzar divisiones."""
+        with mock.patch("queries.CHUNK", 4):
+            keys = queries.SortedKeys([(3, "R3"), (1, "R1")])
+            expected = [(1, "R1"), (3, "R3")]
+            for number in range(60):
+                entry = (number * 7 % 11, f"R{number:02d}")
+                keys.add(entry)
+                expected.append(entry)
+            for number in range(0, 60, 3):
+                entry = (number * 7 % 11, f"R{number:02d}")
+                keys.discard(entry)
+                expected.remove(entry)
+            keys.discard((99, "R99"))
+        expected.sort()
+        self.assertEqual(len(keys), len(expected))
+        self.assertEqual(list(keys.between()), expected)
+        self.assertEqual(list(keys.between(3, 5)),
+                         [entry for entry in expected if 3 <= entry[0] <= 5])
+        self.assertEqual(list(keys.between(last_day=0)),
+                         [entry for entry in expected if entry[0] == 0])
+        self.assertEqual(list(keys.between(20)), [])
+
+    def test_busqueda_en_orden_de_entrada(self):
+        """Verifica que find conserva el orden por entrada e ID al
+        modificar registros, incluso durante la iteración."""
+        records = {
+            key: {"reservation_id": key, "hotel_id": hotel,
+                  "status": "activa", "check_in": check_in}
+            for key, hotel, check_in in (
+                ("R3", "H1", "12/04/2026"), ("R1", "H1", "12/04/2026"),
+                ("R2", "H1", "10/04/2026"), ("R4", "H2", "11/04/2026"))}
+        index = queries.ReservationIndex()
+        index.rebuild({"reservations": records})
+        found = []
+        for record in index.find(records, {"status": "activa"}):
+            found.append(record["reservation_id"])
+            old = record
+            records[old["reservation_id"]] = dict(old, status="cancelada")
+            index.update("reservations", old["reservation_id"], old,
+                         records[old["reservation_id"]])
+        self.assertEqual(found, ["R2", "R4", "R1", "R3"])
+        self.assertEqual(
+            [r["reservation_id"] for r in index.find(
+                records, {"hotel_id": "H1", "status": "cancelada"},
+                parse_range("11/04/2026", "12/04/2026")[0])],
+            ["R1", "R3"])
+        self.assertEqual(list(index.find(records, {"status": "activa"})),
+                         [])
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """Pruebas del sistema de reservaciones sobre SQLite."""
+
+    def setUp(self):
+        """Redirige los módulos a una base de datos de prueba."""
+        self.clean_db()
+        self.previous = storage.DATA_FILE
+        storage.DATA_FILE = TEST_DB
+        storage.configure_store(TEST_DB)
+        Hotel.create("H1", "Te big apple", "NYC", 1)
+        Customer.create("C1", "Mario Jimenez", "mjim@gmail.com")
+
+    def tearDown(self):
+        """Restaura los módulos y elimina la base de datos de prueba."""
+        storage.DATA_FILE = self.previous
+        storage.close_store(TEST_DB)
+        self.clean_db()
+
+    @staticmethod
+    def clean_db():
+        """Elimina la base de datos y sus archivos WAL."""
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(TEST_DB + suffix):
+                os.remove(TEST_DB + suffix)
+
+    def test_savepoint(self):
+        """Verifica que un savepoint que falla sólo deshace su bloque."""
+        store = storage.get_store(TEST_DB)
+        with store.transaction():
+            with self.assertRaises(ValueError):
+                with store.savepoint():
+                    Hotel.create("H2", "Hilton", "LON", 5)
+                    raise ValueError("falla")
+            with store.savepoint():
+                Hotel.create("H3", "Ritz", "PAR", 2)
+        self.assertIsNone(Hotel.get("H2"))
+        self.assertEqual(Hotel.get("H3").rooms, 2)
+
+    def test_backend_por_extension(self):
+        """Verifica que la extensión .db selecciona SQLite."""
+        self.assertIsInstance(storage.get_store(TEST_DB),
+                              storage.SQLiteStore)
+
+    def test_almacen_compartido(self):
+        """Verifica que Hotel y Customer escriben en storage.DATA_FILE."""
+        store = storage.shared_store()
+        self.assertIs(store, storage.get_store(TEST_DB))
+        self.assertTrue(store.contains("hotels", "H1"))
+        self.assertTrue(store.contains("customers", "C1"))
+
+    def test_flujo_de_reservacion(self):
+        """Verifica altas, consultas y disponibilidad sobre SQLite."""
+        self.assertTrue(
+            Reservation.create("R1", "C1", "H1", "10/04/2026", "15/04/2026"))
+        self.assertFalse(
+            Reservation.create("R2", "C1", "H1", "12/04/2026", "13/04/2026"))
+        self.assertTrue(
+            Reservation.create("R3", "C1", "H1", "15/04/2026", "16/04/2026"))
+        self.assertEqual(Reservation.get("R1").status, "activa")
+        self.assertTrue(Reservation.cancel("R1"))
+        self.assertEqual(Hotel.available_rooms("H1"), 0)
+        self.assertEqual(
+            Hotel.available_rooms_between("H1", "10/04/2026", "15/04/2026"),
+            1)
+        Hotel.modify("H1", rooms=5)
+        self.assertEqual(Hotel.get("H1").rooms, 5)
+        self.assertEqual(
+            [r.reservation_id for r in Reservation.find(
+                customer_id="C1", check_in_from="11/04/2026")], ["R3"])
+
+    def test_copiar_desde_json(self):
+        """Verifica que copy_store migra un documento JSON a SQLite."""
+        clean()
+        source = storage.DataStore(TEST_FILE)
+        source.put("hotels", "H2", {"hotel_id": "H2", "name": "B",
+                                    "location": "L", "rooms": 2})
+        storage.copy_store(source, storage.get_store(TEST_DB))
+        self.assertEqual(Hotel.get("H2").rooms, 2)
+        clean()
+
+
+class TestShardedStore(unittest.TestCase):
+    """Pruebas del almacén repartido en un archivo por hotel."""
+
+    def setUp(self):
+        """Crea dos hoteles con una reservación en el primero."""
+        self.clean_shards()
+        self.store = storage.ShardedStore(TEST_SHARDS)
+        for hotel_id in ("H1", "H2"):
+            self.store.put("hotels", hotel_id, {"hotel_id": hotel_id,
+                                                "rooms": 1})
+        self.store.put("customers", "C1", {"customer_id": "C1"})
+        self.store.put("reservations", "R1", {
+            "reservation_id": "R1", "hotel_id": "H1", "status": "activa"})
+        self.store.commit()
+
+    def tearDown(self):
+        """Elimina el directorio de prueba."""
+        self.clean_shards()
+
+    @staticmethod
+    def clean_shards():
+        """Elimina el directorio de shards y su candado."""
+        shutil.rmtree(TEST_SHARDS, ignore_errors=True)
+        if os.path.exists(TEST_SHARDS + ".lock"):
+            os.remove(TEST_SHARDS + ".lock")
+
+    def test_un_archivo_por_hotel(self):
+        """Verifica el manifiesto y que cada hotel tiene su archivo."""
+        names = [os.path.basename(p) for p in self.store.shard_paths()]
+        self.assertIn("hotel-H1.json", names)
+        self.assertIn("hotel-H2.json", names)
+        with open(os.path.join(TEST_SHARDS, "manifest.json"),
+                  encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["hotels"]["H2"], "hotel-H2.json")
+
+    def test_solo_se_reescribe_el_shard_afectado(self):
+        """Verifica que cambiar un hotel no reescribe los demás."""
+        untouched = os.path.join(TEST_SHARDS, "hotel-H1.json")
+        before = os.stat(untouched).st_mtime_ns
+        self.store.put("hotels", "H2", {"hotel_id": "H2", "rooms": 3})
+        self.store.commit()
+        self.assertEqual(os.stat(untouched).st_mtime_ns, before)
+        other = storage.ShardedStore(TEST_SHARDS)
+        self.assertEqual(other.get("hotels", "H2")["rooms"], 3)
+        self.assertEqual(other.get("reservations", "R1")["hotel_id"], "H1")
+        self.assertTrue(other.contains("customers", "C1"))
+
+    def test_solo_se_relee_el_shard_afectado(self):
+        """Verifica que otro proceso sólo vuelve a leer el shard cambiado."""
+        other = storage.ShardedStore(TEST_SHARDS)
+        self.assertTrue(other.contains("hotels", "H1"))
+        self.store.put("hotels", "H2", {"hotel_id": "H2", "rooms": 3})
+        self.store.remove("reservations", "R1")
+        self.store.commit()
+        with mock.patch("sharded_store.read_shard",
+                        wraps=sharded_store.read_shard) as reader:
+            self.assertEqual(other.get("hotels", "H2")["rooms"], 3)
+        self.assertEqual(
+            sorted(os.path.basename(call.args[0])
+                   for call in reader.call_args_list),
+            ["hotel-H1.json", "hotel-H2.json", "manifest.json"])
+        self.assertFalse(other.contains("reservations", "R1"))
+        self.assertTrue(other.contains("customers", "C1"))
+        self.assertEqual(other.get("hotels", "H1")["rooms"], 1)
+
+    def test_relectura_no_modifica_la_copia_anterior(self):
+        """Verifica que la relectura arma colecciones nuevas."""
+        other = storage.ShardedStore(TEST_SHARDS)
+        hotels = other.load()["hotels"]
+        self.store.put("hotels", "H2", {"hotel_id": "H2", "rooms": 3})
+        self.store.commit()
+        self.assertEqual(other.get("hotels", "H2")["rooms"], 3)
+        self.assertEqual(hotels["H2"]["rooms"], 1)
+
+    def test_shard_eliminado_al_leer(self):
+        """Verifica que un shard que desaparece antes de abrirlo se
+        trata como eliminado."""
+        other = storage.ShardedStore(TEST_SHARDS)
+        self.assertTrue(other.contains("hotels", "H2"))
+        self.store.put("hotels", "H2", {"hotel_id": "H2", "rooms": 3})
+        self.store.commit()
+        shard = os.path.join(TEST_SHARDS, "hotel-H2.json")
+        read_shard = sharded_store.read_shard
+
+        def read_after_delete(path):
+            if path == shard:
+                os.remove(shard)
+            return read_shard(path)
+
+        with mock.patch("sharded_store.read_shard",
+                        side_effect=read_after_delete):
+            self.assertFalse(other.contains("hotels", "H2"))
+        self.assertTrue(other.contains("hotels", "H1"))
+        self.assertTrue(other.contains("reservations", "R1"))
+
+    def test_bitacora_no_admitida(self):
+        """Verifica que pedir el modo bitácora da un error claro."""
+        with self.assertRaises(ValueError):
+            storage.configure_store(TEST_SHARDS, journal=True)
+        self.assertIsInstance(
+            storage.configure_store(TEST_SHARDS, journal=False),
+            storage.ShardedStore)
+        storage.close_store(TEST_SHARDS)
+
+    def test_backend_por_extension(self):
+        """Verifica que la extensión .shards selecciona este almacén."""
+        self.assertIsInstance(storage.get_store(TEST_SHARDS),
+                              storage.ShardedStore)
+        storage.close_store(TEST_SHARDS)
+
+
+class TestBinaryStore(unittest.TestCase):
+    """Pruebas del almacén con snapshot binario."""
+
+    def setUp(self):
+        """Crea un almacén binario con un hotel."""
+        self.clean_binary()
+        self.store = storage.BinaryStore(TEST_BIN)
+        self.store.put("hotels", "H1", {"hotel_id": "H1", "rooms": 2})
+        self.store.commit()
+
+    def tearDown(self):
+        """Elimina los archivos de prueba."""
+        self.store.wait()
+        self.clean_binary()
+
+    @staticmethod
+    def clean_binary():
+        """Elimina el snapshot, sus bitácoras y las exportaciones."""
+        clean()
+        for suffix in ("", ".journal", ".journal.old", ".tmp", ".lock"):
+            if os.path.exists(TEST_BIN + suffix):
+                os.remove(TEST_BIN + suffix)
+
+    def test_snapshot_no_es_json(self):
+        """Verifica que el archivo se guarda en formato binario."""
+        with open(TEST_BIN, "rb") as f:
+            self.assertEqual(f.read(1), b"\x80")
+        other = storage.BinaryStore(TEST_BIN)
+        self.assertEqual(other.get("hotels", "H1")["rooms"], 2)
+
+    def test_compactacion_escribe_binario(self):
+        """Verifica que la bitácora se compacta en formato binario."""
+        store = storage.BinaryStore(TEST_BIN, journal=True)
+        store.put("hotels", "H2", {"hotel_id": "H2", "rooms": 1})
+        store.commit()
+        store.compact()
+        other = storage.BinaryStore(TEST_BIN)
+        self.assertEqual(sorted(other.load()["hotels"]), ["H1", "H2"])
+
+    def test_archivo_corrupto(self):
+        """Verifica que un snapshot dañado se reporta y se ignora."""
+        with open(TEST_BIN, "wb") as f:
+            f.write(b"\x80\x05basura")
+        other = storage.BinaryStore(TEST_BIN)
+        self.assertEqual(other.load(), {"hotels": {}, "customers": {},
+                                        "reservations": {}})
+
+    def test_exportar_e_importar_json(self):
+        """Verifica la conversión en ambos sentidos."""
+        binary_store.export_json(TEST_BIN, TEST_FILE)
+        with open(TEST_FILE, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["hotels"]["H1"]["rooms"], 2)
+        os.remove(TEST_BIN)
+        binary_store.import_json(TEST_FILE, TEST_BIN)
+        self.assertTrue(storage.BinaryStore(TEST_BIN).contains("hotels",
+                                                               "H1"))
+
+    def test_backend_por_extension(self):
+        """Verifica que la extensión .bin selecciona este almacén."""
+        self.assertIsInstance(storage.get_store(TEST_BIN),
+                              storage.BinaryStore)
+        storage.close_store(TEST_BIN)
+
+
+if __name__ == "__main__":
+    unittest.main()